@@ -0,0 +1,143 @@
+###############################################
+# Batch command line tool, Inverse Kinematics UI
+# Solves robot kinematics without the UI
+# Usage: python batch.py ik robot.csv targets.csv -o results.csv
+###############################################
+
+import argparse
+import sys
+import time
+from src.robotModel import SOLVERS
+from src.calibration import ITERATIONS
+from src.tolerance import TOLERANCE_A, TOLERANCE_D, TOLERANCE_ALPHA, MAX_SAMPLES, BATCH_SIZE, PRECISION
+
+# Batch inverse kinematics
+def runIK(args):
+    from src.robotModel import parseDHTable
+    from src.robotLibrary import readRobot
+    from src.batchIK import readTargets, solveBatch, writeResults
+    dh_params = parseDHTable(readRobot(args.robot, args.name))
+    q0 = args.q0 if args.q0 else None
+    chunks = readTargets(args.targets, args.chunk_size, args.delimiter)
+    start = time.perf_counter()
+    if args.workers > 1:
+        # Solve chunks in worker processes
+        from src.parallelIK import ParallelSolver
+        with ParallelSolver(dh_params, args.solver, q0, not args.no_limits, args.workers) as solver:
+            total, solved = writeResults(args.output, solver.solve(chunks), len(dh_params))
+    else:
+        results = solveBatch(dh_params, chunks, args.solver, q0, not args.no_limits)
+        total, solved = writeResults(args.output, results, len(dh_params))
+    duration = time.perf_counter() - start
+    print(f"{total} Ziele, {solved} gelöst, {duration:.2f} s ({total/max(duration, 1e-9):.0f} Ziele/s)")
+
+# Path inverse kinematics with warm starts
+def runPath(args):
+    from src.robotModel import createRobot, parseDHTable
+    from src.robotLibrary import readRobot
+    from src.batchIK import readTargets, writeResults
+    from src.pathIK import solvePath
+    dh_params = parseDHTable(readRobot(args.robot, args.name))
+    chunks = readTargets(args.targets, args.chunk_size, args.delimiter)
+    results = solvePath(createRobot(dh_params), chunks, args.solver, args.q0, not args.no_limits, args.max_jump)
+    start = time.perf_counter()
+    total, solved = writeResults(args.output, results, len(dh_params), with_jumps=True)
+    duration = time.perf_counter() - start
+    print(f"{total} Pfadpunkte, {solved} gelöst, {duration:.2f} s ({total/max(duration, 1e-9):.0f} Punkte/s)")
+
+# Monte Carlo tolerance analysis of the DH parameters at given joint positions
+def runTolerance(args):
+    from src.robotModel import parseDHTable
+    from src.robotLibrary import readRobot
+    from src.kinematics import DHChain
+    from src.tolerance import analyseTolerances, readJointPositions, writeToleranceResults
+    chain = DHChain.fromDHParams(parseDHTable(readRobot(args.robot, args.name)))
+    indices, Q = readJointPositions(args.positions, chain.n)
+    start = time.perf_counter()
+    results = []
+    # Results are printed after every batch
+    for results in analyseTolerances(chain, Q, (args.tolerance_a, args.tolerance_d, args.tolerance_alpha), args.samples, args.batch_size, args.precision, args.seed):
+        done = sum(result.converged for result in results)
+        worst = max(result.statistics()["position"]["p95"] for result in results)
+        print(f"{max(result.count for result in results)} Stichproben, {done}/{len(results)} konvergiert, Positionsfehler p95 max. {worst*1e3:.4f} mm", flush=True)
+    writeToleranceResults(args.output, indices, results)
+    duration = time.perf_counter() - start
+    samples = sum(result.count for result in results)
+    print(f"{len(results)} Positionen, {samples} Stichproben, {duration:.2f} s ({samples/max(duration, 1e-9):.0f} Stichproben/s)")
+
+# Calibration of the DH table from measured poses
+def runCalibrate(args):
+    from src.robotModel import parseDHTable, writeDHFile
+    from src.robotLibrary import readRobot
+    from src.kinematics import DHChain
+    from src.calibration import calibrate, readMeasurements
+    dh_params = parseDHTable(readRobot(args.robot, args.name))
+    chain = DHChain.fromDHParams(dh_params)
+    Q, poses = readMeasurements(args.measurements, chain.n, args.delimiter)
+    start = time.perf_counter()
+    result = calibrate(chain, Q, poses, args.iterations, progress=lambda iteration, cost: print(f"Iteration {iteration}, Kosten {cost:.6g}", flush=True))
+    duration = time.perf_counter() - start
+    names = {"position": "Position (m)", "orientation": "Orientierung (rad)"}
+    for label, statistics in [("Vorher", result.before), ("Nachher", result.after)]:
+        print(label + ": " + ", ".join(f"{names[name]} RMS {values['rms']:.6g}, max. {values['max']:.6g}" for name, values in statistics.items()))
+    print(f"{len(Q)} Messungen, {result.iterations} Iterationen, {result.rank} von {len(result.deviations)} Parametern identifizierbar, {duration:.2f} s")
+    writeDHFile(args.output, result.dhRows(dh_params))
+
+# Creates the argument parser
+def createParser():
+    parser = argparse.ArgumentParser(description="Inverse Kinematik ohne Benutzeroberfläche")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ik = commands.add_parser("ik", help="Inverse Kinematik für viele Zielpositionen")
+    ik.add_argument("robot", help="Roboter (.csv, .json, .npz oder Ordner, Format wie Export)")
+    ik.add_argument("--name", help="Name des Roboters in Dateien mit mehreren Robotern")
+    ik.add_argument("targets", help="Zielpositionen X, Y, Z, A, B, C (.csv oder .npy)")
+    ik.add_argument("-o", "--output", required=True, help="Ergebnisdatei (.csv)")
+    ik.add_argument("--solver", default="IK_LM", choices=SOLVERS)
+    ik.add_argument("--no-limits", action="store_true", help="Gelenkgrenzen ignorieren")
+    ik.add_argument("--q0", type=float, nargs="+", help="Startposition")
+    ik.add_argument("--chunk-size", type=int, default=1024)
+    ik.add_argument("--workers", type=int, default=1, help="Anzahl paralleler Prozesse")
+    ik.add_argument("--delimiter", default=",", help="Trennzeichen der Ziel-CSV")
+    ik.set_defaults(func=runIK)
+
+    path = commands.add_parser("path", help="Inverse Kinematik für einen Pfad (jede Lösung startet bei der vorherigen)")
+    path.add_argument("robot", help="Roboter (.csv, .json, .npz oder Ordner, Format wie Export)")
+    path.add_argument("--name", help="Name des Roboters in Dateien mit mehreren Robotern")
+    path.add_argument("targets", help="Pfadpunkte X, Y, Z, A, B, C in Reihenfolge (.csv oder .npy)")
+    path.add_argument("-o", "--output", required=True, help="Ergebnisdatei (.csv)")
+    path.add_argument("--solver", default="IK_LM", choices=SOLVERS)
+    path.add_argument("--no-limits", action="store_true", help="Gelenkgrenzen ignorieren")
+    path.add_argument("--q0", type=float, nargs="+", help="Startposition")
+    path.add_argument("--max-jump", type=float, default=0.5, help="Maximale Gelenkänderung zwischen zwei Punkten")
+    path.add_argument("--chunk-size", type=int, default=1024)
+    path.add_argument("--delimiter", default=",", help="Trennzeichen der Ziel-CSV")
+    path.set_defaults(func=runPath)
+
+    tolerance = commands.add_parser("tolerance", help="Monte-Carlo-Toleranzanalyse der DH-Parameter a, d und alpha")
+    tolerance.add_argument("robot", help="Roboter (.csv, .json, .npz oder Ordner, Format wie Export)")
+    tolerance.add_argument("--name", help="Name des Roboters in Dateien mit mehreren Robotern")
+    tolerance.add_argument("positions", help="Gelenkpositionen (.csv, Ergebnisdatei von 'ik' oder Zeilen q1 ... qn)")
+    tolerance.add_argument("-o", "--output", required=True, help="Ergebnisdatei (.csv)")
+    tolerance.add_argument("--tolerance-a", type=float, default=TOLERANCE_A, help="Toleranz ± von a in m")
+    tolerance.add_argument("--tolerance-d", type=float, default=TOLERANCE_D, help="Toleranz ± von d in m")
+    tolerance.add_argument("--tolerance-alpha", type=float, default=TOLERANCE_ALPHA, help="Toleranz ± von alpha in rad")
+    tolerance.add_argument("--samples", type=int, default=MAX_SAMPLES, help="Maximale Anzahl Stichproben pro Position")
+    tolerance.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    tolerance.add_argument("--precision", type=float, default=PRECISION, help="Abbruch bei relativer Genauigkeit (95 %% Konfidenz), 0 = alle Stichproben")
+    tolerance.add_argument("--seed", type=int)
+    tolerance.set_defaults(func=runTolerance)
+
+    calibration = commands.add_parser("calibrate", help="Kalibrierung der DH-Parameter aus gemessenen Posen")
+    calibration.add_argument("robot", help="Nominaler Roboter (.csv, .json, .npz oder Ordner, Format wie Export)")
+    calibration.add_argument("--name", help="Name des Roboters in Dateien mit mehreren Robotern")
+    calibration.add_argument("measurements", help="Messungen q1 ... qn, X, Y, Z[, A, B, C] (.csv)")
+    calibration.add_argument("-o", "--output", required=True, help="Kalibrierte DH-Tabelle (.csv, Format wie Export)")
+    calibration.add_argument("--iterations", type=int, default=ITERATIONS, help="Maximale Anzahl Iterationen")
+    calibration.add_argument("--delimiter", default=",", help="Trennzeichen der Mess-CSV")
+    calibration.set_defaults(func=runCalibrate)
+    return parser
+
+if __name__ == "__main__":
+    args = createParser().parse_args()
+    sys.exit(args.func(args))
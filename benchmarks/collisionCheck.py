@@ -0,0 +1,78 @@
+###############################################
+# Collision check benchmark, Inverse Kinematics UI
+# Checks long joint trajectories and candidate sets with and without the broad phase
+# Usage: python benchmarks/collisionCheck.py [--samples 10000 --robot UR5 --obstacles obstacles.csv]
+###############################################
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.presets import PresetRegistry
+from src.robotModel import parseDHTable, readDHFile, createRobot
+from src.kinematics import DHChain
+from src.trajectory import jointTrajectory
+from src.collision import CollisionModel, Box, segmentsIntersectBoxes, readObstacles
+
+# Exact test of every capsule pair and capsule-box combination (no broad phase)
+def checkAll(model, Q):
+    P = model.points(Q)
+    count, pairs = len(Q), len(model.pairs)
+    distances = model._pairDistances(P, np.repeat(np.arange(count), pairs), np.tile(np.arange(pairs), count)).reshape(count, pairs)
+    colliding = np.any(distances < 2 * model.radius, axis=1)
+    A, B = P[:, model.segments[:, 0]].reshape(-1, 3), P[:, model.segments[:, 1]].reshape(-1, 3)
+    for box in model.obstacles:
+        lower, upper = np.broadcast_to(box.lower - model.radius, A.shape), np.broadcast_to(box.upper + model.radius, A.shape)
+        colliding |= np.any(segmentsIntersectBoxes(A, B, lower, upper).reshape(count, -1), axis=1)
+    return colliding
+
+def main():
+    parser = argparse.ArgumentParser(description="Collision check benchmark")
+    parser.add_argument("--samples", type=int, default=10000, help="Bahnpunkte pro Trajektorie")
+    parser.add_argument("--trajectories", type=int, default=20)
+    parser.add_argument("--candidates", type=int, default=32, help="Größe der Kandidatenmenge (Multi-Start)")
+    parser.add_argument("--robot", default="UR5", help="Preset oder DH-Tabelle (.csv)")
+    parser.add_argument("--obstacles", help="Hindernisse (.csv), sonst zwei Beispielboxen")
+    args = parser.parse_args()
+
+    if args.robot.endswith(".csv"):
+        robot = createRobot(parseDHTable(readDHFile(os.path.join(ROOT, args.robot))))
+    else:
+        robot = PresetRegistry().getDH(args.robot)
+    chain = DHChain.fromRobot(robot)
+    obstacles = readObstacles(args.obstacles) if args.obstacles else [Box([0.3, -0.4, -0.2], [0.8, 0.4, 0.0], "Tisch"), Box([-0.6, 0.4, -0.2], [0.6, 0.5, 1.0], "Wand")]
+    start = time.perf_counter()
+    model = CollisionModel(chain, obstacles=obstacles)
+    build_time = time.perf_counter() - start
+    rng = np.random.default_rng(0)
+    trajectories = [jointTrajectory(rng.uniform(-2, 2, chain.n), rng.uniform(-2, 2, chain.n), steps=args.samples) for _ in range(args.trajectories)]
+
+    # Warm up the buffers
+    model.checkTrajectory(trajectories[0])
+    start = time.perf_counter()
+    results = [model.checkTrajectory(trajectory) for trajectory in trajectories]
+    check_time = (time.perf_counter() - start) / args.trajectories
+    start = time.perf_counter()
+    reference = [checkAll(model, trajectory.q) for trajectory in trajectories]
+    all_time = (time.perf_counter() - start) / args.trajectories
+    start = time.perf_counter()
+    for trajectory in trajectories: chain.frames(trajectory.q)
+    frames_time = (time.perf_counter() - start) / args.trajectories
+    mismatches = sum(int(np.count_nonzero(result.colliding != colliding)) for result, colliding in zip(results, reference))
+
+    candidates = rng.uniform(chain.qlim[0], chain.qlim[1], (args.candidates, chain.n))
+    start = time.perf_counter()
+    for _ in range(100): model.check(candidates)
+    candidate_time = (time.perf_counter() - start) / 100
+
+    print(f"Modell: {len(model.segments)} Kapseln, {len(model.pairs)} Paare, {len(obstacles)} Hindernisse, {build_time*1e3:.1f} ms")
+    print(f"Trajektorie ({args.samples} Punkte): {check_time*1e3:.1f} ms mit Broad Phase, {all_time*1e3:.1f} ms ohne ({all_time/check_time:.1f}x), davon Vorwärtskinematik {frames_time*1e3:.1f} ms")
+    print(f"Kollidierende Punkte: {sum(int(np.count_nonzero(result.colliding)) for result in results)} von {args.samples * args.trajectories}, Abweichungen zur vollständigen Prüfung: {mismatches}")
+    print(f"Kandidatenmenge ({args.candidates} Lösungen): {candidate_time*1e3:.2f} ms")
+
+if __name__ == "__main__":
+    main()
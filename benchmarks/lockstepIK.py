@@ -0,0 +1,54 @@
+###############################################
+# Lock-step IK benchmark, Inverse Kinematics UI
+# Compares IK_LM per target with the vectorized lock-step solver for different chunk sizes
+# Usage: python benchmarks/lockstepIK.py [--targets 5000] [--chunk-sizes 1 16 256 1024]
+###############################################
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.robotModel import createRobot, parseDHTable, readDHFile
+from src.kinematics import DHChain
+from src.batchIK import solveChunk
+from src.vectorIK import VECTOR_SOLVER
+
+# Creates reachable targets from random joint positions
+def sampleTargets(dh_params, count, seed=0):
+    chain = DHChain.fromDHParams(dh_params)
+    q = np.random.default_rng(seed).uniform(chain.qlim[0], chain.qlim[1], (count, chain.n))
+    return chain.fkineXYZABC(q).copy()
+
+# Solves all targets chunk by chunk, returns poses per second and success rate
+def run(robot, targets, solver, chunk_size, joint_limits):
+    start = time.perf_counter()
+    success = 0
+    for i in range(0, len(targets), chunk_size):
+        success += int(np.count_nonzero(solveChunk(robot, targets[i:i+chunk_size], solver, None, joint_limits).success))
+    return len(targets) / (time.perf_counter() - start), success / len(targets)
+
+def main():
+    parser = argparse.ArgumentParser(description="Lock-step IK benchmark")
+    parser.add_argument("--robot", default="examples/Beispiel_6-Achs-Knickarmroboter.csv")
+    parser.add_argument("--targets", type=int, default=5000)
+    parser.add_argument("--loop-targets", type=int, default=500, help="Ziele für IK_LM")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1, 16, 256, 1024])
+    parser.add_argument("--no-limits", action="store_true")
+    args = parser.parse_args()
+
+    dh_params = parseDHTable(readDHFile(args.robot))
+    robot = createRobot(dh_params)
+    targets = sampleTargets(dh_params, args.targets)
+    joint_limits = not args.no_limits
+
+    rate, success = run(robot, targets[:args.loop_targets], "IK_LM", 1, joint_limits)
+    print(f"IK_LM pro Ziel: {rate:.0f} Posen/s, Erfolg {success*100:.1f} %")
+    for chunk_size in args.chunk_sizes:
+        rate_vector, success = run(robot, targets, VECTOR_SOLVER, chunk_size, joint_limits)
+        print(f"{VECTOR_SOLVER}, {chunk_size} Ziele pro Block: {rate_vector:.0f} Posen/s ({rate_vector/rate:.1f}x), Erfolg {success*100:.1f} %")
+
+if __name__ == "__main__":
+    main()
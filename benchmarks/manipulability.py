@@ -0,0 +1,50 @@
+###############################################
+# Manipulability benchmark, Inverse Kinematics UI
+# Compares the batched Jacobian/manipulability map with toolbox calls per joint position
+# Usage: python benchmarks/manipulability.py [--count 10000 --robot UR5]
+###############################################
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.presets import PresetRegistry
+from src.robotModel import parseDHTable, readDHFile, createRobot
+from src.kinematics import DHChain
+from src.manipulability import manipulabilityMap
+
+def main():
+    parser = argparse.ArgumentParser(description="Manipulability benchmark")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--loop-count", type=int, default=500, help="Positionen für die Toolbox-Schleife")
+    parser.add_argument("--robot", default="UR5", help="Preset oder DH-Tabelle (.csv)")
+    args = parser.parse_args()
+
+    if args.robot.endswith(".csv"):
+        robot = createRobot(parseDHTable(readDHFile(os.path.join(ROOT, args.robot))))
+    else:
+        robot = PresetRegistry().getDH(args.robot)
+    chain = DHChain.fromRobot(robot)
+    Q = np.random.default_rng(0).uniform(chain.qlim[0], chain.qlim[1], (args.count, chain.n))
+
+    # Toolbox: one Jacobian, manipulability and condition number per position
+    start = time.perf_counter()
+    loop = [(robot.manipulability(q), np.linalg.cond(robot.jacob0(q))) for q in Q[:args.loop_count]]
+    loop_time = (time.perf_counter() - start) / args.loop_count
+
+    start = time.perf_counter()
+    result = manipulabilityMap(chain, Q)
+    batch_time = (time.perf_counter() - start) / args.count
+
+    error = max(abs(result.manipulability[i] - m) for i, (m, _) in enumerate(loop))
+    print(f"Toolbox-Schleife: {loop_time*1e6:.1f} µs/Position ({args.loop_count} Positionen)")
+    print(f"Batch: {batch_time*1e6:.2f} µs/Position ({args.count} Positionen, {loop_time/batch_time:.0f}x)")
+    print(f"Max. Abweichung Manipulierbarkeit: {error:.2e}")
+    print(f"Nahe Singularität: {np.count_nonzero(result.singular)} von {len(result)}")
+
+if __name__ == "__main__":
+    main()
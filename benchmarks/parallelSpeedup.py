@@ -0,0 +1,57 @@
+###############################################
+# Parallel IK benchmark, Inverse Kinematics UI
+# Measures the speedup of ParallelSolver over the serial batch solver
+# Usage: python benchmarks/parallelSpeedup.py [--targets 2000] [--workers 1 2 4 8]
+###############################################
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.robotModel import createRobot, parseDHTable, readDHFile
+from src.kinematics import DHChain
+from src.batchIK import solveBatch
+from src.parallelIK import ParallelSolver
+
+# Creates reachable targets from random joint positions
+def sampleTargets(dh_params, count, seed=0):
+    chain = DHChain.fromDHParams(dh_params)
+    q = np.random.default_rng(seed).uniform(chain.qlim[0], chain.qlim[1], (count, chain.n))
+    return chain.fkineXYZABC(q).copy()
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel IK benchmark")
+    parser.add_argument("--robot", default="examples/Beispiel_6-Achs-Knickarmroboter.csv")
+    parser.add_argument("--targets", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, os.cpu_count()])
+    args = parser.parse_args()
+
+    dh_params = parseDHTable(readDHFile(args.robot))
+    targets = sampleTargets(dh_params, args.targets)
+    chunks = [targets[i:i+args.chunk_size] for i in range(0, len(targets), args.chunk_size)]
+
+    # Warm up (toolbox import)
+    createRobot(dh_params)
+    start = time.perf_counter()
+    for _ in solveBatch(dh_params, chunks): pass
+    serial = time.perf_counter() - start
+    print(f"CPUs: {os.cpu_count()}, targets: {args.targets}")
+    print(f"serial:     {serial:7.2f} s  {args.targets/serial:8.0f} targets/s")
+
+    for workers in sorted(set(args.workers)):
+        # Worker start-up (process start, toolbox import, robot) is measured separately from solving
+        start = time.perf_counter()
+        with ParallelSolver(dh_params, workers=workers) as solver:
+            solver.warmUp()
+            startup = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in solver.solve(chunks): pass
+            duration = time.perf_counter() - start
+        print(f"{workers:3d} worker: {duration:7.2f} s  {args.targets/duration:8.0f} targets/s  speedup {serial/duration:5.2f}  (start-up {startup:.2f} s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+###############################################
+# Input parser benchmark, Inverse Kinematics UI
+# Compares parseInputString with the former eval based version
+# Usage: python benchmarks/parseInput.py [--count 1000000]
+###############################################
+
+import argparse
+import os
+import random
+import sys
+import time
+from math import pi
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.helpers import parseInputString
+
+# Former implementation (UI version 0.6)
+def parseInputStringEval(value):
+    if value=="": value="0"
+    value = value.replace(",", ".")
+    return float(eval(value))
+
+# Mixed inputs as they appear in DH tables and positions
+def createInputs(count, distinct, seed=0):
+    rng = random.Random(seed)
+    templates = ["{a}", "-{a}", "pi/{i}", "-pi/{i}", "{i}*pi/{j}", "({a}+{b})*{i}", "{i},{k}", "{a}**2", "-pi", "+pi", ""]
+    pool = []
+    for _ in range(distinct):
+        template = rng.choice(templates)
+        pool.append(template.format(a=round(rng.uniform(0, 2), 4), b=round(rng.uniform(0, 1), 3), i=rng.randint(1, 8), j=rng.randint(1, 8), k=rng.randint(0, 999)))
+    return [rng.choice(pool) for _ in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Input parser benchmark")
+    parser.add_argument("--count", type=int, default=1000000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    args = parser.parse_args()
+
+    inputs = createInputs(args.count, args.distinct)
+    start = time.perf_counter()
+    expected = [parseInputStringEval(value) for value in inputs]
+    eval_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = [parseInputString(value) for value in inputs]
+    parser_time = time.perf_counter() - start
+
+    assert all(abs(a - b) < 1e-12 for a, b in zip(expected, results))
+    print(f"{args.count} Eingaben ({args.distinct} verschiedene)")
+    print(f"eval:   {eval_time:6.2f} s  {eval_time/args.count*1e6:6.2f} µs/Eingabe")
+    print(f"Parser: {parser_time:6.2f} s  {parser_time/args.count*1e6:6.2f} µs/Eingabe  ({eval_time/parser_time:.0f}x schneller)")
+
+if __name__ == "__main__":
+    main()
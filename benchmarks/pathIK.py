@@ -0,0 +1,50 @@
+###############################################
+# Path IK benchmark, Inverse Kinematics UI
+# Compares warm-started path solving with solving every pose from the same start
+# Usage: python benchmarks/pathIK.py [--points 1000]
+###############################################
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.robotModel import SOLVERS, createRobot, parseDHTable, readDHFile
+from src.batchIK import solveChunk
+from src.pathIK import solvePathArray
+
+# Welding seam: circle with rising height and constant tool orientation
+def createSeam(points):
+    s = np.linspace(0, 1, points)
+    targets = np.zeros((points, 6))
+    targets[:, 0] = 0.8 + 0.2*np.cos(2*np.pi*s)
+    targets[:, 1] = 0.3*np.sin(2*np.pi*s)
+    targets[:, 2] = 0.3 + 0.2*s
+    targets[:, 3] = np.pi
+    targets[:, 4] = 0.2
+    return targets
+
+def main():
+    parser = argparse.ArgumentParser(description="Path IK benchmark")
+    parser.add_argument("--robot", default="examples/Beispiel_6-Achs-Knickarmroboter.csv")
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--q0", type=float, nargs="+", default=[0, -0.5, 0.5, 0, 0.5, 0])
+    args = parser.parse_args()
+
+    robot = createRobot(parseDHTable(readDHFile(args.robot)))
+    targets = createSeam(args.points)
+    print(f"{'Solver':14s} {'Modus':6s} {'Erfolg':>7s} {'Iter./Punkt':>12s} {'Sprünge':>8s} {'Zeit':>8s}")
+    for solver in SOLVERS:
+        start = time.perf_counter()
+        cold = solveChunk(robot, targets, solver, args.q0)
+        cold_time = time.perf_counter() - start
+        start = time.perf_counter()
+        warm = solvePathArray(robot, targets, solver, args.q0)
+        warm_time = time.perf_counter() - start
+        print(f"{solver:14s} {'kalt':6s} {cold.success.mean():7.1%} {cold.iterations.mean():12.2f} {'-':>8s} {cold_time:7.2f}s")
+        print(f"{solver:14s} {'Pfad':6s} {warm.success.mean():7.1%} {warm.iterations.mean():12.2f} {int(warm.jumps.sum()):8d} {warm_time:7.2f}s")
+
+if __name__ == "__main__":
+    main()
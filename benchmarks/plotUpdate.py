@@ -0,0 +1,63 @@
+###############################################
+# Plot benchmark, Inverse Kinematics UI
+# Compares toolbox plots with the reused plot window (blitted frames) on the Agg backend
+# Usage: python benchmarks/plotUpdate.py [--samples 5000 --frames 50]
+###############################################
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.robotModel import parseDHTable, readDHFile, createRobot
+from src.kinematics import DHChain
+from src.robotPlot import RobotPlot, MAX_FRAMES
+
+# Plot window without Tk (canvas of the Agg backend)
+class AggRobotPlot(RobotPlot):
+    def open(self):
+        self.figure = Figure(figsize=(6, 6), dpi=100)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.createArtists()
+        self.canvas.draw()
+
+    def play(self): pass
+
+def main():
+    parser = argparse.ArgumentParser(description="Plot benchmark")
+    parser.add_argument("--robot", default="examples/Beispiel_6-Achs-Knickarmroboter.csv")
+    parser.add_argument("--samples", type=int, default=5000, help="Punkte der Trajektorie")
+    parser.add_argument("--frames", type=int, default=50, help="Frames für den Toolbox-Plot")
+    args = parser.parse_args()
+
+    dh_params = parseDHTable(readDHFile(os.path.join(ROOT, args.robot)))
+    chain = DHChain.fromDHParams(dh_params)
+    q = np.linspace(chain.qlim[0] / 2, chain.qlim[1] / 2, args.samples)
+
+    robot = createRobot(dh_params)
+    start = time.perf_counter()
+    robot.plot(q[0], block=False)
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    robot.plot(q[np.linspace(0, len(q) - 1, args.frames).astype(int)], block=False, dt=0.001)
+    frames = (time.perf_counter() - start) / args.frames
+    print(f"Toolbox: {single*1000:.0f} ms pro Plot, {frames*1000:.1f} ms pro Frame")
+
+    plot = AggRobotPlot(None)
+    start = time.perf_counter()
+    plot.show(chain, q)
+    shown = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(MAX_FRAMES): plot.showFrame(i)
+    frame = (time.perf_counter() - start) / MAX_FRAMES
+    print(f"Plotfenster: {shown*1000:.0f} ms für {args.samples} Punkte ({MAX_FRAMES} Frames), {frame*1000:.2f} ms pro Frame")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+###############################################
+# IK server load test, Inverse Kinematics UI
+# Sends concurrent IK/FK/batch requests to a local IK server and reports throughput and latency
+# Usage: python benchmarks/serverLoad.py --start --workers 2 [--requests 2000 --concurrency 16]
+###############################################
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.robotModel import parseDHTable, readDHFile
+from src.kinematics import DHChain
+
+# Keep-alive HTTP connection to the server
+class Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host, port, unix_path=None):
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    # Sends a request, returns status and JSON response
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write((method + " " + path + " HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: " + str(len(body)) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""): break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length": length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    def close(self):
+        self.writer.close()
+
+# Reachable targets of a DH table (FK of random joint positions)
+def sampleTargets(rows, count, seed=0):
+    chain = DHChain.fromDHParams(parseDHTable(rows))
+    q = np.random.default_rng(seed).uniform(chain.qlim[0], chain.qlim[1], (count, chain.n))
+    return chain.fkineXYZABC(q).copy(), q
+
+# Runs the requests on several connections
+async def runLoad(args, payloads, path):
+    latencies = []
+    server_times = []
+    failed = 0
+    queue = asyncio.Queue()
+    for payload in payloads: queue.put_nowait(payload)
+
+    async def client():
+        nonlocal failed
+        connection = await Connection.open(args.host, args.port, args.unix)
+        try:
+            while not queue.empty():
+                payload = queue.get_nowait()
+                start = time.perf_counter()
+                status, response = await connection.request("POST", path, payload)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if status != 200:
+                    failed += 1
+                    continue
+                server_times.append(response["timing"]["solve_ms"])
+        finally:
+            connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(args.concurrency)])
+    return time.perf_counter() - start, np.array(latencies), np.array(server_times), failed
+
+async def main(args):
+    # Upload the robot once, requests use its key
+    connection = await Connection.open(args.host, args.port, args.unix)
+    rows = readDHFile(os.path.join(ROOT, args.robot))
+    _, response = await connection.request("POST", "/robots", {"dh": rows})
+    connection.close()
+    robot = response["robot"]
+    targets, q = sampleTargets(rows, args.requests)
+    if args.kind == "ik":
+        payloads = [{"robot": robot, "target": target.tolist(), "solver": args.solver} for target in targets]
+    elif args.kind == "fk":
+        payloads = [{"robot": robot, "q": values.tolist()} for values in q]
+    else:
+        batches = np.array_split(targets, max(1, args.requests // args.batch_size))
+        payloads = [{"robot": robot, "targets": batch.tolist(), "solver": args.solver} for batch in batches]
+    # Warm up (robot models are built in the workers on first use)
+    await runLoad(args, payloads[:args.concurrency], "/" + args.kind)
+    duration, latencies, server_times, failed = await runLoad(args, payloads, "/" + args.kind)
+    print(f"{len(payloads)} Anfragen ({args.kind}), {args.concurrency} Verbindungen, {failed} Fehler")
+    print(f"Durchsatz: {len(payloads)/duration:.0f} Anfragen/s ({duration:.2f} s)")
+    print(f"Latenz [ms]: p50 {np.percentile(latencies, 50):.2f}, p95 {np.percentile(latencies, 95):.2f}, p99 {np.percentile(latencies, 99):.2f}")
+    if len(server_times):
+        print(f"Solver im Server [ms]: Mittel {server_times.mean():.2f}")
+
+# Starts a server process and waits until it accepts connections
+def startServer(args):
+    command = [sys.executable, os.path.join(ROOT, "server.py"), "--workers", str(args.workers), "--presets"]
+    command += ["--unix", args.unix] if args.unix else ["--port", str(args.port)]
+    process = subprocess.Popen(command, cwd=ROOT)
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            async def health():
+                connection = await Connection.open(args.host, args.port, args.unix)
+                await connection.request("GET", "/health")
+                connection.close()
+            asyncio.run(health())
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Server did not start")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IK server load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Unix-Socket statt TCP")
+    parser.add_argument("--start", action="store_true", help="Server für den Test starten")
+    parser.add_argument("--workers", type=int, default=1, help="Worker-Prozesse des gestarteten Servers")
+    parser.add_argument("--robot", default="examples/Beispiel_6-Achs-Knickarmroboter.csv")
+    parser.add_argument("--kind", default="ik", choices=["ik", "fk", "batch"])
+    parser.add_argument("--solver", default="IK_LM")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    process = startServer(args) if args.start else None
+    try:
+        asyncio.run(main(args))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
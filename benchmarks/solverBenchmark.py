@@ -0,0 +1,117 @@
+###############################################
+# IK solver benchmark, Inverse Kinematics UI
+# Runs every solver on all presets and example robots
+# Usage: python benchmarks/solverBenchmark.py [--targets 200] [--json out.json] [--csv out.csv] [--baseline base.json]
+###############################################
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.presets import PRESET_LABELS, PresetRegistry
+from src.robotModel import SOLVERS, createRobot, parseDHTable, readDHFile, solveIK
+from src.kinematics import DHChain
+
+# Allowed deviation from the baseline before a result counts as regression
+THROUGHPUT_TOLERANCE = 0.2
+SUCCESS_TOLERANCE = 0.02
+
+# Returns all benchmark robots as (name, robot)
+def loadRobots():
+    presets = PresetRegistry()
+    robots = [(label, presets.getDH(label)) for label in PRESET_LABELS if label != "-"]
+    for file_path in sorted(glob.glob(os.path.join(ROOT, "examples", "*.csv"))):
+        robots.append((os.path.basename(file_path), createRobot(parseDHTable(readDHFile(file_path)))))
+    return robots
+
+# Creates reachable targets from random joint positions within the limits
+def sampleTargets(robot, count, rng):
+    q = rng.uniform(robot.qlim[0], robot.qlim[1], (count, robot.n))
+    return list(DHChain.fromRobot(robot).fkine(q).copy())
+
+# Runs one solver on all targets
+def runCase(robot, solver, targets, joint_limits):
+    q0 = np.zeros(robot.n)
+    latencies, success, iterations, residuals = [], [], [], []
+    # Warm up (builds cached solver data)
+    solveIK(robot, solver, targets[0], q0, joint_limits)
+    start = time.perf_counter()
+    for target in targets:
+        t = time.perf_counter()
+        result = solveIK(robot, solver, target, q0, joint_limits)
+        latencies.append(time.perf_counter() - t)
+        success.append(bool(result.success))
+        iterations.append(result.iterations)
+        residuals.append(result.residual)
+    duration = time.perf_counter() - start
+    latencies = np.array(latencies) * 1000
+    return {
+        "throughput": len(targets) / duration,
+        "latency_p50_ms": float(np.percentile(latencies, 50)),
+        "latency_p90_ms": float(np.percentile(latencies, 90)),
+        "latency_p99_ms": float(np.percentile(latencies, 99)),
+        "success_rate": float(np.mean(success)),
+        "iterations_mean": float(np.mean(iterations)),
+        "residual_mean": float(np.mean(residuals)),
+        "residual_max": float(np.max(residuals)),
+    }
+
+# Compares results with a saved baseline, returns the regressions
+def compareBaseline(results, baseline):
+    reference = {(r["robot"], r["solver"], r["joint_limits"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        base = reference.get((result["robot"], result["solver"], result["joint_limits"]))
+        if base is None: continue
+        name = f"{result['robot']} {result['solver']} limits={result['joint_limits']}"
+        if result["throughput"] < base["throughput"] * (1 - THROUGHPUT_TOLERANCE):
+            regressions.append(f"{name}: throughput {result['throughput']:.0f}/s < baseline {base['throughput']:.0f}/s")
+        if result["success_rate"] < base["success_rate"] - SUCCESS_TOLERANCE:
+            regressions.append(f"{name}: success rate {result['success_rate']:.1%} < baseline {base['success_rate']:.1%}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="IK solver benchmark")
+    parser.add_argument("--targets", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--solvers", nargs="+", default=SOLVERS, choices=SOLVERS)
+    parser.add_argument("--json", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--csv", help="Ergebnisse als CSV speichern")
+    parser.add_argument("--baseline", help="Mit gespeicherten JSON-Ergebnissen vergleichen")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'Robot':36s} {'Solver':14s} {'Limits':6s} {'Posen/s':>8s} {'p50 ms':>7s} {'p99 ms':>7s} {'Erfolg':>7s} {'Iter.':>6s}")
+    for name, robot in loadRobots():
+        targets = sampleTargets(robot, args.targets, np.random.default_rng(args.seed))
+        for solver in args.solvers:
+            for joint_limits in (True, False):
+                result = {"robot": name, "solver": solver, "joint_limits": joint_limits, "targets": args.targets}
+                result.update(runCase(robot, solver, targets, joint_limits))
+                results.append(result)
+                print(f"{name:36s} {solver:14s} {str(joint_limits):6s} {result['throughput']:8.0f} {result['latency_p50_ms']:7.2f} {result['latency_p99_ms']:7.2f} {result['success_rate']:7.1%} {result['iterations_mean']:6.1f}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.csv:
+        import csv
+        with open(args.csv, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compareBaseline(results, json.load(file))
+        for regression in regressions: print("REGRESSION:", regression)
+        if regressions: sys.exit(1)
+        print("Keine Regressionen gegenüber", args.baseline)
+
+if __name__ == "__main__":
+    main()
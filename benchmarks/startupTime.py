@@ -0,0 +1,69 @@
+###############################################
+# Startup time benchmark, Inverse Kinematics UI
+# Compares eager preset construction (UI version 0.6)
+# with the lazy preset registry
+# Usage: python benchmarks/startupTime.py [--runs 5]
+###############################################
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Old startup: toolbox import and all presets built in RobotUI.__init__
+EAGER = """
+import time
+t = time.perf_counter()
+import roboticstoolbox as rtb
+from scipy.spatial.transform import Rotation
+dh = [rtb.models.DH.Puma560(), rtb.models.DH.UR3(), rtb.models.DH.UR5(), rtb.models.DH.UR10()]
+t_dh = time.perf_counter() - t
+urdf_ok = True
+try:
+    urdf = [rtb.models.URDF.Puma560(), rtb.models.URDF.UR3(), rtb.models.URDF.UR5(), rtb.models.URDF.UR10()]
+except Exception:
+    urdf_ok = False
+print(t_dh, time.perf_counter() - t, urdf_ok)
+"""
+
+# New startup: UI module import and preset registry, no models
+LAZY = """
+import time
+t = time.perf_counter()
+import src.robotUI
+from src.presets import PresetRegistry
+presets = PresetRegistry()
+t_start = time.perf_counter() - t
+presets.getDH("Puma560")
+print(t_start, time.perf_counter() - t, True)
+"""
+
+# Runs a snippet in a fresh interpreter and returns its printed timings
+def runSnippet(code):
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    first, second, flag = output.strip().splitlines()[-1].split()
+    return float(first), float(second), flag == "True"
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    eager = [runSnippet(EAGER) for _ in range(args.runs)]
+    lazy = [runSnippet(LAZY) for _ in range(args.runs)]
+
+    print("Runs:", args.runs)
+    print("Before (eager presets):")
+    print("  toolbox import + DH presets:  %.3f s" % min(r[0] for r in eager))
+    if all(r[2] for r in eager):
+        print("  + URDF presets:               %.3f s" % min(r[1] for r in eager))
+    else:
+        print("  + URDF presets:               not available (meshes could not be loaded)")
+    print("After (lazy registry):")
+    print("  UI module import + registry:  %.3f s" % min(r[0] for r in lazy))
+    print("  first preset selected:        %.3f s" % min(r[1] for r in lazy))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+###############################################
+# Tolerance analysis benchmark, Inverse Kinematics UI
+# Compares the vectorized Monte Carlo analysis with a DHRobot built per sample
+# Usage: python benchmarks/toleranceAnalysis.py [--targets 10 --samples 50000 --robot UR5]
+###############################################
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import roboticstoolbox as rtb
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.presets import PresetRegistry
+from src.robotModel import parseDHTable, readDHFile, createRobot
+from src.kinematics import DHChain
+from src.tolerance import analyseTolerances, toleranceSamples
+
+def main():
+    parser = argparse.ArgumentParser(description="Tolerance analysis benchmark")
+    parser.add_argument("--targets", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=50000, help="Stichproben pro Ziel")
+    parser.add_argument("--loop-count", type=int, default=200, help="Stichproben für die Toolbox-Schleife")
+    parser.add_argument("--tolerance", type=float, default=1e-4, help="Toleranz von a, d (m) und alpha (rad)")
+    parser.add_argument("--robot", default="examples/Beispiel_6-Achs-Knickarmroboter.csv", help="Preset oder DH-Tabelle (.csv)")
+    args = parser.parse_args()
+
+    if args.robot.endswith(".csv"):
+        robot = createRobot(parseDHTable(readDHFile(os.path.join(ROOT, args.robot))))
+    else:
+        robot = PresetRegistry().getDH(args.robot)
+    chain = DHChain.fromRobot(robot)
+    rng = np.random.default_rng(0)
+    Q = rng.uniform(chain.qlim[0], chain.qlim[1], (args.targets, chain.n))
+    tolerances = (args.tolerance,) * 3
+
+    # Toolbox: robot copy with changed link parameters and FK per sample
+    dd, da, dalpha = toleranceSamples(rng, args.loop_count, chain.n, tolerances)
+    start = time.perf_counter()
+    for k in range(args.loop_count):
+        links = []
+        for i, link in enumerate(robot.links):
+            link = link.copy()
+            link.a, link.alpha = link.a + da[k, i], link.alpha + dalpha[k, i]
+            if link.isrevolute: link.d = link.d + dd[k, i]
+            else: link.offset = link.offset + dd[k, i]
+            links.append(link)
+        sample = rtb.DHRobot(links, base=robot.base, tool=robot.tool)
+        for q in Q: sample.fkine(q)
+    loop_time = (time.perf_counter() - start) / (args.loop_count * args.targets)
+
+    # Vectorized: all samples, without the early stop
+    start = time.perf_counter()
+    for results in analyseTolerances(chain, Q, tolerances, max_samples=args.samples, precision=0, seed=1): pass
+    batch_time = (time.perf_counter() - start) / (args.samples * args.targets)
+
+    # With the early stop (±2 % at 95 % confidence)
+    start = time.perf_counter()
+    for results in analyseTolerances(chain, Q, tolerances, max_samples=args.samples, seed=1): pass
+    stop_time = time.perf_counter() - start
+    counts = [result.count for result in results]
+
+    print(f"Toolbox (DHRobot pro Stichprobe): {loop_time*1e6:.1f} µs/Stichprobe ({args.loop_count} Stichproben)")
+    print(f"Vektorisiert: {batch_time*1e6:.2f} µs/Stichprobe ({args.samples} Stichproben x {args.targets} Ziele, {loop_time/batch_time:.0f}x)")
+    print(f"Mit Abbruchkriterium: {stop_time*1e3:.0f} ms, {min(counts)}-{max(counts)} Stichproben pro Ziel")
+    position = [result.statistics()["position"]["p95"] for result in results]
+    print(f"Positionsfehler p95: {min(position)*1e3:.3f}-{max(position)*1e3:.3f} mm")
+
+if __name__ == "__main__":
+    main()
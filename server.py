@@ -0,0 +1,40 @@
+###############################################
+# IK server, Inverse Kinematics UI
+# Serves IK, FK and batch requests as JSON over HTTP (offline, localhost)
+# Usage: python server.py --port 8765 --workers 2
+###############################################
+
+import argparse
+import asyncio
+import signal
+import sys
+from src.presets import PRESET_LABELS
+
+# Creates the argument parser
+def createParser():
+    parser = argparse.ArgumentParser(description="Lokaler IK-Server (JSON über HTTP)")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse (Standard: nur lokal)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Unix-Socket statt TCP")
+    parser.add_argument("--workers", type=int, default=1, help="Anzahl Worker-Prozesse (0: Thread im Serverprozess)")
+    parser.add_argument("--presets", nargs="*", default=PRESET_LABELS[1:], choices=PRESET_LABELS[1:], help="Beim Start geladene Presets")
+    return parser
+
+if __name__ == "__main__":
+    from src.ikServer import IKServer, removeSocket
+    parser = createParser()
+    args = parser.parse_args()
+    try:
+        removeSocket(args.unix)
+    except FileExistsError as e:
+        parser.error(str(e))
+    server = IKServer(args.workers, args.presets)
+    # Shut down the worker processes on SIGTERM as well
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Also removes the Unix socket created by the server
+        server.close()
@@ -0,0 +1,215 @@
+###############################################
+# Closed-form inverse kinematics for 6R robots
+# Supports spherical wrists (Puma560 type) and UR type robots
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+from math import atan2, acos, asin, sqrt, sin, cos, pi
+import weakref
+import numpy as np
+from src.kinematics import DHChain
+
+# Name of the analytical solver in the UI
+ANALYTIC_SOLVER = "IK_Analytisch"
+
+# Tolerance for the DH structure detection and the solution check
+STRUCTURE_TOLERANCE = 1e-9
+POSE_TOLERANCE = 1e-6
+
+def _isZero(value): return abs(value) < STRUCTURE_TOLERANCE
+
+# Returns +1/-1 if an angle is +pi/2/-pi/2, otherwise 0
+def _rightAngleSign(alpha):
+    if _isZero(alpha - pi/2): return 1
+    if _isZero(alpha + pi/2): return -1
+    return 0
+
+def _rotZ(q):
+    c, s = cos(q), sin(q)
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+def _rotX(alpha):
+    c, s = cos(alpha), sin(alpha)
+    return np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+
+# Reads the DH parameters of a robot object
+# OUTPUTS: (d, a, alpha, offset) per joint <list of tuples>
+def _dhParams(robot):
+    return [(float(link.d), float(link.a), float(link.alpha), float(link.offset)) for link in robot.links]
+
+# Detects the kinematic structure of a robot
+# INPUTS: Robot <DHRobot>
+# OUTPUTS: "spherical", "ur" or None if there is no closed-form solution
+def analyticStructure(robot):
+    if robot.n != 6 or getattr(robot, "mdh", False): return None
+    if not all(link.isrevolute for link in robot.links): return None
+    d, a, alpha, offset = zip(*_dhParams(robot))
+    s4, s5 = _rightAngleSign(alpha[3]), _rightAngleSign(alpha[4])
+    if not s4 or not s5 or not _isZero(a[3]) or not _isZero(a[4]) or not _isZero(a[5]): return None
+    # Joints 2 and 3 parallel, shoulder not parallel to joint 2
+    if not _isZero(alpha[1]) or _isZero(a[1]) or _isZero(sin(alpha[0])): return None
+    # Spherical wrist: axes 4, 5 and 6 intersect
+    if _isZero(d[4]) and (not _isZero(a[2]) or not _isZero(d[3])):
+        return "spherical"
+    # UR type: joints 2, 3 and 4 parallel
+    if _isZero(alpha[2]) and _rightAngleSign(alpha[0]) and not _isZero(a[2]):
+        return "ur"
+    return None
+
+# Position and orientation error between poses and a target
+# INPUTS: Poses <kx4x4 array>, Target <4x4 array>
+# OUTPUTS: Position error + rotation angle <k array>
+def poseErrors(poses, target):
+    position = np.linalg.norm(poses[:, :3, 3] - target[:3, 3], axis=1)
+    cos_angle = (np.einsum("kij,ij->k", poses[:, :3, :3], target[:3, :3]) - 1) / 2
+    return position + np.arccos(np.clip(cos_angle, -1.0, 1.0))
+
+# Robot data used by the solver (cached per robot object)
+_models = weakref.WeakKeyDictionary()
+
+def _prepare(robot):
+    model = _models.get(robot)
+    if model is None:
+        params = _dhParams(robot)
+        model = {
+            "structure": analyticStructure(robot),
+            "params": params,
+            "offset": np.array([p[3] for p in params]),
+            "base_inv": np.linalg.inv(np.array(robot.base.A, dtype=float)),
+            "tool_inv": np.linalg.inv(np.array(robot.tool.A, dtype=float)),
+            "qlim": np.array(robot.qlim, dtype=float),
+            "chain": DHChain.fromRobot(robot),
+        }
+        _models[robot] = model
+    return model
+
+# Wrist angles from R = Rz(q4) Rx(alpha4) Rz(q5) Rx(alpha5) Rz(q6) (alpha4, alpha5 = ±pi/2)
+# Returns both wrist branches (q4, q5, q6), in a singularity q4 is taken from q4_hint
+def _wristAngles(M, alpha4, alpha5, q4_hint):
+    s4, s5 = _rightAngleSign(alpha4), _rightAngleSign(alpha5)
+    c5 = max(-1.0, min(1.0, -s4*s5*M[2, 2]))
+    s5_abs = sqrt(max(0.0, M[0, 2]**2 + M[1, 2]**2))
+    if s5_abs < 1e-9:
+        # Axes 4 and 6 aligned, only q4 + q6 is defined
+        q5 = 0.0 if c5 > 0 else pi
+        N = (_rotZ(q4_hint) @ _rotX(alpha4) @ _rotZ(q5) @ _rotX(alpha5)).T @ M
+        return [(q4_hint, q5, atan2(N[1, 0], N[0, 0]))]
+    branches = []
+    for sq5 in (s5_abs, -s5_abs):
+        q5 = atan2(sq5, c5)
+        q4 = atan2(M[1, 2] / (s5*sq5), M[0, 2] / (s5*sq5))
+        q6 = atan2(-M[2, 1] / (s4*sq5), M[2, 0] / (s4*sq5))
+        branches.append((q4, q5, q6))
+    return branches
+
+# Closed-form solution for robots with a spherical wrist
+def _solveSpherical(params, T, q4_hint):
+    d, a, alpha, offset = zip(*params)
+    R, p = T[:3, :3], T[:3, 3]
+    # Wrist center (axes 4, 5 and 6 intersect)
+    W = p - d[5] * (R @ np.array([0.0, sin(alpha[5]), cos(alpha[5])]))
+    sa1, ca1 = sin(alpha[0]), cos(alpha[0])
+    sa3, ca3 = sin(alpha[2]), cos(alpha[2])
+    h = d[1] + d[2] + ca3*d[3]
+    # Wrist center height fixes the planar y coordinate of joint 2
+    y2 = (W[2] - d[0] - ca1*h) / sa1
+    Y = ca1*y2 - sa1*h
+    radius2 = W[0]**2 + W[1]**2 - Y**2
+    if radius2 < -1e-12: return []
+    solutions = []
+    # Shoulder branches
+    for X in (sqrt(max(0.0, radius2)), -sqrt(max(0.0, radius2))):
+        q1 = atan2(W[1], W[0]) - atan2(Y, X)
+        x2 = X - a[0]
+        # Elbow: a3*cos(q3) + sa3*d4*sin(q3) = v
+        v = (x2**2 + y2**2 - a[1]**2 - a[2]**2 - (sa3*d[3])**2) / (2*a[1])
+        amplitude = sqrt(a[2]**2 + (sa3*d[3])**2)
+        if abs(v) > amplitude + 1e-12: continue
+        phi = atan2(sa3*d[3], a[2])
+        for sign in (1, -1):
+            q3 = phi + sign*acos(max(-1.0, min(1.0, v / amplitude)))
+            vx = a[2]*cos(q3) + sa3*d[3]*sin(q3)
+            vy = a[2]*sin(q3) - sa3*d[3]*cos(q3)
+            q2 = atan2(y2, x2) - atan2(vy, a[1] + vx)
+            # Wrist orientation relative to frame 3
+            R03 = np.eye(3)
+            for qi, alpha_i in zip((q1, q2, q3), alpha[:3]):
+                R03 = R03 @ _rotZ(qi) @ _rotX(alpha_i)
+            M = R03.T @ R @ _rotX(-alpha[5])
+            for q4, q5, q6 in _wristAngles(M, alpha[3], alpha[4], q4_hint):
+                solutions.append([q1, q2, q3, q4, q5, q6])
+    return solutions
+
+# Closed-form solution for UR type robots (joints 2, 3 and 4 parallel)
+def _solveUR(params, T, q4_hint):
+    d, a, alpha, offset = zip(*params)
+    R, p = T[:3, :3], T[:3, 3]
+    s1 = _rightAngleSign(alpha[0])
+    # Origin of frame 5
+    z5 = R @ np.array([0.0, sin(alpha[5]), cos(alpha[5])])
+    o5 = p - d[5]*z5
+    # Distance of o5 from the plane of joints 2-4 fixes q1
+    r = sqrt(o5[0]**2 + o5[1]**2)
+    D = d[1] + d[2] + d[3]
+    if r < abs(D) - 1e-12 or r < 1e-12: return []
+    phi = atan2(o5[1], o5[0])
+    shoulder = asin(max(-1.0, min(1.0, s1*D / r)))
+    solutions = []
+    for q1 in (phi + shoulder, phi + pi - shoulder):
+        R01 = _rotZ(q1) @ _rotX(alpha[0])
+        o1 = np.array([a[0]*cos(q1), a[0]*sin(q1), d[0]])
+        z1 = R01[:, 2]
+        N = R01.T @ R @ _rotX(-alpha[5])
+        # N = Rz(q2+q3+q4) Rx(alpha4) Rz(q5) Rx(alpha5) Rz(q6)
+        for q234, q5, q6 in _wristAngles(N, alpha[3], alpha[4], q4_hint):
+            z4 = R01 @ _rotZ(q234) @ _rotX(alpha[3])[:, 2]
+            o3 = o5 - d[4]*z4 - d[3]*z1
+            x, y, z = R01.T @ (o3 - o1)
+            # Planar elbow of joints 2 and 3
+            c3 = (x**2 + y**2 - a[1]**2 - a[2]**2) / (2*a[1]*a[2])
+            if abs(c3) > 1 + 1e-9: continue
+            for sign in (1, -1):
+                q3 = sign*acos(max(-1.0, min(1.0, c3)))
+                q2 = atan2(y, x) - atan2(a[2]*sin(q3), a[1] + a[2]*cos(q3))
+                solutions.append([q1, q2, q3, q234 - q2 - q3, q5, q6])
+    return solutions
+
+# Calculates all closed-form solutions of a target pose
+# The robot object must not be changed after the first call (its data is cached)
+# INPUTS: Robot <DHRobot>, Target <4x4 array>, Limits active <bool>, Start position used in wrist singularities <list>
+# OUTPUTS: Solutions [(q, residual)] <list> or None if the robot structure is not supported
+def ikineAnalytic(robot, target, joint_limits=True, q0=None):
+    model = _prepare(robot)
+    if model["structure"] is None: return None
+    target = np.asarray(target, dtype=float)
+    # Target relative to base and without tool
+    T = model["base_inv"] @ target @ model["tool_inv"]
+    q4_hint = (q0[3] + model["offset"][3]) if q0 is not None else 0.0
+    if model["structure"] == "spherical":
+        branches = _solveSpherical(model["params"], T, q4_hint)
+    else:
+        branches = _solveUR(model["params"], T, q4_hint)
+    if not branches: return []
+    # Wrap angles to [-pi, pi] and shift them into the joint limits if possible
+    qlim = model["qlim"]
+    Q = (np.array(branches) - model["offset"] + pi) % (2*pi) - pi
+    Q = np.where(Q < qlim[0], Q + 2*pi, np.where(Q > qlim[1], Q - 2*pi, Q))
+    if joint_limits:
+        Q = Q[np.all((Q >= qlim[0] - 1e-9) & (Q <= qlim[1] + 1e-9), axis=1)]
+    # Check the solutions (numerical issues near singularities)
+    residuals = poseErrors(model["chain"].fkine(Q), target)
+    return [(Q[i], float(residuals[i])) for i in np.flatnonzero(residuals < POSE_TOLERANCE)]
+
+# Closed-form solutions as solver results, nearest to the start position first
+# INPUTS: Robot <DHRobot>, Target <4x4 array>, Start position <list>, Limits active <bool>
+# OUTPUTS: Solutions <list of IKSolution> or None if the robot structure is not supported
+def analyticSolutions(robot, target, q0=None, joint_limits=True):
+    from roboticstoolbox.robot.IK import IKSolution
+    solutions = ikineAnalytic(robot, target, joint_limits, q0)
+    if solutions is None: return None
+    if q0 is not None:
+        # Wrapped joint distance to the start position
+        q0 = np.asarray(q0, dtype=float)
+        solutions.sort(key=lambda s: float(np.linalg.norm((s[0] - q0 + pi) % (2*pi) - pi)))
+    return [IKSolution(q=q, success=True, iterations=0, searches=1, residual=residual, reason="Success") for q, residual in solutions]
@@ -0,0 +1,122 @@
+###############################################
+# Background worker for inverse kinematic ui
+# Runs slow tasks outside of the Tk event loop
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import queue
+import threading
+
+# Handle of a submitted task, passed to the task function
+class Job:
+    def __init__(self, task, on_done, on_error):
+        self.task = task
+        self.on_done = on_done
+        self.on_error = on_error
+        self._cancelled = threading.Event()
+        self._messages = None
+
+    # Returns True if the job was cancelled or replaced by a newer one
+    def isCancelled(self): return self._cancelled.is_set()
+
+    # Cancels the job (its result is discarded)
+    def cancel(self): self._cancelled.set()
+
+    # Reports progress to the UI (called from the worker thread)
+    def progress(self, message): self._messages.put(("progress", self, message))
+
+# Runs one task at a time in a worker thread
+# Only the newest queued task is kept, callbacks run in the Tk main thread
+class BackgroundWorker:
+    def __init__(self, master, on_busy=None, on_progress=None, poll_interval=30):
+        self.master = master
+        # Callbacks to show the busy state <function(bool)> and progress messages <function(string)>
+        self.on_busy = on_busy
+        self.on_progress = on_progress
+        self.poll_interval = poll_interval
+        self._messages = queue.Queue()
+        self._condition = threading.Condition()
+        self._queued = None
+        self._running = None
+        self._polling = False
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    # Queues a task, older tasks are dropped (a running task finishes, but its result is discarded)
+    # INPUTS: Task <function(job)>, Result callback <function(result)>, Error callback <function(exception)>
+    # OUTPUTS: Job <Job>
+    def submit(self, task, on_done=None, on_error=None):
+        job = Job(task, on_done, on_error)
+        job._messages = self._messages
+        with self._condition:
+            for old in (self._queued, self._running):
+                if old is not None: old.cancel()
+            self._queued = job
+            self._condition.notify()
+        self._setBusy(True)
+        self._startPolling()
+        return job
+
+    # Cancels the running and the queued task
+    def cancel(self):
+        with self._condition:
+            for job in (self._queued, self._running):
+                if job is not None: job.cancel()
+            self._queued = None
+        self._setBusy(False)
+
+    # Returns True while a task is queued or running
+    def isBusy(self):
+        with self._condition:
+            return any(job is not None and not job.isCancelled() for job in (self._queued, self._running))
+
+    # Worker thread
+    def _loop(self):
+        while True:
+            with self._condition:
+                while self._queued is None:
+                    self._condition.wait()
+                job = self._running = self._queued
+                self._queued = None
+            try:
+                if job.isCancelled(): continue
+                self._messages.put(("done", job, job.task(job)))
+            except Exception as e:
+                self._messages.put(("error", job, e))
+            finally:
+                # Also reset for jobs cancelled before they started, _poll waits for _running
+                with self._condition:
+                    self._running = None
+
+    # Polls the results in the Tk main thread
+    def _startPolling(self):
+        if self._polling: return
+        self._polling = True
+        self.master.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                kind, job, value = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            # Ignore results of cancelled or replaced jobs
+            if job.isCancelled(): continue
+            if kind == "progress":
+                if self.on_progress: self.on_progress(value)
+                continue
+            if not self.isBusy(): self._setBusy(False)
+            if kind == "done" and job.on_done: job.on_done(value)
+            elif kind == "error" and job.on_error: job.on_error(value)
+        # Keep polling while tasks are pending
+        with self._condition:
+            pending = self._queued is not None or self._running is not None
+        if pending or not self._messages.empty():
+            self.master.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
+            self._setBusy(False)
+
+    def _setBusy(self, busy):
+        if self.on_busy: self.on_busy(busy)
@@ -0,0 +1,120 @@
+###############################################
+# Headless batch inverse kinematics
+# Solves many target poses without the UI
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import csv
+import numpy as np
+from src.helpers import parseInputString
+from src.robotModel import createRobot, targetTransforms, solveIK, vectorChain
+from src.vectorIK import VECTOR_SOLVER, solveLockstep
+
+# Default number of targets per chunk
+CHUNK_SIZE = 1024
+
+# Results of one chunk of targets
+class BatchResult:
+    def __init__(self, start, q, success, residual, iterations):
+        # Index of the first target in the chunk
+        self.start = start
+        self.q = q
+        self.success = success
+        self.residual = residual
+        self.iterations = iterations
+        # Flags of joint jumps (path results only)
+        self.jumps = None
+
+    def __len__(self): return len(self.q)
+
+# Converts a csv cell to float (fast path for plain numbers)
+def _parseCell(value):
+    try:
+        return float(value)
+    except ValueError:
+        return parseInputString(value.strip())
+
+# Reads targets [X, Y, Z, A, B, C] chunk by chunk from a .csv or .npy file
+# A header line in csv files is skipped
+# INPUTS: File path <string>, Targets per chunk <int>, Csv delimiter <string>
+# OUTPUTS: Generator of target chunks <Nx6 arrays>
+def readTargets(file_path, chunk_size=CHUNK_SIZE, delimiter=","):
+    if file_path.endswith(".npy"):
+        # Memory mapped, only the current chunk is loaded
+        data = np.load(file_path, mmap_mode='r')
+        if data.ndim != 2 or data.shape[1] != 6:
+            raise ValueError("Targets must be a Nx6 array, got shape " + str(data.shape))
+        for start in range(0, len(data), chunk_size):
+            yield np.array(data[start:start+chunk_size], dtype=float)
+        return
+    with open(file_path, mode='r', newline='') as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        chunk = []
+        for line_number, line in enumerate(reader):
+            if not line: continue
+            try:
+                values = [_parseCell(value) for value in line]
+            except Exception:
+                # Skip header line
+                if line_number == 0: continue
+                raise ValueError("Invalid target in line " + str(line_number+1) + ": " + delimiter.join(line))
+            if len(values) != 6:
+                raise ValueError("Target in line " + str(line_number+1) + " needs 6 values, got " + str(len(values)))
+            chunk.append(values)
+            if len(chunk) == chunk_size:
+                yield np.array(chunk)
+                chunk = []
+        if chunk:
+            yield np.array(chunk)
+
+# Solves one chunk of targets with an existing robot object
+# INPUTS: Robot <DHRobot>, Targets <Nx6 array>, Solver name <string>, Start position <list>, Limits active <bool>, Index of first target <int>
+# OUTPUTS: Result <BatchResult>
+def solveChunk(robot, targets, solver="IK_LM", q0=None, joint_limits=True, start=0):
+    if q0 is None: q0 = np.zeros(robot.n)
+    transforms = targetTransforms(targets)
+    if solver == VECTOR_SOLVER:
+        # All targets of the chunk in lock-step
+        q, success, residual, iterations, _ = solveLockstep(vectorChain(robot), transforms, q0, joint_limits)
+        return BatchResult(start, q, success, residual, iterations)
+    count = len(transforms)
+    q = np.zeros((count, robot.n))
+    success = np.zeros(count, dtype=bool)
+    residual = np.zeros(count)
+    iterations = np.zeros(count, dtype=int)
+    for i in range(count):
+        result = solveIK(robot, solver, transforms[i], q0, joint_limits)
+        q[i] = result.q
+        success[i] = result.success
+        residual[i] = result.residual
+        iterations[i] = result.iterations
+    return BatchResult(start, q, success, residual, iterations)
+
+# Solves all targets, one robot object is used for the whole batch
+# INPUTS: DH params <list of tuples>, Target chunks <iterable of Nx6 arrays>, Solver name <string>, Start position <list>, Limits active <bool>
+# OUTPUTS: Generator of results <BatchResult>
+def solveBatch(dh_params, chunks, solver="IK_LM", q0=None, joint_limits=True):
+    robot = createRobot(dh_params)
+    start = 0
+    for targets in chunks:
+        yield solveChunk(robot, targets, solver, q0, joint_limits, start)
+        start += len(targets)
+
+# Writes results to a csv file while they are calculated
+# INPUTS: File path <string>, Results <iterable of BatchResult>, Number of joints <int>, Add jump flags <bool>
+# OUTPUTS: Number of solved targets and successful solutions <tuple>
+def writeResults(file_path, results, n, with_jumps=False):
+    total = 0
+    solved = 0
+    with open(file_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Index"] + ["q" + str(i+1) for i in range(n)] + ["Erfolg", "Residuum", "Iterationen"] + (["Sprung"] if with_jumps else []))
+        for result in results:
+            for i in range(len(result)):
+                row = [result.start + i] + [repr(float(value)) for value in result.q[i]] + [int(result.success[i]), repr(float(result.residual[i])), int(result.iterations[i])]
+                if with_jumps: row.append(int(result.jumps[i]))
+                writer.writerow(row)
+            total += len(result)
+            solved += int(np.count_nonzero(result.success))
+    return total, solved
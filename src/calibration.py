@@ -0,0 +1,184 @@
+###############################################
+# Kinematic calibration
+# Fits the DH parameters to measured (joint position, TCP pose) pairs with batched least squares
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import numpy as np
+from src.kinematics import DHChain
+from src.robotModel import targetTransforms
+from src.vectorIK import poseErrors
+
+# Largest number of Levenberg-Marquardt iterations and stop criterion (relative change of the cost)
+ITERATIONS = 20
+TOLERANCE = 1e-6
+# Measurements per pass (limits the memory of the frames and Jacobians)
+CHUNK_SIZE = 5000
+# Weight of orientation errors (m/rad) relative to position errors
+ORIENTATION_WEIGHT = 1.0
+# Relative singular value below which a parameter combination counts as not identifiable
+RCOND = 1e-8
+
+# Names of the fitted parameters per joint (θ only for prismatic joints, d only for revolute joints,
+# the joint variable is not part of the DH table)
+def parameterNames(chain):
+    names = []
+    for i in range(chain.n):
+        names += [("d" if chain.revolute[i] else "θ") + str(i+1), "a" + str(i+1), "alpha" + str(i+1)]
+    return names
+
+# Result of a calibration
+class CalibrationResult:
+    def __init__(self, chain, deviations, before, after, iterations, rank):
+        # Calibrated chain and fitted deviations (see parameterNames) <DHChain>, <3n array>
+        self.chain = chain
+        self.deviations = deviations
+        # Residual statistics before and after the fit <dict>
+        self.before = before
+        self.after = after
+        self.iterations = iterations
+        # Number of identifiable parameter combinations
+        self.rank = rank
+
+    # Calibrated DH table
+    # INPUTS: DH params of the nominal table (joint limits and types are kept) <list of tuples>
+    # OUTPUTS: Rows [θ, d, a, alpha, min, max, type] <list of lists>
+    def dhRows(self, dh_params):
+        rows = []
+        for i, (theta, d, a, alpha, q_min, q_max, joint_type) in enumerate(dh_params):
+            rows.append([repr(float(self.chain.theta[i])), repr(float(self.chain.d[i])), repr(float(self.chain.a[i])), repr(float(self.chain.alpha[i])),
+                         repr(float(q_min)), repr(float(q_max)), joint_type])
+        return rows
+
+# Reads measurements from a csv file, rows of joint values q1 ... qn followed by the measured TCP pose
+# X, Y, Z, A, B, C (or only X, Y, Z for position measurements); a header line is skipped
+# INPUTS: File path <string>, Number of joints <int>, Csv delimiter <string>
+# OUTPUTS: Joint positions <Mxn array>, Measured poses <Mx6 or Mx3 array>
+def readMeasurements(file_path, n, delimiter=","):
+    with open(file_path, mode='r') as file:
+        first = file.readline()
+    try:
+        [float(value) for value in first.split(delimiter)]
+        skip = 0
+    except ValueError:
+        skip = 1
+    data = np.loadtxt(file_path, delimiter=delimiter, skiprows=skip, ndmin=2)
+    if data.shape[1] not in (n + 3, n + 6):
+        raise ValueError("Measurements need " + str(n) + " joint values and 3 or 6 pose values per row, got " + str(data.shape[1]) + " columns")
+    return data[:, :n], data[:, n:]
+
+# Creates the chain with deviations of the fitted parameters (see parameterNames)
+def deviatedChain(chain, x):
+    x = x.reshape(chain.n, 3)
+    theta = chain.theta + np.where(chain.revolute, 0.0, x[:, 0])
+    d = chain.d + np.where(chain.revolute, x[:, 0], 0.0)
+    return DHChain(theta, d, chain.a + x[:, 1], chain.alpha + x[:, 2], chain.revolute, chain.qlim, chain.offset, chain.base, chain.tool)
+
+# Weighted pose errors (measured - model) of a chunk of measurements
+def _errors(chain, Q, measured, position_only):
+    T = chain.fkine(Q)
+    if position_only: return measured[:, :3, 3] - T[:, :3, 3]
+    e = poseErrors(T, measured)
+    e[:, 3:] *= ORIENTATION_WEIGHT
+    return e
+
+# Analytic Jacobians of the TCP pose with respect to the fitted parameters, from one evaluation of the link frames:
+# d and θ move/rotate along/about the z axis of frame i-1, a and alpha along/about the x axis of frame i
+# INPUTS: DH chain <DHChain>, Joint positions <Mxn array>
+# OUTPUTS: Poses <Mx4x4 array>, Jacobians [vx, vy, vz, wx, wy, wz] x parameters <Mx6x3n array>
+def parameterJacobians(chain, Q):
+    F = chain.frames(Q)
+    T = F[:, -1] if chain.tool is None else F[:, -1] @ chain.tool
+    p = T[:, None, :3, 3]
+    z, o = F[:, :-1, :3, 2], F[:, :-1, :3, 3]
+    x, ox = F[:, 1:, :3, 0], F[:, 1:, :3, 3]
+    J = np.zeros((len(F), 6, chain.n, 3))
+    revolute = chain.revolute
+    # d of revolute joints (translation along z), θ of prismatic joints (rotation about z)
+    J[:, :3, revolute, 0] = z[:, revolute].transpose(0, 2, 1)
+    J[:, :3, ~revolute, 0] = np.cross(z[:, ~revolute], p - o[:, ~revolute]).transpose(0, 2, 1)
+    J[:, 3:, ~revolute, 0] = z[:, ~revolute].transpose(0, 2, 1)
+    # a (translation along x), alpha (rotation about x)
+    J[:, :3, :, 1] = x.transpose(0, 2, 1)
+    J[:, :3, :, 2] = np.cross(x, p - ox).transpose(0, 2, 1)
+    J[:, 3:, :, 2] = x.transpose(0, 2, 1)
+    return T, J.reshape(len(F), 6, 3 * chain.n)
+
+# Residual statistics of position and orientation errors
+# INPUTS: DH chain <DHChain>, Joint positions <Mxn array>, Measured poses <Mx4x4 array>, Position only <bool>
+# OUTPUTS: RMS, mean and max of the position (m) and orientation (rad) errors <dict>
+def residualStatistics(chain, Q, measured, position_only=False, chunk_size=CHUNK_SIZE):
+    position, orientation = [], []
+    for start in range(0, len(Q), chunk_size):
+        T = chain.fkine(Q[start:start+chunk_size])
+        e = poseErrors(T, measured[start:start+chunk_size])
+        position.append(np.linalg.norm(e[:, :3], axis=1))
+        orientation.append(np.linalg.norm(e[:, 3:], axis=1))
+    result = {}
+    for name, errors in zip(("position", "orientation"), (np.concatenate(position), np.concatenate(orientation))):
+        if name == "orientation" and position_only: continue
+        result[name] = {"rms": float(np.sqrt(np.mean(errors**2))), "mean": float(np.mean(errors)), "max": float(np.max(errors))}
+    return result
+
+# Normal equations J^T J, J^T e and cost of all measurements, chunk by chunk
+def _normalEquations(chain, Q, measured, position_only, chunk_size):
+    size = 3 * chain.n
+    JtJ, Jte, cost = np.zeros((size, size)), np.zeros(size), 0.0
+    rows = slice(0, 3) if position_only else slice(0, 6)
+    weight = np.array([1.0, 1.0, 1.0] + [ORIENTATION_WEIGHT] * 3)[rows]
+    for start in range(0, len(Q), chunk_size):
+        T, J = parameterJacobians(chain, Q[start:start+chunk_size])
+        target = measured[start:start+chunk_size]
+        e = target[:, :3, 3] - T[:, :3, 3] if position_only else poseErrors(T, target)
+        e = e * weight
+        J = (J[:, rows] * weight[:, None]).reshape(-1, size)
+        JtJ += J.T @ J
+        Jte += J.T @ e.ravel()
+        cost += float(np.einsum("ij,ij->", e, e))
+    return JtJ, Jte, cost
+
+def _cost(chain, Q, measured, position_only, chunk_size):
+    return sum(float(np.sum(_errors(chain, Q[start:start+chunk_size], measured[start:start+chunk_size], position_only)**2))
+               for start in range(0, len(Q), chunk_size))
+
+# Fits the DH parameters (d/θ, a and alpha of every joint) with Levenberg-Marquardt, every iteration evaluates the
+# analytic Jacobians of all measurements as stacked arrays and solves the normal equations; parameter combinations
+# that the measurements cannot identify (e.g. d of parallel joints) are not changed
+# INPUTS: DH chain <DHChain>, Joint positions <Mxn array>, Measured poses <Mx6 or Mx3 array>,
+#         Iterations <int>, Tolerance <float>, Measurements per pass <int>, Progress callback <function(iteration, cost)>
+# OUTPUTS: Result <CalibrationResult>
+def calibrate(chain, Q, poses, iterations=ITERATIONS, tol=TOLERANCE, chunk_size=CHUNK_SIZE, progress=None):
+    Q = np.asarray(Q, dtype=float).reshape(-1, chain.n)
+    poses = np.asarray(poses, dtype=float)
+    position_only = poses.shape[1] == 3
+    measured = targetTransforms(np.hstack([poses, np.zeros((len(poses), 3))]) if position_only else poses)
+    before = residualStatistics(chain, Q, measured, position_only, chunk_size)
+    x = np.zeros(3 * chain.n)
+    current = chain
+    damping = 1e-3
+    rank = 0
+    iteration = 0
+    for iteration in range(1, iterations + 1):
+        JtJ, Jte, cost = _normalEquations(current, Q, measured, position_only, chunk_size)
+        if progress is not None: progress(iteration, cost)
+        # Scaled normal equations, the minimum norm solution leaves unidentifiable combinations unchanged
+        scale = np.sqrt(np.diag(JtJ))
+        scale[scale == 0] = 1.0
+        A = JtJ / np.outer(scale, scale)
+        b = Jte / scale
+        rank = int(np.linalg.matrix_rank(A, tol=RCOND * np.max(np.abs(A))))
+        improved = False
+        while damping < 1e10:
+            step = np.linalg.lstsq(A + damping * np.diag(np.diag(A)), b, rcond=RCOND)[0] / scale
+            trial = deviatedChain(chain, x + step)
+            trial_cost = _cost(trial, Q, measured, position_only, chunk_size)
+            if trial_cost < cost:
+                x, current = x + step, trial
+                damping = max(damping / 10, 1e-12)
+                improved = True
+                break
+            damping *= 10
+        if not improved or cost - trial_cost <= tol * max(cost, 1e-300): break
+    after = residualStatistics(current, Q, measured, position_only, chunk_size)
+    return CalibrationResult(current, x, before, after, iteration, rank)
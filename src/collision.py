@@ -0,0 +1,232 @@
+###############################################
+# Collision check
+# Capsules along the DH links, static box obstacles and a floor, checked for many joint positions at once
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import csv
+import numpy as np
+
+# Default radius of the link capsules (m) and floor height (None: no floor)
+LINK_RADIUS = 0.04
+FLOOR_HEIGHT = None
+# Random positions to find link pairs that always touch (e.g. short wrist links), these pairs are not checked
+ACM_SAMPLES = 1000
+ALWAYS_FRACTION = 0.95
+# Samples per block of the broad phase (bounding boxes of a block of consecutive trajectory samples)
+BLOCK_SIZE = 64
+
+# Static obstacle (axis aligned box in the base coordinate system)
+class Box:
+    def __init__(self, lower, upper, name=""):
+        self.lower = np.minimum(lower, upper).astype(float)
+        self.upper = np.maximum(lower, upper).astype(float)
+        self.name = name
+
+    def __repr__(self): return "Box(" + self.name + ", " + str(self.lower.tolist()) + ", " + str(self.upper.tolist()) + ")"
+
+# Collision flags of sampled joint positions (e.g. a trajectory or IK candidates)
+class CollisionResult:
+    def __init__(self, self_collision, environment):
+        # Links touching each other, links touching an obstacle or the floor <M bool arrays>
+        self.self_collision = self_collision
+        self.environment = environment
+
+    def __len__(self): return len(self.self_collision)
+
+    @property
+    def colliding(self): return self.self_collision | self.environment
+
+    # Index of the first colliding sample (None if there is no collision)
+    @property
+    def first(self):
+        colliding = np.flatnonzero(self.colliding)
+        return int(colliding[0]) if len(colliding) else None
+
+    # Overview for a trajectory or candidate set
+    # OUTPUTS: Summary (samples, colliding samples, self and environment collisions, first colliding sample) <dict>
+    def summary(self):
+        return {
+            "samples": len(self),
+            "colliding": int(np.count_nonzero(self.colliding)),
+            "self_collision": int(np.count_nonzero(self.self_collision)),
+            "environment": int(np.count_nonzero(self.environment)),
+            "first": self.first,
+        }
+
+# Closest distances between many pairs of segments P1-Q1 and P2-Q2 (degenerate segments are points)
+# INPUTS: Segment end points <Kx3 arrays>
+# OUTPUTS: Distances <K array>
+def segmentDistances(P1, Q1, P2, Q2):
+    d1, d2, r = Q1 - P1, Q2 - P2, P1 - P2
+    a = np.einsum("ij,ij->i", d1, d1)
+    e = np.einsum("ij,ij->i", d2, d2)
+    b = np.einsum("ij,ij->i", d1, d2)
+    c = np.einsum("ij,ij->i", d1, r)
+    f = np.einsum("ij,ij->i", d2, r)
+    eps = 1e-12
+    safe_a, safe_e = np.maximum(a, eps), np.maximum(e, eps)
+    denominator = a * e - b * b
+    # Closest point on the infinite lines, parallel segments start at s = 0
+    s = np.where(denominator > eps, np.clip((b * f - c * e) / np.maximum(denominator, eps), 0, 1), 0.0)
+    t = (b * s + f) / safe_e
+    # Clamp t to the segment and recompute s
+    s = np.where(t < 0, np.clip(-c / safe_a, 0, 1), np.where(t > 1, np.clip((b - c) / safe_a, 0, 1), s))
+    t = np.clip(t, 0, 1)
+    # Degenerate segments
+    point1, point2 = a <= eps, e <= eps
+    s = np.where(point1, 0.0, s)
+    t = np.where(point1, np.clip(f / safe_e, 0, 1), t)
+    t = np.where(point2, 0.0, t)
+    s = np.where(point2 & ~point1, np.clip(-c / safe_a, 0, 1), s)
+    difference = P1 + d1 * s[:, None] - P2 - d2 * t[:, None]
+    return np.sqrt(np.einsum("ij,ij->i", difference, difference))
+
+# Intersection of many segments A-B with boxes (slab test)
+# INPUTS: Segment end points <Kx3 arrays>, Box corners <Kx3 arrays>
+# OUTPUTS: Intersects <K bool array>
+def segmentsIntersectBoxes(A, B, lower, upper):
+    d = B - A
+    parallel = np.abs(d) < 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t1 = (lower - A) / d
+        t2 = (upper - A) / d
+    inside = (A >= lower) & (A <= upper)
+    # Segments parallel to a slab hit it for all t (inside) or never
+    near = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(t1, t2))
+    far = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(t1, t2))
+    t_min, t_max = np.max(near, axis=1), np.min(far, axis=1)
+    return (t_min <= t_max) & (t_max >= 0) & (t_min <= 1)
+
+# Capsule model of a DH chain: every link is a polyline along d (z axis of frame i-1) and a (x axis of frame i),
+# each non-zero part is a capsule; the tool offset adds one capsule
+class CollisionModel:
+    def __init__(self, chain, radius=LINK_RADIUS, obstacles=(), floor=FLOOR_HEIGHT, seed=0):
+        self.chain = chain
+        self.radius = float(radius)
+        self.obstacles = list(obstacles)
+        self.floor = floor
+        # Points of the polyline: origin of frame 0, then per link the end of the d part and the origin of frame i
+        segments, links = [], []
+        for i in range(chain.n):
+            if not chain.revolute[i] or chain.d[i] != 0:
+                segments.append((2*i, 2*i + 1))
+                links.append(i)
+            if chain.a[i] != 0:
+                segments.append((2*i + 1, 2*i + 2))
+                links.append(i)
+        if chain.tool is not None and np.any(chain.tool[:3, 3] != 0):
+            segments.append((2*chain.n, 2*chain.n + 1))
+            links.append(chain.n)
+        self.segments = np.array(segments, dtype=int).reshape(-1, 2)
+        # Joint of every segment (n for the tool)
+        self.links = np.array(links, dtype=int)
+        # Link pairs that are checked: not connected and not touching in (almost) every position
+        first, second = np.triu_indices(len(self.segments), 2)
+        self.pairs = np.stack([first, second], axis=1)
+        if len(self.pairs):
+            Q = np.random.default_rng(seed).uniform(chain.qlim[0], chain.qlim[1], (ACM_SAMPLES, chain.n))
+            P = self.points(Q)
+            touching = np.mean(self._pairDistances(P, np.repeat(np.arange(len(Q)), len(self.pairs)), np.tile(np.arange(len(self.pairs)), len(Q))).reshape(len(Q), -1) < 2 * self.radius, axis=0)
+            self.pairs = self.pairs[touching < ALWAYS_FRACTION]
+        # The links of the first joint are mounted on the floor and not checked against it
+        self.floor_segments = np.flatnonzero(self.links > 0)
+
+    # End points of the link segments for many joint positions
+    # INPUTS: Joint positions <Mxn array>
+    # OUTPUTS: Points <Mx(2n+1 or 2n+2)x3 array> (see self.segments)
+    def points(self, Q):
+        chain = self.chain
+        F = chain.frames(Q)
+        origins = F[:, :, :3, 3]
+        P = np.empty((len(F), 2*chain.n + 1 + (chain.tool is not None), 3))
+        P[:, 0::2][:, :chain.n + 1] = origins
+        # End of the d part: origin of frame i minus a along its x axis
+        P[:, 1:2*chain.n:2] = origins[:, 1:] - chain.a[None, :, None] * F[:, 1:, :3, 0]
+        if chain.tool is not None: P[:, -1] = (F[:, -1] @ chain.tool)[:, :3, 3]
+        return P
+
+    # Distances of the given (sample, pair) combinations
+    def _pairDistances(self, P, samples, pairs):
+        first, second = self.segments[self.pairs[pairs, 0]], self.segments[self.pairs[pairs, 1]]
+        return segmentDistances(P[samples, first[:, 0]], P[samples, first[:, 1]], P[samples, second[:, 0]], P[samples, second[:, 1]])
+
+    # Checks many joint positions (trajectory samples or IK candidates): the broad phase compares bounding boxes
+    # of blocks of consecutive samples and of single samples, only the remaining capsule pairs and capsule-box
+    # combinations are tested exactly
+    # INPUTS: Joint positions <Mxn array>
+    # OUTPUTS: Result <CollisionResult>
+    def check(self, Q):
+        Q = np.asarray(Q, dtype=float).reshape(-1, self.chain.n)
+        count = len(Q)
+        self_collision = np.zeros(count, dtype=bool)
+        environment = np.zeros(count, dtype=bool)
+        if count == 0 or len(self.segments) == 0: return CollisionResult(self_collision, environment)
+        P = self.points(Q)
+        A, B = P[:, self.segments[:, 0]], P[:, self.segments[:, 1]]
+        # Bounding boxes of the capsules per sample and per block of samples
+        lower, upper = np.minimum(A, B) - self.radius, np.maximum(A, B) + self.radius
+        starts = np.arange(0, count, BLOCK_SIZE)
+        block_lower, block_upper = np.minimum.reduceat(lower, starts, axis=0), np.maximum.reduceat(upper, starts, axis=0)
+        block = np.arange(count) // BLOCK_SIZE
+        if len(self.pairs):
+            first, second = self.pairs[:, 0], self.pairs[:, 1]
+            near = np.all((block_lower[:, first] <= block_upper[:, second]) & (block_lower[:, second] <= block_upper[:, first]), axis=2)
+            samples, pairs = np.nonzero(near[block])
+            overlap = np.all((lower[samples, first[pairs]] <= upper[samples, second[pairs]]) & (lower[samples, second[pairs]] <= upper[samples, first[pairs]]), axis=1)
+            samples, pairs = samples[overlap], pairs[overlap]
+            touching = self._pairDistances(P, samples, pairs) < 2 * self.radius
+            self_collision[samples[touching]] = True
+        for box in self.obstacles:
+            box_lower, box_upper = box.lower - self.radius, box.upper + self.radius
+            near = np.all((block_lower <= box.upper) & (block_upper >= box.lower), axis=2)
+            samples, segments = np.nonzero(near[block])
+            overlap = np.all((lower[samples, segments] <= box.upper) & (upper[samples, segments] >= box.lower), axis=1)
+            samples, segments = samples[overlap], segments[overlap]
+            # Box grown by the radius (corners are conservative)
+            hit = segmentsIntersectBoxes(A[samples, segments], B[samples, segments], box_lower, box_upper)
+            environment[samples[hit]] = True
+        if self.floor is not None and len(self.floor_segments):
+            # Link axes below the floor (the radius is not applied, links mounted at the floor height are allowed)
+            height = np.minimum(A[:, self.floor_segments, 2], B[:, self.floor_segments, 2])
+            environment |= np.any(height < self.floor - 1e-9, axis=1)
+        return CollisionResult(self_collision, environment)
+
+    # Checks the samples of a joint trajectory (see trajectory.jointTrajectory)
+    # INPUTS: Trajectory <Trajectory or Mxn array>
+    # OUTPUTS: Result <CollisionResult>
+    def checkTrajectory(self, trajectory):
+        return self.check(getattr(trajectory, "q", trajectory))
+
+    # Checks a single joint position
+    def isColliding(self, q):
+        return bool(self.check(q).colliding[0])
+
+# Removes colliding solutions from a candidate set (all candidates are checked in one pass), the order is kept
+# INPUTS: Collision model <CollisionModel>, Solutions <list of IKSolution>
+# OUTPUTS: Solutions without collisions <list of IKSolution>, Number of removed solutions <int>
+def filterSolutions(model, solutions):
+    candidates = [solution for solution in solutions if solution.success]
+    if not candidates: return list(solutions), 0
+    colliding = model.check(np.array([solution.q for solution in candidates])).colliding
+    free = [solution for solution, collision in zip(candidates, colliding) if not collision]
+    return free, len(candidates) - len(free)
+
+# Reads box obstacles from a csv file, rows Name, X_min, Y_min, Z_min, X_max, Y_max, Z_max (a header line is skipped)
+# INPUTS: File path <string>
+# OUTPUTS: Obstacles <list of Box>
+def readObstacles(file_path):
+    obstacles = []
+    with open(file_path, mode='r', newline='') as file:
+        for line_number, line in enumerate(csv.reader(file)):
+            if not line: continue
+            try:
+                values = [float(value) for value in line[1:7]]
+            except ValueError:
+                if line_number == 0: continue
+                raise ValueError("Invalid obstacle in line " + str(line_number+1) + ": " + ",".join(line))
+            if len(values) != 6:
+                raise ValueError("Obstacle in line " + str(line_number+1) + " needs a name and 6 values")
+            obstacles.append(Box(values[:3], values[3:], line[0]))
+    return obstacles
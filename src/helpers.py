@@ -1,25 +1,98 @@
 ###############################################
 # Helper funktions for inverse kinematic ui
-# Version: 0.1
+# Version: 0.2
 # Author: Benedikt Fassian
-# Date: 04.01.2024
+# Date: 17.10.2026
 ###############################################
 
 from math import pi
+from functools import lru_cache
+import re
+
+# Tokens of input equations: numbers, pi, operators and parentheses
+_token_pattern = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|(pi)|(\*\*|[-+*/()]))")
 
 # Converts string input or equation to float
 # INPUTS: String to parse <string>
 # OUTPUTS: Result <float>
 def parseInputString(value):
+    return _compileExpression(value)
+
+# Parses an equation once, results are cached by input string
+# Supports numbers, pi, + - * / ** and parentheses (decimal comma or point)
+# INPUTS: Equation <string>
+# OUTPUTS: Result <float>
+@lru_cache(maxsize=65536)
+def _compileExpression(value):
     # Set empty value to "0"
-    if value=="": value="0"
+    if value.strip() == "": return 0.0
     # Replace , with .
-    value = value.replace(",", ".")
-    # Solve equations
-    try:
-        value = eval(value)
-    except: 
-        raise
-    # Convert value to float
-    value = float(value)
-    return value
\ No newline at end of file
+    tokens = _tokenize(value.replace(",", "."))
+    result, position = _parseSum(tokens, 0)
+    if position != len(tokens):
+        raise ValueError("Invalid equation: " + value)
+    return float(result)
+
+# Splits an equation into tokens
+def _tokenize(value):
+    tokens = []
+    position = 0
+    value = value.rstrip()
+    while position < len(value):
+        match = _token_pattern.match(value, position)
+        if not match:
+            raise ValueError("Invalid equation: " + value)
+        number, constant, operator = match.groups()
+        if number is not None: tokens.append(float(number))
+        elif constant is not None: tokens.append(pi)
+        else: tokens.append(operator)
+        position = match.end()
+    return tokens
+
+# sum := product (("+" | "-") product)*
+def _parseSum(tokens, position):
+    result, position = _parseProduct(tokens, position)
+    while position < len(tokens) and tokens[position] in ("+", "-"):
+        operator = tokens[position]
+        right, position = _parseProduct(tokens, position+1)
+        result = result + right if operator == "+" else result - right
+    return result, position
+
+# product := unary (("*" | "/") unary)*
+def _parseProduct(tokens, position):
+    result, position = _parseUnary(tokens, position)
+    while position < len(tokens) and tokens[position] in ("*", "/"):
+        operator = tokens[position]
+        right, position = _parseUnary(tokens, position+1)
+        result = result * right if operator == "*" else result / right
+    return result, position
+
+# unary := ("+" | "-") unary | power
+def _parseUnary(tokens, position):
+    if position < len(tokens) and tokens[position] in ("+", "-"):
+        operator = tokens[position]
+        result, position = _parseUnary(tokens, position+1)
+        return (result if operator == "+" else -result), position
+    return _parsePower(tokens, position)
+
+# power := atom ("**" unary)?
+def _parsePower(tokens, position):
+    result, position = _parseAtom(tokens, position)
+    if position < len(tokens) and tokens[position] == "**":
+        exponent, position = _parseUnary(tokens, position+1)
+        result = result ** exponent
+    return result, position
+
+# atom := number | pi | "(" sum ")"
+def _parseAtom(tokens, position):
+    if position >= len(tokens):
+        raise ValueError("Unexpected end of equation")
+    token = tokens[position]
+    if isinstance(token, float):
+        return token, position+1
+    if token == "(":
+        result, position = _parseSum(tokens, position+1)
+        if position >= len(tokens) or tokens[position] != ")":
+            raise ValueError("Missing closing parenthesis")
+        return result, position+1
+    raise ValueError("Unexpected token: " + str(token))
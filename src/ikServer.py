@@ -0,0 +1,294 @@
+###############################################
+# Local IK service
+# Serves IK, FK and batch requests as JSON over HTTP (localhost or Unix socket)
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import asyncio
+import json
+import os
+import stat
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from src.presets import PRESET_LABELS, PresetRegistry
+from src.modelCache import ModelCache, dhTableKey
+from src.robotLibrary import validateRobot
+from src.robotModel import SOLVERS, createRobot, targetTransform, solveIK, solverChain
+from src.kinematics import DHChain
+from src.multiStart import solveMultiStart
+from src.batchIK import solveChunk
+
+# Default address and largest accepted request body
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_BODY = 64 * 1024 * 1024
+# Largest number of uploaded DH tables kept by the server (least recently used are dropped)
+MAX_TABLES = 256
+# Search modes of IK requests
+SEARCH_MODES = ["single", "multi", "all"]
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+# Warm robot models of a worker (presets and uploaded DH tables)
+_worker = {}
+
+# Initializes a worker, builds the given presets and their solver chains
+def _initWorker(presets):
+    _worker["presets"] = PresetRegistry()
+    _worker["models"] = ModelCache(max_size=64)
+    for label in presets:
+        _getModel(("preset", label))
+
+# Returns the robot and DH chain of a model spec ("preset", label) or ("dh", key, dh_params)
+def _getModel(spec):
+    if "models" not in _worker: _initWorker([])
+    if spec[0] == "preset":
+        build = lambda: _prepare(_worker["presets"].getDH(spec[1]))
+        return _worker["models"].get("preset:" + spec[1], build)
+    return _worker["models"].get(spec[1], lambda: _prepare(createRobot(spec[2])))
+
+# Builds the cached parts of a robot (solver chain and vectorized FK)
+def _prepare(robot):
+    solverChain(robot)
+    return robot, DHChain.fromRobot(robot)
+
+# Runs a request inside a worker and adds timing metadata
+def _run(function, spec, received, options):
+    start = time.time()
+    timing = {"queue_ms": (start - received) * 1000}
+    begin = time.perf_counter()
+    robot, chain = _getModel(spec)
+    timing["model_ms"] = (time.perf_counter() - begin) * 1000
+    begin = time.perf_counter()
+    result = function(robot, chain, **options)
+    timing["solve_ms"] = (time.perf_counter() - begin) * 1000
+    result["timing"] = timing
+    return result
+
+# Joint positions of a request <Mxn array>, raises ValueError if a position does not have n values
+def _jointPositions(robot, q, name="q"):
+    q = np.atleast_2d(np.asarray(q, dtype=float))
+    if q.ndim != 2 or q.shape[1] != robot.n: raise ValueError(name + " needs " + str(robot.n) + " values per joint position")
+    return q
+
+# Inverse kinematics of one target
+def _solveIK(robot, chain, target, q0=None, solver="IK_LM", joint_limits=True, search="single", starts=16):
+    q0 = np.zeros(robot.n) if q0 is None else _jointPositions(robot, q0, "q0")[0]
+    transform = targetTransform(target)
+    if search == "single":
+        solutions = [solveIK(robot, solver, transform, q0, joint_limits)]
+    else:
+        solutions = solveMultiStart(robot, solver, transform, q0, starts, joint_limits, all_branches=search == "all")
+    return {
+        "success": bool(solutions and solutions[0].success),
+        "solutions": [{"q": np.asarray(s.q).tolist(), "success": bool(s.success), "residual": float(s.residual), "iterations": int(s.iterations), "searches": int(s.searches)} for s in solutions],
+    }
+
+# Forward kinematics of one or more joint positions
+def _solveFK(robot, chain, q):
+    poses = chain.fkineXYZABC(_jointPositions(robot, q))
+    return {"pose": poses.tolist()}
+
+# Inverse kinematics of many targets
+def _solveBatch(robot, chain, targets, q0=None, solver="IK_LM", joint_limits=True):
+    if q0 is not None: q0 = _jointPositions(robot, q0, "q0")[0]
+    result = solveChunk(robot, np.asarray(targets, dtype=float).reshape(-1, 6), solver, q0, joint_limits)
+    return {"q": result.q.tolist(), "success": result.success.tolist(), "residual": result.residual.tolist(), "iterations": result.iterations.tolist()}
+
+# Error with HTTP status (returned as JSON)
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# asyncio HTTP server, requests are solved in a worker pool
+class IKServer:
+    def __init__(self, workers=1, presets=None):
+        # Presets that are built when the workers start
+        self.presets = [label for label in (PRESET_LABELS if presets is None else presets) if label != "-"]
+        self.workers = workers
+        # Uploaded DH tables by key
+        self.tables = ModelCache(max_size=MAX_TABLES)
+        self.requests = 0
+        self._executor = None
+        # Path and inode of the Unix socket created by this server (removed in close)
+        self._socket = None
+
+    # Starts the worker pool (0 workers: one thread in the server process)
+    def start(self):
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_initWorker, initargs=(self.presets,))
+            # Start all worker processes now instead of on the first requests
+            futures = [self._executor.submit(time.sleep, 0.1) for _ in range(self.workers)]
+            for future in futures: future.result()
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=1, initializer=_initWorker, initargs=(self.presets,))
+            self._executor.submit(time.sleep, 0).result()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        # Only remove the own socket, not a file that replaced it meanwhile
+        if self._socket is not None:
+            path, inode = self._socket
+            try:
+                info = os.lstat(path)
+                if stat.S_ISSOCK(info.st_mode) and info.st_ino == inode: os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._socket = None
+
+    # Serves until cancelled
+    # INPUTS: Host <string>, Port <int>, Unix socket path <string> (replaces host and port)
+    async def serve(self, host=HOST, port=PORT, unix_path=None):
+        if self._executor is None: self.start()
+        if unix_path:
+            server = await asyncio.start_unix_server(self._handleConnection, path=unix_path)
+            self._socket = (unix_path, os.lstat(unix_path).st_ino)
+        else:
+            server = await asyncio.start_server(self._handleConnection, host, port)
+        address = unix_path or (host + ":" + str(server.sockets[0].getsockname()[1]))
+        print("IK-Server läuft auf " + address + " (" + str(self.workers) + " Worker)", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    # Handles the requests of one connection (keep-alive)
+    async def _handleConnection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self._readRequest(reader)
+                except RequestError as e:
+                    await self._writeResponse(writer, e.status, {"error": str(e)}, False)
+                    break
+                if request is None: break
+                method, path, body, keep_alive = request
+                received = time.time()
+                try:
+                    payload = json.loads(body) if body else {}
+                    status, result = 200, await self.handle(method, path, payload, received)
+                except RequestError as e:
+                    status, result = e.status, {"error": str(e)}
+                except (ValueError, KeyError, TypeError) as e:
+                    status, result = 400, {"error": str(e)}
+                except Exception as e:
+                    status, result = 500, {"error": str(e)}
+                if isinstance(result, dict) and "timing" in result:
+                    result["timing"]["total_ms"] = (time.time() - received) * 1000
+                await self._writeResponse(writer, status, result, keep_alive)
+                if not keep_alive: break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    # Reads one HTTP request, returns None if the connection was closed
+    async def _readRequest(self, reader):
+        line = await reader.readline()
+        if not line: return None
+        try:
+            method, path, version = line.decode("latin-1").split()
+        except ValueError:
+            raise RequestError(400, "Invalid request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""): break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise RequestError(400, "Invalid Content-Length")
+        if length < 0: raise RequestError(400, "Invalid Content-Length")
+        if length > MAX_BODY: raise RequestError(413, "Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method, path, body, keep_alive
+
+    async def _writeResponse(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode("utf-8")
+        head = "HTTP/1.1 " + str(status) + " " + _REASONS.get(status, "") + "\r\nContent-Type: application/json\r\nContent-Length: " + str(len(body)) + "\r\nConnection: " + ("keep-alive" if keep_alive else "close") + "\r\n\r\n"
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    # Dispatches a request
+    # INPUTS: HTTP method <string>, Path <string>, JSON payload <dict>, Receive time <float>
+    # OUTPUTS: JSON result <dict>
+    async def handle(self, method, path, payload, received=None):
+        received = received or time.time()
+        self.requests += 1
+        if not isinstance(payload, dict): raise RequestError(400, "Request body must be a JSON object")
+        path = path.split("?")[0].rstrip("/")
+        if path == "/health":
+            return {"status": "ok", "workers": self.workers, "requests": self.requests}
+        if path == "/robots":
+            if method == "GET":
+                return {"presets": self.presets, "robots": self.tables.keys()}
+            if method == "POST":
+                return {"robot": self.addTable(payload.get("dh"))}
+            raise RequestError(405, "Use GET or POST")
+        if method != "POST": raise RequestError(405, "Use POST")
+        spec = self._modelSpec(payload)
+        if path == "/ik":
+            solver = payload.get("solver", "IK_LM")
+            search = payload.get("search", "single")
+            if solver not in SOLVERS: raise ValueError("Unknown solver: " + str(solver))
+            if search not in SEARCH_MODES: raise ValueError("Unknown search mode: " + str(search))
+            options = {"target": self._vector(payload["target"], 6), "q0": payload.get("q0"), "solver": solver, "joint_limits": bool(payload.get("joint_limits", True)), "search": search, "starts": int(payload.get("starts", 16))}
+            return await self._submit(_solveIK, spec, received, options)
+        if path == "/fk":
+            return await self._submit(_solveFK, spec, received, {"q": payload["q"]})
+        if path == "/batch":
+            solver = payload.get("solver", "IK_LM")
+            if solver not in SOLVERS: raise ValueError("Unknown solver: " + str(solver))
+            options = {"targets": payload["targets"], "q0": payload.get("q0"), "solver": solver, "joint_limits": bool(payload.get("joint_limits", True))}
+            return await self._submit(_solveBatch, spec, received, options)
+        raise RequestError(404, "Unknown path: " + path)
+
+    # Stores a DH table [[θ, d, a, alpha, min, max, type], ...] (values as numbers or expressions)
+    # OUTPUTS: Robot key <string>
+    def addTable(self, rows):
+        if not rows: raise ValueError("Missing DH table")
+        if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+            raise ValueError("DH table must be a list of rows [θ, d, a, alpha, min, max, type]")
+        rows = [[str(value) for value in row] for row in rows]
+        key = dhTableKey(rows)
+        # Checks the number of values per row, the values and joint limits (raises ValueError)
+        self.tables.get(key, lambda: validateRobot(rows))
+        return key
+
+    # Returns the model spec of a request (preset label, uploaded robot key or inline DH table)
+    def _modelSpec(self, payload):
+        if "dh" in payload:
+            key = self.addTable(payload["dh"])
+            return ("dh", key, self.tables.lookup(key))
+        robot = payload.get("robot")
+        if robot in self.presets:
+            return ("preset", robot)
+        dh_params = self.tables.lookup(robot)
+        if dh_params is not None:
+            return ("dh", robot, dh_params)
+        raise RequestError(404, "Unknown robot: " + str(robot))
+
+    @staticmethod
+    def _vector(values, length):
+        values = [float(value) for value in values]
+        if len(values) != length: raise ValueError("Expected " + str(length) + " values")
+        return values
+
+    async def _submit(self, function, spec, received, options):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _run, function, spec, received, options)
+
+# Removes a stale Unix socket file, any other file at the path is kept
+# INPUTS: Unix socket path <string>
+def removeSocket(unix_path):
+    if not unix_path or not os.path.lexists(unix_path): return
+    if not stat.S_ISSOCK(os.lstat(unix_path).st_mode):
+        raise FileExistsError(unix_path + " exists and is not a socket")
+    os.remove(unix_path)
@@ -0,0 +1,90 @@
+###############################################
+# Cartesian jogging
+# Damped differential IK (resolved rate) from the current joint position
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import numpy as np
+
+# Control rate (Hz)
+JOG_RATE = 60
+# End effector speed at full input (m/s, rad/s)
+LINEAR_SPEED = 0.1
+ANGULAR_SPEED = 0.5
+# Largest joint velocity (rad/s or m/s)
+JOINT_VELOCITY = 1.0
+# Damping of the least squares solution (keeps the joint velocities bounded near singularities)
+DAMPING = 0.05
+# Keys: keysym -> (axis [X, Y, Z, A, B, C], direction)
+KEYS = {
+    "Right": (0, 1), "Left": (0, -1),
+    "Up": (1, 1), "Down": (1, -1),
+    "Prior": (2, 1), "Next": (2, -1),
+    "q": (3, 1), "a": (3, -1),
+    "w": (4, 1), "s": (4, -1),
+    "e": (5, 1), "d": (5, -1),
+}
+
+# Jogs the end effector of a DH chain, input events only change the commanded velocity,
+# the joint position is integrated once per control step
+class JogController:
+    def __init__(self, chain, q, joint_limits=True, tool_frame=False):
+        self.chain = chain
+        self.q = np.array(q, dtype=float)
+        self.joint_limits = joint_limits
+        # Velocities in the tool frame instead of the base frame
+        self.tool_frame = tool_frame
+        # Slider values and held keys (-1 ... 1 per axis)
+        self.axes = np.zeros(6)
+        self.keys = {}
+        self.scale = np.array([LINEAR_SPEED]*3 + [ANGULAR_SPEED]*3)
+
+    # Sets the input of an axis (slider)
+    def setAxis(self, axis, value):
+        self.axes[axis] = value
+
+    # Key pressed or released, returns False for keys without a jog axis
+    def setKey(self, key, pressed):
+        if key not in KEYS: return False
+        if pressed: self.keys[key] = KEYS[key]
+        else: self.keys.pop(key, None)
+        return True
+
+    # Stops all axes
+    def stop(self):
+        self.axes[:] = 0
+        self.keys.clear()
+
+    # Commanded end effector velocity [vx, vy, vz, wx, wy, wz] (sliders and keys)
+    def command(self):
+        command = self.axes.copy()
+        for axis, direction in self.keys.values():
+            command[axis] += direction
+        return np.clip(command, -1, 1) * self.scale
+
+    # One control step: joint velocities from the damped least squares solution of J dq = v
+    # INPUTS: Time step <float> (s)
+    # OUTPUTS: Moved <bool>
+    def step(self, dt):
+        v = self.command()
+        if not np.any(v): return False
+        T, J = self.chain.fkineJacob0(self.q)
+        J = J[0]
+        if self.tool_frame:
+            R = T[0, :3, :3]
+            v = np.concatenate([R @ v[:3], R @ v[3:]])
+        dq = J.T @ np.linalg.solve(J @ J.T + DAMPING**2 * np.eye(6), v)
+        # Keep the joint velocities below the limit (direction of the motion is kept)
+        fastest = np.max(np.abs(dq))
+        if fastest > JOINT_VELOCITY: dq *= JOINT_VELOCITY / fastest
+        q = self.q + dq * dt
+        if self.joint_limits: q = np.clip(q, self.chain.qlim[0], self.chain.qlim[1])
+        moved = not np.array_equal(q, self.q)
+        self.q = q
+        return moved
+
+    # Current end effector pose
+    # OUTPUTS: Pose [X, Y, Z, A, B, C] <array>
+    def pose(self):
+        return self.chain.fkineXYZABC(self.q)[0].copy()
@@ -0,0 +1,202 @@
+###############################################
+# Vectorized forward kinematics
+# Evaluates DH chains for many joint positions at once with NumPy
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import numpy as np
+
+# Converts poses to positions and euler angles (same 'XYZ' convention as the target input)
+# INPUTS: Poses <Mx4x4 array>, Output buffer <Mx6 array> (optional)
+# OUTPUTS: Poses [X, Y, Z, A, B, C] <Mx6 array>
+def posesToXYZABC(T, out=None):
+    if out is None: out = np.empty((len(T), 6))
+    out[:, :3] = T[:, :3, 3]
+    # R = Rx(A) * Ry(B) * Rz(C)
+    out[:, 4] = np.arcsin(np.clip(T[:, 0, 2], -1.0, 1.0))
+    out[:, 3] = np.arctan2(-T[:, 1, 2], T[:, 2, 2])
+    out[:, 5] = np.arctan2(-T[:, 0, 1], T[:, 0, 0])
+    # Gimbal lock (B = ±pi/2): only A ± C is defined, C is set to 0
+    locked = np.abs(T[:, 0, 2]) > 1 - 1e-12
+    if np.any(locked):
+        out[locked, 3] = np.arctan2(T[locked, 2, 1], T[locked, 1, 1])
+        out[locked, 5] = 0.0
+    return out
+
+# Standard DH chain with arrays of link parameters
+class DHChain:
+    def __init__(self, theta, d, a, alpha, revolute, qlim=None, offset=None, base=None, tool=None):
+        self.theta = np.asarray(theta, dtype=float)
+        self.d = np.asarray(d, dtype=float)
+        self.a = np.asarray(a, dtype=float)
+        self.alpha = np.asarray(alpha, dtype=float)
+        self.revolute = np.asarray(revolute, dtype=bool)
+        self.n = len(self.theta)
+        self.qlim = np.asarray(qlim, dtype=float) if qlim is not None else np.tile([[-np.pi], [np.pi]], self.n)
+        self.offset = np.zeros(self.n) if offset is None else np.asarray(offset, dtype=float)
+        self.base = None if base is None or np.allclose(base, np.eye(4)) else np.asarray(base, dtype=float)
+        self.tool = None if tool is None or np.allclose(tool, np.eye(4)) else np.asarray(tool, dtype=float)
+        self._cos_alpha = np.cos(self.alpha)
+        self._sin_alpha = np.sin(self.alpha)
+        # Reused buffers per number of joint positions
+        self._buffers = {}
+
+    # Creates a chain from DH params (see robotModel.parseDHTable)
+    # INPUTS: DH params (θ, d, a, alpha, min, max, type) <list of tuples>
+    @classmethod
+    def fromDHParams(cls, dh_params):
+        theta, d, a, alpha, q_min, q_max, joint_type = zip(*dh_params)
+        revolute = [t == "Rotation" for t in joint_type]
+        return cls(theta, d, a, alpha, revolute, qlim=[q_min, q_max])
+
+    # Creates a chain from a robot object (standard DH only)
+    # INPUTS: Robot <DHRobot>
+    @classmethod
+    def fromRobot(cls, robot):
+        if getattr(robot, "mdh", False):
+            raise ValueError("Modified DH parameters are not supported")
+        links = robot.links
+        return cls([link.theta for link in links], [link.d for link in links], [link.a for link in links], [link.alpha for link in links],
+                   [link.isrevolute for link in links], qlim=robot.qlim, offset=[link.offset for link in links], base=robot.base.A, tool=robot.tool.A)
+
+    # Returns reused work buffers for M joint positions
+    def _workspace(self, count):
+        buffers = self._buffers.get(count)
+        if buffers is None:
+            link = np.zeros((count, 4, 4))
+            link[:, 3, 3] = 1
+            buffers = self._buffers[count] = {"link": link, "T": np.empty((count, 4, 4)), "tmp": np.empty((count, 4, 4)), "pose": np.empty((count, 6))}
+            # Keep only a few sizes
+            if len(self._buffers) > 8: self._buffers.pop(next(iter(self._buffers)))
+        return buffers
+
+    # Writes the link transformations of joint i into the buffer
+    def _linkTransforms(self, i, q, A):
+        q = q + self.offset[i]
+        if self.revolute[i]:
+            ct, st = np.cos(q), np.sin(q)
+            d = self.d[i]
+        else:
+            ct, st = np.cos(self.theta[i]), np.sin(self.theta[i])
+            d = q
+        ca, sa, a = self._cos_alpha[i], self._sin_alpha[i], self.a[i]
+        A[:, 0, 0] = ct
+        A[:, 0, 1] = -st*ca
+        A[:, 0, 2] = st*sa
+        A[:, 0, 3] = a*ct
+        A[:, 1, 0] = st
+        A[:, 1, 1] = ct*ca
+        A[:, 1, 2] = -ct*sa
+        A[:, 1, 3] = a*st
+        A[:, 2, 1] = sa
+        A[:, 2, 2] = ca
+        A[:, 2, 3] = d
+
+    # Forward kinematics for many joint positions
+    # Without out the result is written to an internal buffer that is reused by the next call
+    # INPUTS: Joint positions <Mxn array>, Output buffer <Mx4x4 array> (optional)
+    # OUTPUTS: Poses <Mx4x4 array>
+    def fkine(self, Q, out=None):
+        Q = np.asarray(Q, dtype=float).reshape(-1, self.n)
+        buffers = self._workspace(len(Q))
+        A, T, tmp = buffers["link"], buffers["T"], buffers["tmp"]
+        if out is None: out = T
+        if self.base is None:
+            self._linkTransforms(0, Q[:, 0], out)
+            out[:, 2, 0] = 0
+            out[:, 3, :] = (0, 0, 0, 1)
+        else:
+            self._linkTransforms(0, Q[:, 0], A)
+            np.matmul(self.base, A, out=out)
+        for i in range(1, self.n):
+            self._linkTransforms(i, Q[:, i], A)
+            np.matmul(out, A, out=tmp)
+            out[...] = tmp
+        if self.tool is not None:
+            np.matmul(out, self.tool, out=tmp)
+            out[...] = tmp
+        return out
+
+    # Forward kinematics with deviations of the link parameters (e.g. tolerance samples), every joint position
+    # has its own parameter set, so no chain object is built per sample; joint positions and deviations are broadcast
+    # INPUTS: Joint positions <Mxn or n array>, Deviations of θ, d, a, alpha <Mxn arrays or None>
+    # OUTPUTS: Poses <Mx4x4 array>
+    def fkineDeviations(self, Q, dtheta=None, dd=None, da=None, dalpha=None):
+        Q = np.atleast_2d(np.asarray(Q, dtype=float))
+        count = max(len(x) for x in (Q, dtheta, dd, da, dalpha) if x is not None)
+        Q = np.broadcast_to(Q, (count, self.n)) + self.offset
+        # Joint variable is θ (revolute) or d (prismatic)
+        theta = np.where(self.revolute, Q, self.theta)
+        d = np.where(self.revolute, self.d, Q)
+        a = np.broadcast_to(self.a, (count, self.n))
+        alpha = np.broadcast_to(self.alpha, (count, self.n))
+        if dtheta is not None: theta = theta + dtheta
+        if dd is not None: d = d + dd
+        if da is not None: a = a + da
+        if dalpha is not None: alpha = alpha + dalpha
+        ct, st, ca, sa = np.cos(theta), np.sin(theta), np.cos(alpha), np.sin(alpha)
+        # Link transformations of all samples and joints at once
+        A = np.zeros((count, self.n, 4, 4))
+        A[..., 0, 0] = ct
+        A[..., 0, 1] = -st*ca
+        A[..., 0, 2] = st*sa
+        A[..., 0, 3] = a*ct
+        A[..., 1, 0] = st
+        A[..., 1, 1] = ct*ca
+        A[..., 1, 2] = -ct*sa
+        A[..., 1, 3] = a*st
+        A[..., 2, 1] = sa
+        A[..., 2, 2] = ca
+        A[..., 2, 3] = d
+        A[..., 3, 3] = 1
+        T = A[:, 0] if self.base is None else self.base @ A[:, 0]
+        for i in range(1, self.n):
+            T = T @ A[:, i]
+        if self.tool is not None: T = T @ self.tool
+        return T
+
+    # Forward kinematics as positions and euler angles 'XYZ'
+    # Without out the result is written to an internal buffer that is reused by the next call
+    # INPUTS: Joint positions <Mxn array>, Output buffer <Mx6 array> (optional)
+    # OUTPUTS: Poses [X, Y, Z, A, B, C] <Mx6 array>
+    def fkineXYZABC(self, Q, out=None):
+        Q = np.asarray(Q, dtype=float).reshape(-1, self.n)
+        T = self.fkine(Q)
+        if out is None: out = self._workspace(len(Q))["pose"]
+        return posesToXYZABC(T, out)
+
+    # Base frame and frames of all links for many joint positions (without tool)
+    # INPUTS: Joint positions <Mxn array>
+    # OUTPUTS: Frames <Mx(n+1)x4x4 array>
+    def frames(self, Q):
+        Q = np.asarray(Q, dtype=float).reshape(-1, self.n)
+        A = self._workspace(len(Q))["link"]
+        F = np.empty((len(Q), self.n + 1, 4, 4))
+        F[:, 0] = np.eye(4) if self.base is None else self.base
+        for i in range(self.n):
+            self._linkTransforms(i, Q[:, i], A)
+            np.matmul(F[:, i], A, out=F[:, i + 1])
+        return F
+
+    # Geometric Jacobians in the base frame for many joint positions (same as DHRobot.jacob0)
+    # INPUTS: Joint positions <Mxn array>
+    # OUTPUTS: Jacobians [vx, vy, vz, wx, wy, wz] x joints <Mx6xn array>
+    def jacob0(self, Q):
+        return self.fkineJacob0(Q)[1]
+
+    # Forward kinematics and Jacobians from one evaluation of the link frames
+    # INPUTS: Joint positions <Mxn array>
+    # OUTPUTS: Poses <Mx4x4 array>, Jacobians <Mx6xn array>
+    def fkineJacob0(self, Q):
+        F = self.frames(Q)
+        # Joint axes and origins (frame i-1 of joint i)
+        z = F[:, :-1, :3, 2]
+        o = F[:, :-1, :3, 3]
+        T = F[:, -1] if self.tool is None else F[:, -1] @ self.tool
+        J = np.zeros((len(F), 6, self.n))
+        revolute, prismatic = self.revolute, ~self.revolute
+        J[:, :3, revolute] = np.cross(z[:, revolute], T[:, None, :3, 3] - o[:, revolute]).transpose(0, 2, 1)
+        J[:, 3:, revolute] = z[:, revolute].transpose(0, 2, 1)
+        J[:, :3, prismatic] = z[:, prismatic].transpose(0, 2, 1)
+        return T, J
@@ -0,0 +1,62 @@
+###############################################
+# Manipulability and singularity check
+# Manipulability, condition number and singularity flag for many joint positions at once
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import numpy as np
+
+# Condition number of the Jacobian above which a position counts as near singular
+CONDITION_LIMIT = 1000.0
+
+# Manipulability of sampled joint positions (e.g. a trajectory)
+class Manipulability:
+    def __init__(self, manipulability, condition, singular):
+        # Yoshikawa manipulability, condition number of the Jacobian <M arrays>
+        self.manipulability = manipulability
+        self.condition = condition
+        # Near singular samples <M bool array>
+        self.singular = singular
+
+    def __len__(self): return len(self.manipulability)
+
+    # Index of the sample closest to a singularity
+    @property
+    def worst(self): return int(np.argmax(self.condition))
+
+    # Overview for a trajectory or sample set
+    # OUTPUTS: Summary (min manipulability, max condition number, count and first index of near singular samples) <dict>
+    def summary(self):
+        singular = np.flatnonzero(self.singular)
+        return {
+            "samples": len(self),
+            "min_manipulability": float(np.min(self.manipulability, initial=np.inf)),
+            "max_condition": float(np.max(self.condition, initial=0.0)),
+            "singular": len(singular),
+            "first_singular": int(singular[0]) if len(singular) else None,
+        }
+
+# Manipulability, condition number and singularity flag of many joint positions
+# (one batched Jacobian and singular value decomposition instead of a toolbox call per position)
+# INPUTS: DH chain <DHChain>, Joint positions <Mxn array>, Condition number limit <float>
+# OUTPUTS: Result <Manipulability>
+def manipulabilityMap(chain, Q, condition_limit=CONDITION_LIMIT):
+    s = np.linalg.svd(chain.jacob0(Q), compute_uv=False)
+    # Product of the singular values = sqrt(det(J J^T)) for robots with >= 6 joints
+    manipulability = np.prod(s, axis=1)
+    with np.errstate(divide="ignore"):
+        condition = s[:, 0] / s[:, -1]
+    return Manipulability(manipulability, condition, condition > condition_limit)
+
+# Scores the samples of a joint trajectory (see trajectory.jointTrajectory)
+# INPUTS: DH chain <DHChain>, Trajectory <Trajectory or Mxn array>, Condition number limit <float>
+# OUTPUTS: Result <Manipulability>
+def scoreTrajectory(chain, trajectory, condition_limit=CONDITION_LIMIT):
+    return manipulabilityMap(chain, getattr(trajectory, "q", trajectory), condition_limit)
+
+# Checks a single joint position
+# INPUTS: DH chain <DHChain>, Joint position <n array>, Condition number limit <float>
+# OUTPUTS: Near singular <bool>
+def isNearSingular(chain, q, condition_limit=CONDITION_LIMIT):
+    return bool(manipulabilityMap(chain, q, condition_limit).singular[0])
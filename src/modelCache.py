@@ -0,0 +1,84 @@
+###############################################
+# Model cache for inverse kinematic ui
+# Reuses robot objects for unchanged DH tables
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import collections
+import hashlib
+import threading
+
+# Normalizes a DH table cell (whitespace, decimal comma, empty value)
+def _normalizeCell(value):
+    value = "".join(str(value).split()).replace(",", ".")
+    return value if value != "" else "0"
+
+# Creates the cache key of a DH table
+# INPUTS: Rows [θ, d, a, alpha, min, max, type] <list of lists of strings>
+# OUTPUTS: Key <string>
+def dhTableKey(rows):
+    text = "\n".join("|".join(_normalizeCell(value) for value in row) for row in rows)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+# Creates a key of parsed DH params (independent of the input notation, e.g. "pi/2" or "1.5708")
+# INPUTS: DH params (θ, d, a, alpha, min, max, type) <list of tuples>
+# OUTPUTS: Key <string>
+def dhParamsKey(dh_params):
+    text = "\n".join("|".join(("%.12g" % value) if isinstance(value, float) else str(value) for value in row) for row in dh_params)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+# Least recently used cache of robot objects
+class ModelCache:
+    def __init__(self, max_size=16):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._models = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key): return key in self._models
+
+    def __len__(self): return len(self._models)
+
+    # Keys from least to most recently used
+    def keys(self):
+        with self._lock:
+            return list(self._models)
+
+    # Returns the cached robot or None
+    # INPUTS: Key <string>
+    # OUTPUTS: Robot <DHRobot> or None
+    def lookup(self, key):
+        with self._lock:
+            if key not in self._models: return None
+            self.hits += 1
+            self._models.move_to_end(key)
+            return self._models[key]
+
+    # Returns the cached robot or builds and stores a new one
+    # INPUTS: Key <string>, Function that builds the robot <function>
+    # OUTPUTS: Robot <DHRobot>
+    def get(self, key, build):
+        with self._lock:
+            if key in self._models:
+                self.hits += 1
+                self._models.move_to_end(key)
+                return self._models[key]
+            self.misses += 1
+        # Build outside of the lock (can be slow)
+        robot = build()
+        with self._lock:
+            self._models[key] = robot
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+        return robot
+
+    # Removes a robot (or all robots) from the cache
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._models.clear()
+            else:
+                self._models.pop(key, None)
@@ -0,0 +1,67 @@
+###############################################
+# Multi-start inverse kinematics
+# Solves from several start positions and ranks the solutions
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import numpy as np
+from src.robotModel import solveIK
+from src.analyticIK import ANALYTIC_SOLVER, analyticSolutions
+
+# Creates start positions: user start, previous solutions, random positions within the limits
+# INPUTS: Robot <DHRobot>, Start position <list>, Number of starts <int>, Previous solutions <list of lists>, Random generator
+# OUTPUTS: Start positions <Nxn array>
+def createSeeds(robot, q_start, count, previous=(), rng=None):
+    rng = rng if rng is not None else np.random.default_rng()
+    seeds = [np.asarray(q_start, dtype=float)]
+    # Newest previous solutions first
+    for q in reversed(list(previous)):
+        if len(seeds) >= count: break
+        seeds.append(np.asarray(q, dtype=float))
+    if len(seeds) < count:
+        qlim = robot.qlim
+        seeds.extend(rng.uniform(qlim[0], qlim[1], (count - len(seeds), robot.n)))
+    return np.array(seeds[:count])
+
+# Joint distance with angles wrapped to [-pi, pi] for revolute joints
+def jointDistance(robot, q1, q2):
+    difference = np.asarray(q1, dtype=float) - np.asarray(q2, dtype=float)
+    revolute = np.array(robot.revolutejoints, dtype=bool)
+    difference[..., revolute] = (difference[..., revolute] + np.pi) % (2*np.pi) - np.pi
+    return np.linalg.norm(difference, axis=-1)
+
+# Sorts solutions: successful first, then by distance to the start position and residual
+def rankSolutions(robot, solutions, q_start):
+    return sorted(solutions, key=lambda s: (not s.success, float(jointDistance(robot, s.q, q_start)) if s.success else s.residual, s.residual))
+
+# Removes solutions of the same branch (equal joint positions)
+def distinctSolutions(robot, solutions, tolerance=0.05):
+    distinct = []
+    for solution in solutions:
+        if all(jointDistance(robot, solution.q, other.q) > tolerance for other in distinct):
+            distinct.append(solution)
+    return distinct
+
+# Solves one target from many start positions
+# INPUTS: Robot <DHRobot>, Solver name <string>, Target <4x4 array>, Start position <list>, Number of starts <int>,
+#         Limits active <bool>, Previous solutions <list>, Return all branches <bool>, Cancel check <function>
+# OUTPUTS: Ranked solutions <list of IKSolution> (first one is the best, empty if cancelled)
+def solveMultiStart(robot, solver, target, q_start, starts=16, joint_limits=True, previous=(), all_branches=False, is_cancelled=None, seed=None):
+    # All branches at once if there is a closed-form solution
+    if solver == ANALYTIC_SOLVER:
+        solutions = analyticSolutions(robot, target, q_start, joint_limits)
+        if solutions: return solutions if all_branches else solutions[:1]
+    rng = np.random.default_rng(seed)
+    solutions = []
+    for q0 in createSeeds(robot, q_start, starts, previous, rng):
+        if is_cancelled and is_cancelled(): return []
+        # One search per start position, the start positions replace the random restarts of the solver
+        result = solveIK(robot, solver, target, q0, joint_limits, slimit=1)
+        solutions.append(result)
+        # Stop early with the first solution within tolerance
+        if result.success and not all_branches: break
+    ranked = rankSolutions(robot, solutions, q_start)
+    if all_branches:
+        return distinctSolutions(robot, [s for s in ranked if s.success]) or ranked[:1]
+    return ranked
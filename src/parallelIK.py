@@ -0,0 +1,78 @@
+###############################################
+# Parallel batch inverse kinematics
+# Splits target sets across worker processes
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import collections
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.robotModel import createRobot
+from src.batchIK import solveChunk
+
+# Robot and solver settings of a worker process (built once per worker)
+_worker = {}
+
+# Initializes a worker process
+def _initWorker(dh_params, solver, q0, joint_limits):
+    _worker["robot"] = createRobot(dh_params)
+    _worker["settings"] = (solver, q0, joint_limits)
+
+# Solves one chunk inside a worker process
+def _solveTask(start, targets):
+    solver, q0, joint_limits = _worker["settings"]
+    return solveChunk(_worker["robot"], targets, solver, q0, joint_limits, start)
+
+# Solves target chunks in parallel worker processes
+# Results are returned in input order
+class ParallelSolver:
+    def __init__(self, dh_params, solver="IK_LM", q0=None, joint_limits=True, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._cancelled = threading.Event()
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_initWorker, initargs=(dh_params, solver, q0, joint_limits))
+
+    # Solves all chunks, only a few chunks per worker are queued at once
+    # INPUTS: Target chunks <iterable of Nx6 arrays>, Callback with number of solved targets <function>
+    # OUTPUTS: Generator of results <BatchResult>
+    def solve(self, chunks, progress=None):
+        pending = collections.deque()
+        max_pending = 2 * self.workers
+        start = 0
+        done = 0
+        chunks = iter(chunks)
+        while not self._cancelled.is_set():
+            # Keep the workers busy
+            while len(pending) < max_pending:
+                targets = next(chunks, None)
+                if targets is None: break
+                pending.append(self._executor.submit(_solveTask, start, targets))
+                start += len(targets)
+            if not pending: return
+            # Return the oldest chunk first to keep the order
+            result = pending.popleft().result()
+            done += len(result)
+            if progress: progress(done)
+            yield result
+        # Cancelled, drop queued chunks
+        for future in pending:
+            future.cancel()
+
+    # Starts all worker processes and builds their robots now instead of on the first chunks
+    def warmUp(self):
+        futures = [self._executor.submit(time.sleep, 0.1) for _ in range(self.workers)]
+        for future in futures: future.result()
+
+    # Stops solving after the chunks currently running (can be called from another thread)
+    def cancel(self):
+        self._cancelled.set()
+
+    # Shuts down the worker processes
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self): return self
+
+    def __exit__(self, *args): self.close()
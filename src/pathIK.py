@@ -0,0 +1,73 @@
+###############################################
+# Path inverse kinematics
+# Solves a sequence of target poses with warm starts
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import numpy as np
+from src.robotModel import targetTransforms, solveIK
+from src.batchIK import BatchResult
+
+# Default maximum joint change between two path points in rad (or m)
+MAX_JUMP = 0.5
+
+# Largest joint change between two positions (angles of revolute joints wrapped)
+def _jump(revolute, q1, q2):
+    difference = np.asarray(q1, dtype=float) - np.asarray(q2, dtype=float)
+    difference[revolute] = (difference[revolute] + np.pi) % (2*np.pi) - np.pi
+    return float(np.max(np.abs(difference)))
+
+# Solves a Cartesian path, every solve starts at the previous solution
+# Joint jumps larger than max_jump (branch flips) are retried from the previous solution and flagged
+# INPUTS: Robot <DHRobot>, Target chunks <iterable of Nx6 arrays>, Solver name <string>, Start position <list>,
+#         Limits active <bool>, Maximum joint change <float>
+# OUTPUTS: Generator of results <BatchResult> with additional jumps flags <N array of bool>
+def solvePath(robot, chunks, solver="IK_LM", q_start=None, joint_limits=True, max_jump=MAX_JUMP):
+    revolute = np.array(robot.revolutejoints, dtype=bool)
+    q_previous = np.zeros(robot.n) if q_start is None else np.asarray(q_start, dtype=float)
+    velocity = np.zeros(robot.n)
+    start = 0
+    # The move from the start position to the first point is not a jump
+    first = True
+    for targets in chunks:
+        transforms = targetTransforms(targets)
+        count = len(transforms)
+        q = np.zeros((count, robot.n))
+        success = np.zeros(count, dtype=bool)
+        residual = np.zeros(count)
+        iterations = np.zeros(count, dtype=int)
+        jumps = np.zeros(count, dtype=bool)
+        for i in range(count):
+            # Seed with the previous solution, extrapolated with the last joint step
+            result = solveIK(robot, solver, transforms[i], q_previous + velocity, joint_limits, slimit=1)
+            total_iterations = result.iterations
+            if not result.success or _jump(revolute, result.q, q_previous) > max_jump:
+                # Retry from the previous solution, then with random restarts
+                retry = solveIK(robot, solver, transforms[i], q_previous, joint_limits, slimit=1)
+                total_iterations += retry.iterations
+                if not retry.success:
+                    retry = solveIK(robot, solver, transforms[i], q_previous, joint_limits)
+                    total_iterations += retry.iterations
+                if retry.success and (not result.success or _jump(revolute, retry.q, q_previous) < _jump(revolute, result.q, q_previous)):
+                    result = retry
+            q[i] = result.q
+            success[i] = result.success
+            residual[i] = result.residual
+            iterations[i] = total_iterations
+            if result.success:
+                jumps[i] = not first and _jump(revolute, result.q, q_previous) > max_jump
+                first = False
+                # Continue at the new solution (no extrapolation over jumps)
+                velocity = np.zeros(robot.n) if jumps[i] else np.asarray(result.q) - q_previous
+                q_previous = np.asarray(result.q, dtype=float)
+        batch = BatchResult(start, q, success, residual, iterations)
+        batch.jumps = jumps
+        yield batch
+        start += count
+
+# Solves a whole path at once
+# INPUTS: Robot <DHRobot>, Targets <Nx6 array>, Solver name <string>, Start position <list>, Limits active <bool>, Maximum joint change <float>
+# OUTPUTS: Result <BatchResult> with joint trajectory q <Nxn array>
+def solvePathArray(robot, targets, solver="IK_LM", q_start=None, joint_limits=True, max_jump=MAX_JUMP):
+    return next(solvePath(robot, [np.asarray(targets, dtype=float)], solver, q_start, joint_limits, max_jump))
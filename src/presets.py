@@ -0,0 +1,105 @@
+###############################################
+# Preset registry for inverse kinematic ui
+# Builds robot models from the robotics toolbox on first use
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import os
+import pickle
+import threading
+
+# Labels of the available presets ("-" means no preset selected)
+PRESET_LABELS = ["-", "Puma560", "UR3", "UR5", "UR10"]
+
+# Default folder for the optional on-disk model cache
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+# Imports the robotics toolbox on first use (the import alone takes more than a second)
+# OUTPUTS: roboticstoolbox module
+def loadToolbox():
+    import roboticstoolbox
+    return roboticstoolbox
+
+# Lazy, cached access to the toolbox presets
+# Models are only built when they are requested for the first time
+class PresetRegistry:
+    def __init__(self, labels=PRESET_LABELS, cache_dir=None):
+        self.labels = list(labels)
+        # Optional folder for pickled models (None disables the disk cache)
+        self.cache_dir = cache_dir
+        self._models = {}
+        self._lock = threading.Lock()
+
+    # Returns the DH model of a preset
+    # INPUTS: Preset label <string>
+    # OUTPUTS: Robot <DHRobot> or False if no preset is selected
+    def getDH(self, label): return self.get(label, "DH")
+
+    # Returns the URDF model of a preset
+    # INPUTS: Preset label <string>
+    # OUTPUTS: Robot <Robot> or False if no preset is selected
+    def getURDF(self, label): return self.get(label, "URDF")
+
+    # Returns a preset model, builds it on first use
+    # INPUTS: Preset label <string>, Model type "DH" or "URDF" <string>
+    # OUTPUTS: Robot object or False if no preset is selected
+    def get(self, label, kind="DH"):
+        if label not in self.labels:
+            raise KeyError("Unknown preset: " + str(label))
+        if label == "-": return False
+        key = (kind, label)
+        with self._lock:
+            if key not in self._models:
+                robot = self._loadFromDisk(kind, label)
+                if robot is None:
+                    robot = self._build(kind, label)
+                    self._saveToDisk(kind, label, robot)
+                self._models[key] = robot
+            return self._models[key]
+
+    # Returns True if the model was already built
+    def isLoaded(self, label, kind="DH"): return (kind, label) in self._models
+
+    # Drops all models from memory
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    # Builds a model from the robotics toolbox
+    def _build(self, kind, label):
+        rtb = loadToolbox()
+        if kind == "DH":
+            return getattr(rtb.models.DH, label)()
+        elif kind == "URDF":
+            return getattr(rtb.models.URDF, label)()
+        raise ValueError("Unknown model type: " + str(kind))
+
+    # Path of the pickled model (keyed by the toolbox version)
+    def _cachePath(self, kind, label):
+        version = loadToolbox().__version__
+        return os.path.join(self.cache_dir, kind + "_" + label + "_rtb" + version + ".pkl")
+
+    # Loads a pickled model, returns None if there is none
+    def _loadFromDisk(self, kind, label):
+        if self.cache_dir is None: return None
+        path = self._cachePath(kind, label)
+        if not os.path.isfile(path): return None
+        try:
+            with open(path, "rb") as file:
+                return pickle.load(file)
+        except Exception:
+            # Broken or incompatible cache file, rebuild the model
+            return None
+
+    # Pickles a model (not every toolbox version supports pickling robots)
+    def _saveToDisk(self, kind, label, robot):
+        if self.cache_dir is None: return
+        path = self._cachePath(kind, label)
+        try:
+            data = pickle.dumps(robot)
+        except Exception:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(data)
@@ -0,0 +1,100 @@
+###############################################
+# Null-space IK for redundant robots
+# Damped least squares with null-space optimization (joint limits and singularities)
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import math
+import numpy as np
+
+# Name of the solver in the UI
+REDUNDANT_SOLVER = "IK_Nullraum"
+
+# Default solver settings (like the toolbox solvers)
+TOLERANCE = 1e-10
+ITERATIONS = 30
+SEARCHES = 100
+# Gains of the null-space objectives (distance to joint limits, manipulability)
+LIMIT_GAIN = 2.0
+MANIPULABILITY_GAIN = 0.5
+# Null-space iterations after the pose is reached
+NULLSPACE_ITERATIONS = 8
+
+# Pose error [dx, dy, dz, rx, ry, rz] (position difference and angle-axis of the rotation difference)
+def _poseError(T, target):
+    e = np.empty(6)
+    e[:3] = target[:3, 3] - T[:3, 3]
+    R = target[:3, :3] @ T[:3, :3].T
+    li = np.array([R[2, 1] - R[1, 2], R[0, 2] - R[2, 0], R[1, 0] - R[0, 1]])
+    ln = math.sqrt(li @ li)
+    trace = R[0, 0] + R[1, 1] + R[2, 2]
+    if ln > 1e-9:
+        e[3:] = math.atan2(ln, trace - 1) * li / ln
+    elif trace > 0:
+        e[3:] = 0
+    else:
+        e[3:] = math.pi / 2 * (np.diag(R) + 1)
+    return e
+
+# Gradient of the joint limit cost (squared distance to the middle of the range)
+def _limitGradient(q, middle, scale):
+    return (q - middle) * scale
+
+# Gradient of the negative manipulability (moves away from singular positions)
+def _manipulabilityGradient(ets, q):
+    return -ets.jacobm(q).ravel()
+
+# Solves the IK from one start position
+def _solve(ets, target, q, lower, upper, joint_limits, tolerance, iterations):
+    n = len(q)
+    middle = (lower + upper) / 2
+    scale = 4.0 / np.maximum(upper - lower, 1e-9)**2
+    identity = np.eye(6)
+    converged = 0
+    for iteration in range(1, iterations + 1):
+        e = _poseError(ets.eval(q), target)
+        residual = 0.5 * float(e @ e)
+        J = ets.jacob0(q)
+        # Damped least squares step (damping grows with the error like the LM solver)
+        A = J @ J.T + (residual + 1e-8) * identity
+        dq = J.T @ np.linalg.solve(A, e)
+        if residual < tolerance:
+            converged += 1
+            if converged > NULLSPACE_ITERATIONS or n <= 6: return q, residual, iteration, True
+        if n > 6:
+            # Secondary objectives projected to the null space of the task (does not move the end effector)
+            gradient = LIMIT_GAIN * _limitGradient(q, middle, scale)
+            if converged: gradient = gradient + MANIPULABILITY_GAIN * _manipulabilityGradient(ets, q)
+            null = gradient - J.T @ np.linalg.solve(A, J @ gradient)
+            if converged and null @ null < 1e-12: return q, residual, iteration, True
+            dq -= null
+        q = q + dq
+        if joint_limits: q = np.clip(q, lower, upper)
+    e = _poseError(ets.eval(q), target)
+    residual = 0.5 * float(e @ e)
+    return q, residual, iterations, residual < tolerance
+
+# Null-space IK: damped least squares for the pose, the redundant joints keep the robot
+# away from its joint limits and singular positions
+# INPUTS: Robot <DHRobot>, Solver chain <ETS>, Target <4x4 array>, Start position <list>, Limits active <bool>,
+#         Number of searches from random start positions <int>, Iterations per search <int>, Tolerance <float>, Random seed
+# OUTPUTS: Result <IKSolution>
+def ikineNullspace(robot, ets, target, q0=None, joint_limits=True, slimit=SEARCHES, ilimit=ITERATIONS, tol=TOLERANCE, seed=None, **options):
+    from roboticstoolbox.robot.IK import IKSolution
+    target = np.asarray(target, dtype=float)
+    lower, upper = np.asarray(robot.qlim[0], dtype=float), np.asarray(robot.qlim[1], dtype=float)
+    q = np.zeros(robot.n) if q0 is None else np.array(q0, dtype=float)
+    rng = np.random.default_rng(seed)
+    total = 0
+    best = None
+    for search in range(1, slimit + 1):
+        if joint_limits: q = np.clip(q, lower, upper)
+        q, residual, iterations, success = _solve(ets, target, q, lower, upper, joint_limits, tol, ilimit)
+        total += iterations
+        if best is None or residual < best[1]: best = (q, residual)
+        if success:
+            return IKSolution(q=q, success=True, iterations=total, searches=search, residual=residual, reason="Success")
+        # Restart from a random position within the limits
+        q = rng.uniform(lower, upper)
+    return IKSolution(q=best[0], success=False, iterations=total, searches=slimit, residual=best[1], reason="iteration and search limit reached")
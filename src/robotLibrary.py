@@ -0,0 +1,154 @@
+###############################################
+# Robot library for inverse kinematic ui
+# Streams robot definitions from folders and multi-robot files (.csv, .json, .npz)
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import csv
+import json
+import os
+import numpy as np
+from src.robotModel import DH_CSV_HEADER, JOINT_TYPES, parseDHTable
+
+# Supported robot file types
+ROBOT_FILE_TYPES = [".csv", ".json", ".npz"]
+# Header of the multi-robot csv format (robot name in front of the DH table columns)
+ROBOTS_CSV_HEADER = ["Roboter"] + DH_CSV_HEADER
+
+# Reads robots from a csv file, either a single DH table (export format, name of the file)
+# or several robots with the robot name in the first column (rows of one robot in sequence)
+# OUTPUTS: Generator of (name, rows)
+def _iterCSV(file_path):
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    with open(file_path, mode='r', newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None: return
+        multi = len(header) == 9
+        if not multi and len(header) != 8:
+            raise ValueError("Ungültiges Dateiformat für Denavit-Hartenberg-Parameter.")
+        current, rows = None, []
+        for line in reader:
+            if not line: continue
+            if multi:
+                line_name, line = line[0], line[1:]
+            else:
+                line_name = name
+                # Single tables end at the first disabled joint
+                if len(line) < 8 or line[7] not in JOINT_TYPES: break
+            if line_name != current:
+                if rows: yield current, rows
+                current, rows = line_name, []
+            rows.append(line[1:8])
+        if rows: yield current, rows
+
+# Reads robots from a json file: {"name": [[θ, d, a, alpha, min, max, type], ...], ...}
+# or a list of {"name": ..., "dh": [...]}
+# OUTPUTS: Generator of (name, rows)
+def _iterJSON(file_path):
+    with open(file_path, mode='r', encoding='utf-8') as file:
+        data = json.load(file)
+    if isinstance(data, dict) and "robots" in data: data = data["robots"]
+    if isinstance(data, dict):
+        for name, rows in data.items():
+            yield name, rows
+    else:
+        for robot in data:
+            yield robot["name"], robot["dh"]
+
+# Reads robots from a .npz file (see writeRobotsNpz), arrays are only converted robot by robot
+# OUTPUTS: Generator of (name, rows)
+def _iterNpz(file_path):
+    with np.load(file_path) as data:
+        names, params, types, joints = data["names"], data["params"], data["types"], data["joints"]
+    for i in range(len(names)):
+        yield str(names[i]), [[float(value) for value in params[i, j]] + [JOINT_TYPES[types[i, j]]] for j in range(int(joints[i]))]
+
+# Reads robot definitions from a file or all robot files of a folder (one robot at a time)
+# INPUTS: File or folder path <string>
+# OUTPUTS: Generator of (name, source, rows) with rows [θ, d, a, alpha, min, max, type]
+def iterRobots(path):
+    if os.path.isdir(path):
+        for file_name in sorted(os.listdir(path)):
+            if os.path.splitext(file_name)[1].lower() in ROBOT_FILE_TYPES:
+                yield from iterRobots(os.path.join(path, file_name))
+        return
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv": robots = _iterCSV(path)
+    elif extension == ".json": robots = _iterJSON(path)
+    elif extension == ".npz": robots = _iterNpz(path)
+    else: raise ValueError("Unbekanntes Dateiformat: " + extension)
+    for name, rows in robots:
+        yield name, path, rows
+
+# Checks a robot definition
+# INPUTS: Rows [θ, d, a, alpha, min, max, type] <list of lists>
+# OUTPUTS: DH params <list of tuples>, raises ValueError if the definition is invalid
+def validateRobot(rows):
+    if not rows: raise ValueError("Keine Gelenke")
+    for i, row in enumerate(rows):
+        if len(row) != 7: raise ValueError("Gelenk " + str(i+1) + ": 7 Werte erwartet")
+    dh_params = parseDHTable(rows)
+    for i, params in enumerate(dh_params):
+        if not all(np.isfinite(params[:6])): raise ValueError("Gelenk " + str(i+1) + ": ungültiger Wert")
+        if params[4] > params[5]: raise ValueError("Gelenk " + str(i+1) + ": Min größer als Max")
+    return dh_params
+
+# Loads all valid robots of a file or folder, invalid robots are reported and skipped
+# INPUTS: File or folder path <string>
+# OUTPUTS: Robots by name {name: rows} <dict>, Errors [(name, source, message)] <list>
+def loadLibrary(path):
+    robots = {}
+    errors = []
+    for name, source, rows in iterRobots(path):
+        rows = [[str(value) for value in row] for row in rows]
+        try:
+            validateRobot(rows)
+        except Exception as e:
+            errors.append((name, source, str(e)))
+            continue
+        if name in robots: name = name + " (" + os.path.basename(source) + ")"
+        robots[name] = rows
+    return robots, errors
+
+# Loads the DH params of all valid robots (for batch tools, no string conversion for .npz files)
+# INPUTS: File or folder path <string>
+# OUTPUTS: DH params by name <dict>
+def loadDHParams(path):
+    if not os.path.isdir(path) and path.lower().endswith(".npz"): return _npzDHParams(path)
+    return {name: validateRobot(rows) for name, _, rows in iterRobots(path)}
+
+# DH params of all robots of a .npz file (validated on the whole arrays)
+def _npzDHParams(file_path):
+    with np.load(file_path) as data:
+        names, params, types, joints = data["names"], data["params"], data["types"], data["joints"]
+    active = np.arange(params.shape[1]) < joints[:, None]
+    invalid = active & (~np.all(np.isfinite(params), axis=2) | (params[:, :, 4] > params[:, :, 5]))
+    if np.any(invalid) or np.any(joints < 1):
+        raise ValueError("Ungültige Roboter: " + ", ".join(str(name) for name in names[np.any(invalid, axis=1) | (joints < 1)][:10]))
+    params, types = params.tolist(), types.tolist()
+    return {str(names[i]): [tuple(params[i][j]) + (JOINT_TYPES[types[i][j]],) for j in range(int(joints[i]))] for i in range(len(names))}
+
+# Reads one robot of a file or folder
+# INPUTS: File or folder path <string>, Robot name <string> (None: first robot)
+# OUTPUTS: Rows [θ, d, a, alpha, min, max, type] <list of lists>
+def readRobot(path, name=None):
+    for robot_name, _, rows in iterRobots(path):
+        if name is None or robot_name == name: return rows
+    raise KeyError("Roboter nicht gefunden: " + str(name))
+
+# Writes robots to a compact .npz file (DH params as float array, padded to the largest robot)
+# INPUTS: File path <string>, Robots {name: rows or DH params} <dict>
+def writeRobotsNpz(file_path, robots):
+    names = list(robots)
+    dh_params = [validateRobot(robots[name]) for name in names]
+    size = max([len(params) for params in dh_params], default=0)
+    params = np.zeros((len(names), size, 6))
+    types = np.zeros((len(names), size), dtype=np.int8)
+    for i, robot in enumerate(dh_params):
+        for j, joint in enumerate(robot):
+            params[i, j] = joint[:6]
+            types[i, j] = JOINT_TYPES.index(joint[6])
+    with open(file_path, "wb") as file:
+        np.savez(file, names=np.array(names, dtype=str), params=params, types=types, joints=np.array([len(robot) for robot in dh_params]))
@@ -0,0 +1,156 @@
+###############################################
+# Robot model functions for inverse kinematic ui
+# GUI-free handling of DH tables, targets and solvers
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import csv
+import weakref
+import numpy as np
+from src.helpers import parseInputString
+from src.presets import loadToolbox
+from src.analyticIK import ANALYTIC_SOLVER, analyticSolutions
+from src.redundantIK import REDUNDANT_SOLVER, ikineNullspace
+from src.vectorIK import VECTOR_SOLVER, ikineVector
+from src.kinematics import DHChain
+
+# Header of the DH table csv format (see RobotUI.saveModel)
+DH_CSV_HEADER = ['Gelenk', 'θ in rad', 'd in m', 'a in m', 'alpha in m', 'Min', 'Max', 'Gelenktyp']
+
+# Supported joint types and solvers
+JOINT_TYPES = ["Rotation", "Translation"]
+SOLVERS = ["IK_LM", "IK_GN", "IK_NR", ANALYTIC_SOLVER, REDUNDANT_SOLVER, VECTOR_SOLVER]
+
+# Numerical solver used if there is no closed-form solution
+ANALYTIC_FALLBACK = "IK_LM"
+
+# Reads the DH table rows from a csv file
+# INPUTS: File path <string>
+# OUTPUTS: Rows [θ, d, a, alpha, min, max, type] <list of lists of strings>
+def readDHFile(file_path):
+    with open(file_path, mode='r', newline='') as file:
+        data = list(csv.reader(file))
+    # Check csv file structure
+    if len(data) < 2 or len(data[0]) != 8:
+        raise ValueError("Ungültiges Dateiformat für Denavit-Hartenberg-Parameter.")
+    rows = []
+    for line in data[1:]:
+        if len(line) < 8 or line[7] not in JOINT_TYPES: break
+        rows.append(line[1:8])
+    return rows
+
+# Writes DH table rows to a csv file
+# INPUTS: File path <string>, Rows [θ, d, a, alpha, min, max, type] <list of lists>
+def writeDHFile(file_path, rows):
+    data = [DH_CSV_HEADER]
+    for i, row in enumerate(rows):
+        data.append([str(i+1)] + [str(value) for value in row])
+    with open(file_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerows(data)
+
+# Converts DH table rows to numbers
+# INPUTS: Rows [θ, d, a, alpha, min, max, type] <list of lists of strings>
+# OUTPUTS: DH params (θ, d, a, alpha, min, max, type) <list of tuples>
+def parseDHTable(rows):
+    dh_params = []
+    for row in rows:
+        if row[6] not in JOINT_TYPES:
+            raise ValueError("Unknown joint type: " + str(row[6]))
+        # Numbers (e.g. from .npz files) are used directly
+        values = tuple(float(value) if isinstance(value, (int, float)) else parseInputString(str(value)) for value in row[:6])
+        dh_params.append(values + (row[6],))
+    return dh_params
+
+# Creates a robot object from DH params
+# INPUTS: DH params (θ, d, a, alpha, min, max, type) <list of tuples>
+# OUTPUTS: Robot <DHRobot>
+def createRobot(dh_params):
+    rtb = loadToolbox()
+    robot_config = []
+    for theta, d, a, alpha, min, max, joint_type in dh_params:
+        if joint_type == "Rotation":
+            robot_config.append(rtb.RevoluteDH(d=d, a=a, alpha=alpha, qlim=[min, max]))
+        elif joint_type == "Translation":
+            robot_config.append(rtb.PrismaticDH(theta=theta, a=a, alpha=alpha, qlim=[min, max]))
+        else:
+            raise ValueError("Unknown joint type: " + str(joint_type))
+    return rtb.DHRobot(robot_config, name="Robot")
+
+# Creates the homogeneous transformation of a target
+# INPUTS: Target [X, Y, Z, A, B, C] (euler angles 'XYZ') <list>
+# OUTPUTS: Transformation <4x4 array>
+def targetTransform(target):
+    return targetTransforms(np.asarray(target, dtype=float).reshape(1, 6))[0]
+
+# Creates the homogeneous transformations of many targets at once
+# INPUTS: Targets [X, Y, Z, A, B, C] (euler angles 'XYZ') <Nx6 array>
+# OUTPUTS: Transformations <Nx4x4 array>
+def targetTransforms(targets):
+    targets = np.asarray(targets, dtype=float)
+    sa, sb, sc = np.sin(targets[:, 3]), np.sin(targets[:, 4]), np.sin(targets[:, 5])
+    ca, cb, cc = np.cos(targets[:, 3]), np.cos(targets[:, 4]), np.cos(targets[:, 5])
+    T = np.zeros((len(targets), 4, 4))
+    # Intrinsic rotation R = Rx(A) * Ry(B) * Rz(C)
+    T[:, 0, 0] = cb * cc
+    T[:, 0, 1] = -cb * sc
+    T[:, 0, 2] = sb
+    T[:, 1, 0] = ca * sc + sa * sb * cc
+    T[:, 1, 1] = ca * cc - sa * sb * sc
+    T[:, 1, 2] = -sa * cb
+    T[:, 2, 0] = sa * sc - ca * sb * cc
+    T[:, 2, 1] = sa * cc + ca * sb * sc
+    T[:, 2, 2] = ca * cb
+    T[:, :3, 3] = targets[:, :3]
+    T[:, 3, 3] = 1
+    return T
+
+# Elementary transform sequences of the robots, the solvers of a DHRobot rebuild it on every call
+_chains = weakref.WeakKeyDictionary()
+
+# Returns the (cached) elementary transform sequence of a robot
+# The robot object must not be changed after the first call
+def solverChain(robot):
+    chain = _chains.get(robot)
+    if chain is None:
+        chain = _chains[robot] = robot.ets()
+    return chain
+
+# DH chains of the robots for the vectorized solver
+_dh_chains = weakref.WeakKeyDictionary()
+
+# Returns the (cached) DH chain of a robot (see solverChain)
+def vectorChain(robot):
+    chain = _dh_chains.get(robot)
+    if chain is None:
+        chain = _dh_chains[robot] = DHChain.fromRobot(robot)
+    return chain
+
+# Runs the selected numerical solver
+# INPUTS: Robot <DHRobot>, Solver name <string>, Target <4x4 array>, Start position <list>, Limits active <bool>, Solver options (e.g. slimit)
+# OUTPUTS: Result <IKSolution>
+def solveIK(robot, solver, target, q0, joint_limits=True, **options):
+    # Levemberg-Marquadt selected
+    if solver == "IK_LM":
+        return solverChain(robot).ikine_LM(target, q0=q0, joint_limits=joint_limits, **options)
+    # Gauss-Newton selected (J^T J is singular for n != 6, the pseudo inverse is used instead)
+    elif solver == "IK_GN":
+        options.setdefault("pinv", robot.n != 6)
+        return solverChain(robot).ikine_GN(target, q0=q0, joint_limits=joint_limits, **options)
+    # Newton-Raphson selected (J is not square for n != 6, the pseudo inverse is used instead)
+    elif solver == "IK_NR":
+        options.setdefault("pinv", robot.n != 6)
+        return solverChain(robot).ikine_NR(target, q0=q0, joint_limits=joint_limits, **options)
+    # Closed-form solution selected, numerical fallback for other robots and singular poses
+    elif solver == ANALYTIC_SOLVER:
+        solutions = analyticSolutions(robot, target, q0, joint_limits)
+        if solutions: return solutions[0]
+        return solveIK(robot, ANALYTIC_FALLBACK, target, q0, joint_limits, **options)
+    # Damped least squares with null-space optimization (redundant robots)
+    elif solver == REDUNDANT_SOLVER:
+        return ikineNullspace(robot, solverChain(robot), target, q0, joint_limits, **options)
+    # Levenberg-Marquardt on stacked arrays (see batchIK.solveChunk for many targets)
+    elif solver == VECTOR_SOLVER:
+        return ikineVector(vectorChain(robot), target, q0, joint_limits, **options)
+    raise ValueError("Unknown solver: " + str(solver))
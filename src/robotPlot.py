@@ -0,0 +1,193 @@
+###############################################
+# Robot plot window
+# Persistent matplotlib canvas in a Tk window, robot positions and trajectories are updated in place
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+
+# Largest number of shown frames of a trajectory (longer trajectories are decimated)
+MAX_FRAMES = 250
+# Time between two frames (ms)
+FRAME_INTERVAL = 20
+# Length of the end effector axes relative to the robot reach
+AXIS_LENGTH = 0.1
+
+# Robot plot with reused figure and artists
+class RobotPlot:
+    def __init__(self, master):
+        self.master = master
+        self.window = None
+        self.figure = None
+        self.canvas = None
+        # Background without the moving artists (blitting)
+        self._background = None
+        # Link origins <Mxkx3 array> and end effector frames <Mx4x4 array> of the shown frames
+        self._points = None
+        self._tool = None
+        self._chain = None
+        self._axis_length = AXIS_LENGTH
+        # Next frame of the playback and shown frame
+        self._frame = 0
+        self._shown = None
+        self._after = None
+
+    # Opens the window or brings it to the front
+    def open(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.deiconify()
+            self.window.lift()
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        self.window = tk.Toplevel(self.master)
+        self.window.title("Roboter")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.figure = Figure(figsize=(6, 6), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.window)
+        self.canvas.get_tk_widget().grid(row=0, column=0, columnspan=3, sticky="nsew")
+        self.window.columnconfigure(1, weight=1)
+        self.window.rowconfigure(0, weight=1)
+        # Trajectory controls
+        self.button_play = ttk.Button(self.window, width=12, text="Abspielen", command=self.play)
+        self.button_play.grid(row=1, column=0, padx=10, pady=5)
+        self.slider = ttk.Scale(self.window, from_=0, to=0, orient="horizontal", command=self._onSlider)
+        self.slider.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self.label_frame = ttk.Label(self.window, width=14)
+        self.label_frame.grid(row=1, column=2, padx=10, pady=5)
+        self.createArtists()
+        self.canvas.draw()
+
+    # Creates the axes and the artists that are updated for every frame
+    def createArtists(self):
+        self.axes = self.figure.add_subplot(projection="3d")
+        self.axes.set_xlabel("X")
+        self.axes.set_ylabel("Y")
+        self.axes.set_zlabel("Z")
+        # Moving artists are only drawn by blitting
+        self.links, = self.axes.plot([], [], [], "o-", color="tab:blue", linewidth=3, markersize=5, animated=True)
+        self.tool_axes = [self.axes.plot([], [], [], color=color, linewidth=2, animated=True)[0] for color in ["r", "g", "b"]]
+        # End effector path of a trajectory (part of the background)
+        self.path, = self.axes.plot([], [], [], ":", color="grey", linewidth=1)
+        self.figure.canvas.mpl_connect("draw_event", self._onDraw)
+
+    def close(self):
+        self.stop()
+        if self.window is not None:
+            self.window.destroy()
+        self.window = None
+        self.figure = None
+        self.canvas = None
+        self._background = None
+        self._chain = None
+
+    # Shows a joint position or a trajectory
+    # INPUTS: DH chain <DHChain>, Joint position <n array> or trajectory <Mxn array>, Title <string>
+    def show(self, chain, q, title=""):
+        self.stop()
+        if self.figure is None: self.open()
+        q = np.asarray(q, dtype=float).reshape(-1, chain.n)
+        # Decimate long trajectories (first and last sample are kept)
+        if len(q) > MAX_FRAMES:
+            q = q[np.linspace(0, len(q) - 1, MAX_FRAMES).round().astype(int)]
+        self._setFrames(chain, q)
+        self._chain = chain
+        # Fixed axis limits (reach of the robot) so the background stays valid during playback
+        reach = max(float(np.sum(np.abs(chain.a) + np.abs(chain.d)) + np.sum(np.abs(chain.qlim[:, ~chain.revolute]))), 1e-3)
+        self._axis_length = AXIS_LENGTH * reach
+        center = self._points[0, 0]
+        self.axes.set_xlim(center[0] - reach, center[0] + reach)
+        self.axes.set_ylim(center[1] - reach, center[1] + reach)
+        self.axes.set_zlim(center[2] - reach, center[2] + reach)
+        self.axes.set_title(title)
+        path = self._tool[:, :3, 3]
+        self.path.set_data_3d(path[:, 0], path[:, 1], path[:, 2])
+        if self.window is not None:
+            self.slider.configure(to=len(q) - 1)
+            self.button_play.configure(state="normal" if len(q) > 1 else "disabled")
+        self._frame = 0
+        self._shown = 0
+        self._setArtists(0)
+        # Full redraw once, the frames are blitted on the new background
+        self._background = None
+        self.canvas.draw()
+        if len(q) > 1: self.play()
+
+    # Moves the robot to a new joint position without a full redraw (e.g. jogging)
+    # INPUTS: DH chain <DHChain>, Joint position <n array>
+    def update(self, chain, q):
+        if self.figure is None or chain is not self._chain:
+            self.show(chain, q)
+            return
+        self.stop()
+        self._setFrames(chain, np.asarray(q, dtype=float).reshape(1, chain.n))
+        if self.window is not None: self.slider.configure(to=0)
+        self.showFrame(0)
+
+    # Link origins and end effector frames of all frames in one pass
+    def _setFrames(self, chain, q):
+        F = chain.frames(q)
+        tool = F[:, -1] if chain.tool is None else F[:, -1] @ chain.tool
+        self._points = np.concatenate([F[:, :, :3, 3], tool[:, None, :3, 3]], axis=1) if chain.tool is not None else F[:, :, :3, 3]
+        self._tool = tool
+
+    # Plays the trajectory from the start
+    def play(self):
+        if self._points is None: return
+        self.stop()
+        self._frame = 0
+        self._nextFrame()
+
+    def stop(self):
+        if self._after is not None:
+            self.master.after_cancel(self._after)
+            self._after = None
+
+    def _nextFrame(self):
+        self.showFrame(self._frame)
+        self._frame += 1
+        self._after = self.master.after(FRAME_INTERVAL, self._nextFrame) if self._frame < len(self._points) else None
+
+    # Frame selected with the slider (also called when the slider is moved by the playback)
+    def _onSlider(self, value):
+        index = int(float(value))
+        if index == self._shown: return
+        self.stop()
+        self.showFrame(index, False)
+
+    # Shows one frame of the trajectory
+    def showFrame(self, index, update_slider=True):
+        if self._points is None: return
+        index = min(max(index, 0), len(self._points) - 1)
+        self._shown = index
+        self._setArtists(index)
+        if self.window is not None:
+            if update_slider: self.slider.set(index)
+            self.label_frame.config(text=str(index + 1) + " / " + str(len(self._points)))
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._drawArtists()
+        self.canvas.blit(self.figure.bbox)
+
+    # Updates the data of the moving artists (no drawing)
+    def _setArtists(self, index):
+        points = self._points[index]
+        self.links.set_data_3d(points[:, 0], points[:, 1], points[:, 2])
+        T = self._tool[index]
+        for i, line in enumerate(self.tool_axes):
+            end = T[:3, 3] + self._axis_length * T[:3, i]
+            line.set_data_3d([T[0, 3], end[0]], [T[1, 3], end[1]], [T[2, 3], end[2]])
+
+    def _drawArtists(self):
+        self.axes.draw_artist(self.links)
+        for line in self.tool_axes: self.axes.draw_artist(line)
+
+    # Stores the background after every full redraw (e.g. after rotating the view) and draws the robot on top
+    def _onDraw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self._points is not None: self._drawArtists()
@@ -1,27 +1,51 @@
 ###############################################
 # UI Class for Inverse Kinematics
 # Contains UI elements and Robotics toolbox functionality
-# Version: 0.6
+# Version: 1.13
 # Author: Benedikt Fassian
-# Date: 06.01.2024
+# Date: 17.10.2026
 ###############################################
 
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog as fd
-import roboticstoolbox as rtb
-from scipy.spatial.transform import Rotation
-import numpy as np
-import csv
 from tkinter.messagebox import showerror, showinfo
 from src.helpers import parseInputString
+from src.presets import PresetRegistry, loadToolbox, CACHE_DIR
+from src.backgroundWorker import BackgroundWorker
+from src.modelCache import ModelCache, dhTableKey
+from src.multiStart import solveMultiStart
+from src.batchIK import readTargets
+from src.pathIK import solvePath
+from src.workspace import getReachabilityIndex
+from src.solutionStore import SolutionStore
+from src.solverStats import SolveTimer, SolverStats, PHASES, PHASE_LABELS
+from src.trajectory import jointTrajectory
+from src.kinematics import DHChain
+from src.robotLibrary import loadLibrary, writeRobotsNpz
+from src.robotPlot import RobotPlot
+from src.jog import JogController, JOG_RATE
+from src.manipulability import CONDITION_LIMIT, manipulabilityMap, scoreTrajectory, isNearSingular
+from src.tolerance import TOLERANCE_A, TOLERANCE_D, TOLERANCE_ALPHA, MAX_SAMPLES, analyseTolerances
+from src.calibration import calibrate, readMeasurements
+from src.collision import LINK_RADIUS, FLOOR_HEIGHT, CollisionModel, filterSolutions, readObstacles
+import os
+import numpy as np
+from src.robotModel import SOLVERS, parseDHTable, createRobot, writeDHFile, targetTransform, solveIK
+import threading
+import time
 import traceback
 
 class RobotUI:
-    def __init__(self, master):
+    def __init__(self, master, joints=8):
 
         self.master = master
 
+        # Number of joints in the DH table (at least 6 for the coordinate inputs)
+        self.joints = max(joints, 6)
+        # Grid rows added by the joints > 6 (DH table and position inputs)
+        offset = self.joints - 6
+
         # Set application title and icon
         master.title("Inverse Kinematik Rechner by Benedikt Fassian")
         master.resizable(width=False, height=False)
@@ -32,20 +56,60 @@ class RobotUI:
         bold_font = ('Helvetica', 14, 'bold')
 
         # Array to store result
-        self.result = ["-", "-", "-", "-", "-", "-"]
+        self.result = ["-"] * self.joints
+        # Joint values of the result (also for joint space targets, where the result is a pose)
+        self.result_q = None
+
+        # Number of start positions in multi-start mode
+        self.multi_starts = 32
 
         # Helper strings to show result strings
         self.subscript_numbers = "₀₁₂₃₄₅₆₇₈₉"
         self.coordinate_lables = ["X =", "Y =", "Z =", "A =", "B =", "C ="]
         self.coordinate_units = [" m", " m", " m", " rad", " rad", " rad"]
 
-        # Presets from Roboticstoolbox
-        self.preset_labels =    ["-", "Puma560", "UR3", "UR5", "UR10"]
-        self.presets_dh = [False, rtb.models.DH.Puma560(), rtb.models.DH.UR3(), rtb.models.DH.UR5(), rtb.models.DH.UR10()]
-        self.presets_urdf = [False, rtb.models.URDF.Puma560(), rtb.models.URDF.UR3(), rtb.models.URDF.UR5(), rtb.models.URDF.UR10()]
+        # Presets from Roboticstoolbox (models are built when first selected)
+        self.presets = PresetRegistry()
+        self.preset_labels = self.presets.labels
+        # Robots loaded from files by name (DH table rows)
+        self.robot_library = {}
 
         self.result_positions = []
 
+        # Cache of robot objects built from the DH table (key is reset when the table changes)
+        self.model_cache = ModelCache()
+        self.model_key = None
+        # DH params and DH chains of the same tables (singularity and collision check, workspace index)
+        self.chain_cache = ModelCache()
+
+        # Solutions of previous calculations per robot model (reused for identical and nearby targets)
+        self.solution_store = SolutionStore(os.path.join(CACHE_DIR, "solutions.sqlite"))
+
+        # Timing of the last calculations (stats panel) and number of profiled calculations
+        self.solver_stats = SolverStats(profile_dir=CACHE_DIR)
+        self.profile_count = 10
+        self.stats_window = None
+
+        # Plot window of DH robots (figure and artists are reused for every plot)
+        self.robot_plot = RobotPlot(master)
+
+        # Jog mode (DH chains by model key, controller and control loop of the open jog panel)
+        self.jog_chains = ModelCache(max_size=8)
+        self.jog = None
+        self.jog_window = None
+        self.jog_after = None
+
+        # Tolerance analysis panel
+        self.tolerance_window = None
+
+        # Collision check (capsules along the DH links, floor and box obstacles), models by DH table and settings
+        self.collision_active = True
+        self.collision_radius = LINK_RADIUS
+        self.collision_floor = FLOOR_HEIGHT
+        self.obstacles = []
+        self.collision_models = ModelCache(max_size=8)
+        self.collision_window = None
+
 
         ###############################################
         # Denavit-Hartenberg-Parameter Section
@@ -73,7 +137,7 @@ class RobotUI:
 
         # DH Params table
         self.entry_dh_params = []
-        for i in range(6):
+        for i in range(self.joints):
             joint_number = ttk.Label(master, width=8, text="   Gelenk "+str(i+1))
             entry_theta = ttk.Entry(master, width=8)
             entry_d = ttk.Entry(master, width=8)
@@ -104,7 +168,7 @@ class RobotUI:
                 entry_type = ttk.Combobox(master, width=8, values=["Rotation", "Translation", "Deaktiviert"], state="readonly")
                 entry_type.set("Deaktiviert")
 
-            # Disable joints 2-6 by default
+            # Joint types can be selected from joint 2 on
             if(i>1):
                 entry_type.configure(state="disabled")
 
@@ -134,37 +198,37 @@ class RobotUI:
 
         # Select preset
         label_load_preset = ttk.Label(master, text="Preset:  ")
-        label_load_preset.grid(row=10, column=1, columnspan=1, padx=0, pady=22, sticky="w")
+        label_load_preset.grid(row=10 + offset, column=1, columnspan=1, padx=0, pady=22, sticky="w")
 
         self.entry_load = ttk.Combobox(master, width=10, values=self.preset_labels, state="readonly")
         self.entry_load.set("-")
-        self.entry_load.grid(row=10, column=1, columnspan=2, pady=2, sticky="e")
+        self.entry_load.grid(row=10 + offset, column=1, columnspan=2, pady=2, sticky="e")
         self.entry_load.bind("<<ComboboxSelected>>", self.loadModelFromPreset)
 
         # Import DH parameters
         label_save = ttk.Label(master, text="Laden:  ")
-        label_save.grid(row=10, column=3, columnspan=1, padx=0, pady=2, sticky="e")
+        label_save.grid(row=10 + offset, column=3, columnspan=1, padx=0, pady=2, sticky="e")
 
         button_load = ttk.Button(master, width=5, text="Import", command=self.loadModelFromFile)
-        button_load.grid(row=10, column=4, columnspan=2, padx=0, pady=2, sticky="w")
+        button_load.grid(row=10 + offset, column=4, columnspan=2, padx=0, pady=2, sticky="w")
 
         # Export DH parameters
         label_save = ttk.Label(master, text="Sichern:  ")
-        label_save.grid(row=10, column=5, columnspan=1, padx=0, pady=2, sticky="e")
+        label_save.grid(row=10 + offset, column=5, columnspan=1, padx=0, pady=2, sticky="e")
 
         button_save = ttk.Button(master, width=5, text="Export", command=self.saveModel)
-        button_save.grid(row=10, column=6, columnspan=2, padx=0, pady=2, sticky="w")
+        button_save.grid(row=10 + offset, column=6, columnspan=2, padx=0, pady=2, sticky="w")
 
         # Plot and visualize buttons
         button_plot_kinematik = ttk.Button(master, width=16, text="Kinematik Plotten", command=self.plotRobot)
-        button_plot_kinematik.grid(row=11, column=0, columnspan=4, padx=20, pady=0, sticky="e")
+        button_plot_kinematik.grid(row=11 + offset, column=0, columnspan=4, padx=20, pady=0, sticky="e")
 
         button_visualize_kinematik = ttk.Button(master, width=16, text="Kinematik Visualisieren", command=self.visualizeRobot)
-        button_visualize_kinematik.grid(row=11, column=4, columnspan=4, padx=20, pady=0, sticky="w")
+        button_visualize_kinematik.grid(row=11 + offset, column=4, columnspan=4, padx=20, pady=0, sticky="w")
 
         # Distance row (layout)
         mid_dist = ttk.Label(master)
-        mid_dist.grid(row=12, column=0, columnspan=6, padx=0, pady=0, sticky="s")
+        mid_dist.grid(row=12 + offset, column=0, columnspan=6, padx=0, pady=0, sticky="s")
 
 
         ###############################################
@@ -173,30 +237,30 @@ class RobotUI:
 
         # Section title
         label_inverse_kinematik = ttk.Label(master, text="______________________________      Inverse Kinematik      _______________________________", font=bold_font)
-        label_inverse_kinematik.grid(row=13, column=0, columnspan=8, pady=5, sticky="s")
+        label_inverse_kinematik.grid(row=13 + offset, column=0, columnspan=8, pady=5, sticky="s")
 
         # Start position input
         label_start_position = ttk.Label(master, text="Start")
-        label_start_position.grid(row=14, column=0, columnspan=3, padx=0, pady=2, sticky="s")
+        label_start_position.grid(row=14 + offset, column=0, columnspan=3, padx=0, pady=2, sticky="s")
 
         # Type selector
         label_format_start = ttk.Label(master, text="Format: ")
-        label_format_start.grid(row=15, column=0, columnspan=1, padx=0, pady=5, sticky="e")
+        label_format_start.grid(row=15 + offset, column=0, columnspan=1, padx=0, pady=5, sticky="e")
         self.format_start = ttk.Combobox(master, width=10, values=["Gelenkposition", "Koordinaten"], state="readonly")
         self.format_start.set("Gelenkposition")
-        self.format_start.grid(row=15, column=1, columnspan=2, padx=5, pady=5, sticky="w")
+        self.format_start.grid(row=15 + offset, column=1, columnspan=2, padx=5, pady=5, sticky="w")
 
         # Input fields
         self.start_position = []
-        for i in range(6):
+        for i in range(self.joints):
             label = ttk.Label(master)
             entry = ttk.Entry(master, width=8)
             unit = ttk.Label(master)
             entry.insert(0, 0)
             
-            label.grid(row=i + 16, column=0, padx=5, pady=2, sticky="e")
-            entry.grid(row=i + 16, column=1, columnspan=1, pady=2, sticky="w")
-            unit.grid(row=i + 16, column=2, columnspan=1, pady=2, sticky="w")
+            label.grid(row=i + 16 + offset, column=0, padx=5, pady=2, sticky="e")
+            entry.grid(row=i + 16 + offset, column=1, columnspan=1, pady=2, sticky="w")
+            unit.grid(row=i + 16 + offset, column=2, columnspan=1, pady=2, sticky="w")
 
             self.start_position.append((entry, unit, label))
 
@@ -205,26 +269,26 @@ class RobotUI:
 
         # Target position input
         label_target_position = ttk.Label(master, text="Ziel")
-        label_target_position.grid(row=14, column=3, columnspan=3, padx=0, pady=2, sticky="s")
+        label_target_position.grid(row=14 + offset, column=3, columnspan=3, padx=0, pady=2, sticky="s")
 
         # Input type selector
         label_format_target = ttk.Label(master, text="Format: ")
-        label_format_target.grid(row=15, column=3, columnspan=1, padx=0, pady=5, sticky="e")
+        label_format_target.grid(row=15 + offset, column=3, columnspan=1, padx=0, pady=5, sticky="e")
         self.format_target = ttk.Combobox(master, width=10, values=["Gelenkposition", "Koordinaten"], state="readonly")
         self.format_target.set("Koordinaten")
-        self.format_target.grid(row=15, column=4, columnspan=2, padx=5, pady=5, sticky="w")
+        self.format_target.grid(row=15 + offset, column=4, columnspan=2, padx=5, pady=5, sticky="w")
 
         # Input fields
         self.target_position = []
-        for i in range(6):
+        for i in range(self.joints):
             label = ttk.Label(master)
             entry = ttk.Entry(master, width=8)
             unit = ttk.Label(master)
             entry.insert(0, 0)
 
-            label.grid(row=i + 16, column=3, columnspan=1, padx=5, pady=2, sticky="e")
-            entry.grid(row=i + 16, column=4, columnspan=1, pady=2, sticky="w")
-            unit.grid(row=i + 16, column=5, columnspan=1, pady=2, sticky="w")
+            label.grid(row=i + 16 + offset, column=3, columnspan=1, padx=5, pady=2, sticky="e")
+            entry.grid(row=i + 16 + offset, column=4, columnspan=1, pady=2, sticky="w")
+            unit.grid(row=i + 16 + offset, column=5, columnspan=1, pady=2, sticky="w")
 
             self.target_position.append((entry, unit, label))
 
@@ -233,41 +297,98 @@ class RobotUI:
 
         # Solver
         label_solver = ttk.Label(master, text="Solver")
-        label_solver.grid(row=14, column=6, columnspan=2, padx=0, pady=0, sticky="s")
-        self.solver = ttk.Combobox(master, width=10, values=["IK_LM", "IK_GN", "IK_NR"], state="readonly")
+        label_solver.grid(row=14 + offset, column=6, columnspan=2, padx=0, pady=0, sticky="s")
+        self.solver = ttk.Combobox(master, width=12, values=SOLVERS, state="readonly")
         self.solver.set("IK_LM")
-        self.solver.grid(row=15, column=6, columnspan=2, padx=5, pady=0, sticky="s")
+        self.solver.grid(row=15 + offset, column=6, columnspan=2, padx=5, pady=0, sticky="s")
 
         # Limits
         label_limits = ttk.Label(master, text="Limits")
-        label_limits.grid(row=17, column=6, columnspan=2, padx=0, pady=0, sticky="s")
+        label_limits.grid(row=16 + offset, column=6, columnspan=2, padx=0, pady=0, sticky="s")
         self.limits = ttk.Combobox(master, width=10, values=["Aktiv", "Unbegrenzt"], state="readonly")
         self.limits.set("Aktiv")
-        self.limits.grid(row=18, column=6, columnspan=2, padx=5, pady=0, sticky="s")
+        self.limits.grid(row=17 + offset, column=6, columnspan=2, padx=5, pady=0, sticky="s")
+
+        # Search mode (single start, multi-start or all solution branches)
+        label_search = ttk.Label(master, text="Suche")
+        label_search.grid(row=18 + offset, column=6, columnspan=2, padx=0, pady=0, sticky="s")
+        self.search = ttk.Combobox(master, width=10, values=["Einzeln", "Multi-Start", "Alle Lösungen"], state="readonly")
+        self.search.set("Einzeln")
+        self.search.grid(row=19 + offset, column=6, columnspan=2, padx=5, pady=0, sticky="s")
 
         # Calculate button
         label_calculate = ttk.Label(master, text="Berechnen")
-        label_calculate.grid(row=20, column=6, columnspan=2, padx=0, pady=0, sticky="s")
+        label_calculate.grid(row=20 + offset, column=6, columnspan=2, padx=0, pady=0, sticky="s")
         button_calculate = ttk.Button(master, width=8, text="Start", command=self.calculate)
-        button_calculate.grid(row=21, column=6, columnspan=2, sticky="s")
+        button_calculate.grid(row=21 + offset, column=6, columnspan=2, sticky="s")
+
+        # Busy indicator and cancel button
+        self.progress_bar = ttk.Progressbar(master, length=80, mode="indeterminate")
+        self.progress_bar.grid(row=22 + offset, column=6, columnspan=2, pady=4, sticky="s")
+        self.progress_bar.grid_remove()
+        self.button_cancel = ttk.Button(master, width=8, text="Abbrechen", command=self.cancelCalculation, state="disabled")
+        self.button_cancel.grid(row=23 + offset, column=6, columnspan=2, sticky="s")
+        self.label_status = ttk.Label(master, anchor="center")
+        self.label_status.grid(row=25 + 2*offset, column=0, columnspan=8, padx=0, pady=0, sticky="s")
+
+        # Background workers for solver and plots (callbacks run in the Tk main thread)
+        self.calculation_worker = BackgroundWorker(master, on_busy=self.setBusy, on_progress=self.setProgress)
+        self.plot_worker = BackgroundWorker(master, on_busy=self.setBusy, on_progress=self.setProgress)
+        # Tolerance analysis (progress messages are the intermediate results)
+        self.tolerance_worker = BackgroundWorker(master, on_busy=self.setBusy, on_progress=self.showToleranceResult)
 
         # Result
         title_result = ttk.Label(master, text="_________________________     Ergebnis     _________________________")
-        title_result.grid(row=24, column=0, columnspan=8, pady=10, sticky="s")
+        title_result.grid(row=24 + 2*offset, column=0, columnspan=8, pady=10, sticky="s")
 
         # Output text
         self.label_result = ttk.Label(master, anchor="center")
-        self.label_result.grid(row=26, column=0, columnspan=8, padx=0, pady=5, sticky="s")
+        self.label_result.grid(row=26 + 2*offset, column=0, columnspan=8, padx=0, pady=5, sticky="s")
+
+        # Solution selector (only shown if more than one solution was found)
+        self.solutions = []
+        self.solution_select = ttk.Combobox(master, width=14, state="readonly")
+        self.solution_select.grid(row=27 + 2*offset, column=0, columnspan=8, padx=0, pady=2, sticky="s")
+        self.solution_select.grid_remove()
+        self.solution_select.bind("<<ComboboxSelected>>", self.selectSolution)
 
         # Plot and visualize result buttons
         button_plot_result = ttk.Button(master, width=20, text="Ergebnis Plotten", command=self.plotResult)
-        button_plot_result.grid(row=28, column=0, columnspan=4, padx=20, pady=12, sticky="e")
+        button_plot_result.grid(row=28 + 2*offset, column=0, columnspan=4, padx=20, pady=12, sticky="e")
         button_visualize_result = ttk.Button(master, width=20, text="Ergebnis Visualisieren", command=self.visualizeResult)
-        button_visualize_result.grid(row=28, column=4, columnspan=4, padx=20, pady=12, sticky="w")
+        button_visualize_result.grid(row=28 + 2*offset, column=4, columnspan=4, padx=20, pady=12, sticky="w")
+
+        # Solve and plot a Cartesian path from file
+        button_path = ttk.Button(master, width=20, text="Pfad Berechnen", command=self.calculatePath)
+        button_path.grid(row=29 + 2*offset, column=0, columnspan=4, padx=20, pady=0, sticky="e")
+
+        # Plot a horizontal slice of the workspace at the target height
+        button_workspace = ttk.Button(master, width=20, text="Arbeitsraum", command=self.plotWorkspace)
+        button_workspace.grid(row=29 + 2*offset, column=4, columnspan=4, padx=20, pady=0, sticky="w")
+
+        # Timing and profiling of calculations
+        button_stats = ttk.Button(master, width=20, text="Statistik", command=self.showStatsPanel)
+        button_stats.grid(row=30 + 2*offset, column=0, columnspan=4, padx=20, pady=12, sticky="e")
+
+        # Jog the end effector with sliders or keys
+        button_jog = ttk.Button(master, width=20, text="Handverfahren", command=self.showJogPanel)
+        button_jog.grid(row=30 + 2*offset, column=4, columnspan=4, padx=20, pady=12, sticky="w")
+
+        # Monte Carlo tolerance analysis of the DH parameters at the result
+        button_tolerance = ttk.Button(master, width=20, text="Toleranzanalyse", command=self.showTolerancePanel)
+        button_tolerance.grid(row=31 + 2*offset, column=0, columnspan=4, padx=20, pady=0, sticky="e")
+
+        # Calibration of the DH table from measured poses
+        button_calibration = ttk.Button(master, width=20, text="Kalibrierung", command=self.calibrateModel)
+        button_calibration.grid(row=31 + 2*offset, column=4, columnspan=4, padx=20, pady=0, sticky="w")
+
+        # Collision check settings and obstacles
+        button_collision = ttk.Button(master, width=20, text="Kollision", command=self.showCollisionPanel)
+        button_collision.grid(row=32 + 2*offset, column=0, columnspan=4, padx=20, pady=12, sticky="e")
 
         # Distance element (layout)
         bottom_dist = ttk.Label(master, width=8, text="")
-        bottom_dist.grid(row=30, column=0, columnspan=6, padx=0, pady=0, sticky="s")
+        bottom_dist.grid(row=33 + 2*offset, column=0, columnspan=6, padx=0, pady=0, sticky="s")
 
         # Set units to defaults
         self.setStartUnit(self.format_start.get())
@@ -281,7 +402,7 @@ class RobotUI:
             self.setRow(i, "disabled")
         else: 
             self.setRow(i, "normal")
-        # Reset selected preset (DH value changed)
+        # Reset selected preset and model (DH value changed)
         self.resetPreset(False)
         # Update result string
         self.createResultString(self.format_target.get())
@@ -291,15 +412,16 @@ class RobotUI:
         for i in range(6):
             # Set the state of the selected rows
             self.entry_dh_params[row][i].configure(state=state)
-        if row<5:
+        last = self.joints - 1
+        if row<last:
             # Also enable the Combobox of the next row
             self.entry_dh_params[row+1][6].configure(state="readonly")
         # Also disable all joints > disabled joint
         if state == "disabled":
-            for i in range(5-row):
-                self.entry_dh_params[5-i][6].set("Deaktiviert")
+            for i in range(last-row):
+                self.entry_dh_params[last-i][6].set("Deaktiviert")
                 for j in range(7):
-                    self.entry_dh_params[5-i][j].configure(state="disabled")
+                    self.entry_dh_params[last-i][j].configure(state="disabled")
         # Update start and target position inputs
         self.setStartUnit(self.format_start.get())
         self.setTargetUnit(self.format_target.get())
@@ -307,8 +429,14 @@ class RobotUI:
     # Resets the selected preset
     def resetPreset(self, event=False): 
         self.entry_load.set("-")
-        self.result = ["-", "-", "-", "-", "-", "-"]
+        self.model_key = None
+        # The jog panel belongs to the previous model
+        if self.jog_window is not None: self.closeJogPanel()
+        self.result = ["-"] * self.joints
+        self.result_q = None
         self.result_positions.clear()
+        self.solutions = []
+        self.solution_select.grid_remove()
         self.createResultString(self.format_target.get())
 
     # Load preset
@@ -319,55 +447,55 @@ class RobotUI:
 
     # Load a robot from preset or from file
     def loadModel(self, fromFile):
-        # Reset Joints 2-6 (DH-Table)
+        self.model_key = None
+        # Reset Joints > 1 (DH-Table)
         self.entry_dh_params[1][6].set("Deaktiviert")
         self.setRow(1, "disabled")
         self.result_positions.clear()
-        self.result = ["-", "-", "-", "-", "-", "-"]
+        self.solutions = []
+        self.solution_select.grid_remove()
+        self.result = ["-"] * self.joints
+        self.result_q = None
         self.createResultString(self.format_target.get())
 
         if fromFile:
-            # Load Robot from file
-            file_path = fd.askopenfilename(defaultextension=".csv", filetypes=[("CSV-Dateien", "*.csv")])
+            # Load robots from file (single DH table, multi-robot csv, json or npz)
+            file_path = fd.askopenfilename(filetypes=[("Roboter", "*.csv *.json *.npz"), ("CSV-Dateien", "*.csv")])
+            if not file_path: return
             self.resetPreset()
             try:
-                # CSV-Datei lesen
-                with open(file_path, mode='r') as file:
-                    reader = csv.reader(file)
-                    data = list(reader)
-
-                    # Check csv file structure
-                    if len(data) >= 2 and len(data[0]) == 8:
-                        # Read rows
-                        for i in range(len(data)-1):
-                            if data[i+1][7] in ["Rotation", "Translation"]:
-                                self.entry_dh_params[i][6].set(data[i+1][7])  # Gelenktyp
-                                self.setRow(i, "normal")
-                            else:
-                                break
-                            self.entry_dh_params[i][0].delete(0, 'end')
-                            self.entry_dh_params[i][0].insert(0, data[i+1][1])  # θ in rad
-                            self.entry_dh_params[i][1].delete(0, 'end')
-                            self.entry_dh_params[i][1].insert(0, data[i+1][2])  # d in m
-                            self.entry_dh_params[i][2].delete(0, 'end')
-                            self.entry_dh_params[i][2].insert(0, data[i+1][3])  # a in m
-                            self.entry_dh_params[i][3].delete(0, 'end')
-                            self.entry_dh_params[i][3].insert(0, data[i+1][4])  # alpha in m
-                            self.entry_dh_params[i][4].delete(0, 'end')
-                            self.entry_dh_params[i][4].insert(0, data[i+1][5])  # alpha in m
-                            self.entry_dh_params[i][5].delete(0, 'end')
-                            self.entry_dh_params[i][5].insert(0, data[i+1][6])  # alpha in m
-                            self.entry_dh_params[i][6].delete(0, 'end')
-                    else: 
-                        showerror(message="Ungültiges Dateiformat für Denavit-Hartenberg-Parameter.")
+                robots, errors = loadLibrary(file_path)
             except Exception as e:
                 showerror(message=f"Fehler beim Laden der Denavit-Hartenberg-Parameter: {str(e)}")
                 return
-            
+            if errors:
+                showerror(message="Ungültige Roboter übersprungen:\n" + "\n".join(name + ": " + message for name, _, message in errors[:10]))
+            if not robots:
+                showerror(message="Ungültiges Dateiformat für Denavit-Hartenberg-Parameter.")
+                return
+            # Loaded robots can be selected like presets, the table is only filled for the selected robot
+            # Names of presets get the file name as suffix
+            robots = {(name + " (" + os.path.basename(file_path) + ")" if name in self.preset_labels else name): rows for name, rows in robots.items()}
+            self.robot_library.update(robots)
+            self.entry_load.configure(values=self.preset_labels + list(self.robot_library))
+            name = next(iter(robots))
+            self.entry_load.set(name)
+            if not self.setDHRows(robots[name]): return
+
         else:
-            # Load robot from preset
+            # Load robot from preset or from the loaded robots
             if self.entry_load.get() == "-": return
-            robot = self.presets_dh[self.preset_labels.index(self.entry_load.get())]
+            if self.entry_load.get() in self.robot_library:
+                if not self.setDHRows(self.robot_library[self.entry_load.get()]): return
+                self.setStartUnit(self.format_start.get())
+                self.setTargetUnit(self.format_target.get())
+                self.createResultString(self.format_target.get())
+                return
+            try:
+                robot = self.presets.getDH(self.entry_load.get())
+            except Exception as e:
+                showerror(message=f"Fehler beim Laden des Presets: {str(e)}")
+                return
             for i, link in enumerate(robot.links):
                 # Get joint type
                 if link.isrevolute:
@@ -402,24 +530,33 @@ class RobotUI:
         self.createResultString(self.format_target.get())
         return
     
-    # Save the dh table to a .csv file
+    # Fills the DH table with rows [θ, d, a, alpha, min, max, type]
+    def setDHRows(self, rows):
+        if len(rows) > self.joints:
+            showerror(message="Der Roboter hat mehr als " + str(self.joints) + " Gelenke.")
+            return False
+        for i, row in enumerate(rows):
+            self.entry_dh_params[i][6].set(row[6])  # Gelenktyp
+            self.setRow(i, "normal")
+            for j in range(6):
+                self.entry_dh_params[i][j].delete(0, 'end')
+                self.entry_dh_params[i][j].insert(0, row[j])
+        return True
+
+    # Save the dh table to a .csv or .npz file
     def saveModel(self):
         try:
             # Get the file path from dialog
-            file_path = fd.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV-Dateien", "*.csv")])
-            data = [
-                ['Gelenk', 'θ in rad', 'd in m', 'a in m', 'alpha in m', 'Min', 'Max', 'Gelenktyp']
-            ]
-
-            # Add data for each joint
-            for i in range(6):
-                if self.entry_dh_params[i][6].get() == "Deaktiviert": break
-                data.append([str(i+1), self.entry_dh_params[i][0].get(), self.entry_dh_params[i][1].get(), self.entry_dh_params[i][2].get(), self.entry_dh_params[i][3].get(), self.entry_dh_params[i][4].get(), self.entry_dh_params[i][5].get(), self.entry_dh_params[i][6].get()])
-
-            # Write to csv file
-            with open(file_path, mode='w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerows(data)
+            file_path = fd.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV-Dateien", "*.csv"), ("NumPy-Dateien", "*.npz")])
+            if not file_path: return
+            if file_path.endswith(".npz"):
+                # Binary export for batch tools (see robotLibrary)
+                name = self.entry_load.get()
+                if name == "-": name = os.path.splitext(os.path.basename(file_path))[0]
+                writeRobotsNpz(file_path, {name: self.getDHRows()})
+            else:
+                # Write data for each joint to csv file
+                writeDHFile(file_path, self.getDHRows())
             showinfo(message="Speichern erfolgreich!")
         except Exception as e:
             showerror(message=f"Fehler beim Speichern der Denavit-Hartenberg-Parameter: {str(e)}")
@@ -441,12 +578,11 @@ class RobotUI:
     # Robot plot
     def showRobot(self, visualize=False, result=False):
         q = []
-        for i in range(6):
-            if result:
-                # Get the result joint values
-                if self.result[i] == "-": break
-                q.append(float(self.result[i]))
-            else:
+        if result:
+            # Get the result joint values
+            q = list(self.result_q or [])
+        else:
+            for i in range(self.joints):
                 # Get position data from Denavit Hartenberg Parameters
                 try:
                     if self.entry_dh_params[i][6].get() == "Rotation":
@@ -458,42 +594,81 @@ class RobotUI:
                 except:
                     showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter liegen nicht im richtigen Format vor.")
                     return False
+        preset = self.entry_load.get()
+        # Loaded robots are plotted from the DH table
+        if preset in self.robot_library: preset = "-"
+        if visualize:
+            # Plot robot from preset
+            if preset == "-": 
+                showerror(message="Kein Preset gewählt. Individuelle Eingaben können nicht visualisiert werden.")
+                return
+            task = lambda job: (self.presets.getURDF(preset), q)
+        else:
+            # Plot Dh robot
+            if preset == "-":
+                # Create robot object from given DH parameters (or take it from the cache)
+                getRobot = self.getRobotBuilder()
+                if not getRobot: return
+            else:
+                # Get robot data from preset
+                getRobot = lambda: self.presets.getDH(preset)
+            if result:
+                # Plot trajectory
+                q_start = self.getStartPosition(True)
+                if not q_start: return
+                getCollision = self.getCollisionBuilder()
+                def task(job):
+                    robot = getRobot()
+                    # Step count adapts to the joint distance
+                    trajectory = jointTrajectory(q_start, q)
+                    if getattr(robot, "mdh", False): return robot, trajectory.q, None, None
+                    # Samples of the trajectory near a singularity or in collision (standard DH robots only)
+                    chain = DHChain.fromRobot(robot)
+                    collision = getCollision(chain).checkTrajectory(trajectory) if getCollision is not None else None
+                    return robot, trajectory.q, scoreTrajectory(chain, trajectory), collision
+                self.plot_worker.submit(task, on_done=self.showTrajectory, on_error=self.plotError)
+                return
+            else:
+                task = lambda job: (getRobot(), q)
+        # Build robot and trajectory in the background, plot in the main thread
+        self.plot_worker.submit(task, on_done=self.plotInMainThread, on_error=self.plotError)
+        return
+
+    # Plots a trajectory and reports samples near a singularity or in collision (main thread)
+    def showTrajectory(self, data):
+        robot, q, score, collision = data
+        self.plotInMainThread((robot, q))
+        if collision is not None:
+            summary = collision.summary()
+            if summary["colliding"]:
+                showerror(message=f"{summary['colliding']} von {summary['samples']} Bahnpunkten führen zu einer Kollision (ab Punkt {summary['first'] + 1}).")
+        if score is None: return
+        summary = score.summary()
+        if summary["singular"]:
+            showinfo(message=f"{summary['singular']} von {summary['samples']} Bahnpunkten liegen nahe einer singulären Stellung (ab Punkt {summary['first_singular'] + 1}, max. Konditionszahl {summary['max_condition']:.0f}).")
+
+    # Plots a robot in the given position or trajectory
+    def plotInMainThread(self, data):
+        robot, q = data
         try:
-            if visualize:
-                # Plot robot from preset
-                if self.entry_load.get() == "-": 
-                    showerror(message="Kein Preset gewählt. Individuelle Eingaben können nicht visualisiert werden.")
-                    return
-                robot = self.presets_urdf[self.preset_labels.index(self.entry_load.get())]
-                robot.plot(q=q)
+            if getattr(robot, "mdh", True):
+                # URDF models and modified DH parameters are plotted by the toolbox
+                robot.plot(q)
             else:
-                # Plot Dh robot
-                if self.entry_load.get() == "-":
-                    # Create robot object from given DH parameters
-                    robot = self.createRobotFromDH()
-                    if not robot: return
-                else:
-                    # Get robot data from preset
-                    robot = self.presets_dh[self.preset_labels.index(self.entry_load.get())]
-                if result:
-                    # Plot trajectory
-                    q_start = self.getStartPosition(True)
-                    if not q_start: return
-                    traj = rtb.jtraj(q_start, q, 50)
-                    traj.q.shape
-                    robot.plot(traj.q)
-                    #rtb.xplot(traj.q)
-                else:
-                    robot.plot(q=q)
+                # DH robots are shown in the reused plot window
+                self.robot_plot.show(DHChain.fromRobot(robot), q, robot.name)
         except Exception as e:
-            showerror(message="Darstellung nicht möglich. Eingaben und Ergebnis prüfen!")
-        return
+            self.plotError(e)
+
+    # Shows plot errors
+    def plotError(self, e):
+        showerror(message="Darstellung nicht möglich. Eingaben und Ergebnis prüfen!\n\n" + str(e))
 
     # Updates the start position input units       
     def setStartUnit(self, unit):
         # Set lables if rotation input
         if unit == "Gelenkposition":
-            for i in range(6):
+            for i in range(self.joints):
                 # Set Lables for rotation
                 if self.entry_dh_params[i][6].get()=="Rotation":
                     self.start_position[i][1].config(text=" rad")
@@ -513,12 +688,17 @@ class RobotUI:
                 self.start_position[i][0].config(state="normal")
                 self.start_position[i][1].config(text=self.coordinate_units[i])
                 self.start_position[i][2].config(text=self.coordinate_lables[i])
+            # Inputs of joints > 6 are not used for coordinates
+            for i in range(6, self.joints):
+                self.start_position[i][0].config(state="disabled")
+                self.start_position[i][1].config(text="")
+                self.start_position[i][2].config(text="")
 
     # Updates the target position inputs
     def setTargetUnit(self, unit):
         # Set lables if rotation input
         if unit == "Gelenkposition":
-            for i in range(6):
+            for i in range(self.joints):
                 # Set Lables for rotation
                 if self.entry_dh_params[i][6].get()=="Rotation":
                     self.target_position[i][1].config(text="rad")
@@ -538,13 +718,18 @@ class RobotUI:
                 self.target_position[i][0].config(state="normal")
                 self.target_position[i][1].config(text=self.coordinate_units[i])
                 self.target_position[i][2].config(text=self.coordinate_lables[i])
+            # Inputs of joints > 6 are not used for coordinates
+            for i in range(6, self.joints):
+                self.target_position[i][0].config(state="disabled")
+                self.target_position[i][1].config(text="")
+                self.target_position[i][2].config(text="")
 
     # Creates result output string
     def createResultString(self, unit):
         result_text=""
         # Set lables if koordinate input, that means rotational output
         if unit == "Koordinaten":
-            for i in range(6):
+            for i in range(self.joints):
                 # Set Lables for rotation
                 if self.entry_dh_params[i][6].get()=="Rotation":
                     result_text += " θ"+self.subscript_numbers[i+1]+ "= " + self.result[i] + " rad, "
@@ -556,42 +741,61 @@ class RobotUI:
         # Set lables if translation input
         else:
             for i in range(6):
-                result_text += self.coordinate_lables[i] + "= " + self.result[i] + self.coordinate_units[i] + ", "
+                result_text += self.coordinate_lables[i] + " " + self.result[i] + self.coordinate_units[i] + ", "
         self.label_result.config(text=result_text[:-2])
 
-    # Creates a robot object from the DH-table input
-    def createRobotFromDH(self):
-        robot_config = []
-        # Read robot conig for each joint
-        for i in range(6):
+    # Returns the DH table input as rows of strings (active joints only)
+    def getDHRows(self):
+        rows = []
+        for i in range(self.joints):
             if self.entry_dh_params[i][6].get() == "Deaktiviert": break
-            try:
-                theta = parseInputString(self.entry_dh_params[i][0].get())
-                d = parseInputString(self.entry_dh_params[i][1].get())
-                a = parseInputString(self.entry_dh_params[i][2].get())
-                alpha = parseInputString(self.entry_dh_params[i][3].get()) 
-                min = parseInputString(self.entry_dh_params[i][4].get()) 
-                max = parseInputString(self.entry_dh_params[i][5].get()) 
-            except Exception as e:
-                print(e)
-                showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter liegen nicht im richtigen Format vor.")
-                return False
-            # Add joint to robot config (as object)
-            if self.entry_dh_params[i][6].get() == "Rotation":
-                robot_config.append(rtb.RevoluteDH(d=d, a=a, alpha=alpha, qlim=[min, max]))
-            elif self.entry_dh_params[i][6].get() == "Translation":
-                robot_config.append(rtb.PrismaticDH(theta=theta, a=a, alpha=alpha, qlim=[min, max]))
-            else:
-                showerror(message="Eingabefehler. Der gewählte Joint Typ ist nicht bekannt.")
-                return False
+            rows.append([self.entry_dh_params[i][j].get() for j in range(7)])
+        return rows
+
+    # Returns the cache key of the DH-table input (only recomputed after changes)
+    def getModelKey(self):
+        if self.model_key is None:
+            self.model_key = dhTableKey(self.getDHRows())
+        return self.model_key
+
+    # Returns a function that creates the robot object from the DH-table input
+    # The DH table is only parsed if the robot is not cached (can be called in a background thread)
+    def getRobotBuilder(self):
+        key = self.getModelKey()
+        robot = self.model_cache.lookup(key)
+        if robot is not None: return lambda: robot
+        # Read robot conig for each joint
+        try:
+            dh_params = parseDHTable(self.getDHRows())
+        except Exception as e:
+            print(e)
+            showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter liegen nicht im richtigen Format vor.")
+            return False
         # Create and return robot object
-        return rtb.DHRobot(robot_config, name="Robot")
+        return lambda: self.model_cache.get(key, lambda: createRobot(dh_params))
+
+    # Returns a function that creates the DH params and the DH chain from the DH-table input (see getRobotBuilder)
+    def getChainBuilder(self):
+        key = self.getModelKey()
+        cached = self.chain_cache.lookup(key)
+        if cached is not None: return lambda: cached
+        rows = self.getDHRows()
+        def build():
+            dh_params = parseDHTable(rows)
+            return dh_params, DHChain.fromDHParams(dh_params)
+        return lambda: self.chain_cache.get(key, build)
+
+    # Creates a robot object from the DH-table input
+    def createRobotFromDH(self):
+        getRobot = self.getRobotBuilder()
+        if not getRobot: return False
+        return getRobot()
     
     def getStartPosition(self, fromStartPos=False):
         if fromStartPos:
             if(self.format_start.get()=="Gelenkposition"):
                 q_start = []
-                for i in range(6):
+                for i in range(self.joints):
                     if self.entry_dh_params[i][6].get() in ["Rotation", "Translation"]:
                         q_start.append(parseInputString(self.start_position[i][0].get()))
                     else:
@@ -602,7 +806,7 @@ class RobotUI:
                 return False
         else:
             q_start = []
-            for i in range(6):
+            for i in range(self.joints):
                 if self.entry_dh_params[i][6].get() in ["Rotation", "Translation"]:
                     q_start.append(parseInputString(self.start_position[i].get()))
                 else:
@@ -611,65 +815,617 @@ class RobotUI:
 
     # Calculate the result from the given input
     def calculate(self):    
-        # Get start position input
+        # Time of each calculation phase
+        timer = SolveTimer()
+        with timer.phase("parsing"):
+            # Get start position input
+            q_start = self.getStartPosition(True)
+            if not q_start: return
+            
+            # Get target position input
+            if(self.format_target.get()=="Koordinaten"):
+                target = [parseInputString(self.target_position[i][0].get()) for i in range(6)]
+            else:
+                # Joint space target, the result is the pose (forward kinematics)
+                self.calculatePose()
+                return
+
+            # Read rtb robot model input (skipped if the robot is cached)
+            getRobot = self.getRobotBuilder()
+            if not getRobot: return
+
+            # Calculate Inverse Kinematics (LM, GN or NR)
+            solver = self.solver.get()
+            joint_limits = self.limits.get()=="Aktiv"
+            if solver not in SOLVERS:
+                # Wrong selection error
+                showerror(message="Der gewählte Solver steht nicht zur Verfügung.") 
+                return
+
+            # DH chain for the singularity and collision check and the sampled workspace (only valid within the joint limits)
+            getChain = self.getChainBuilder()
+            getCollision = self.getCollisionBuilder()
+        with timer.phase("transform"):
+            target_transformation = targetTransform(target)
+
+        # Create robot and solve in the background
+        search = self.search.get()
+        previous = [list(q) for q in self.result_positions]
+        model = self.getModelKey()
+        store = self.solution_store
+        def solve(job, robot, index):
+            if search == "Einzeln":
+                # Identical calculation done before
+                result = store.lookup(model, target_transformation, q_start, solver, joint_limits)
+                if result is not None: return [result]
+                # Start at the solution of a nearby target from previous calculations
+                seed = store.nearest(model, target_transformation)
+                result = None
+                if seed is not None:
+                    result = solveIK(robot, solver, target_transformation, seed, joint_limits)
+                if result is None or not result.success:
+                    result = solveIK(robot, solver, target_transformation, q_start, joint_limits)
+                if not result.success and index is not None:
+                    # Retry from the sampled position closest to the target
+                    retry = solveIK(robot, solver, target_transformation, index.nearestSeed(target_transformation), joint_limits)
+                    if retry.success: result = retry
+                if result.success:
+                    store.add(model, target_transformation, q_start, solver, joint_limits, result.q, result.residual)
+                return [result]
+            # Solve from the start position, previous solutions, stored and sampled positions close to the target and random positions
+            seed = store.nearest(model, target_transformation)
+            if seed is not None: previous.append(list(seed))
+            if index is not None: previous.append(list(index.nearestSeed(target_transformation)))
+            return solveMultiStart(robot, solver, target_transformation, q_start, self.multi_starts, joint_limits, previous, search == "Alle Lösungen", job.isCancelled)
+        # Removes colliding solutions, if all collide the other solution branches are searched
+        def removeCollisions(job, robot, chain, solutions):
+            model = getCollision(chain)
+            free, removed = filterSolutions(model, solutions)
+            if not free and search != "Alle Lösungen":
+                job.progress("Lösung kollidiert, weitere Lösungen werden gesucht ...")
+                candidates = solveMultiStart(robot, solver, target_transformation, q_start, self.multi_starts, joint_limits, previous, True, job.isCancelled)
+                free, more = filterSolutions(model, candidates)
+                removed += more
+                free = free[:1]
+            info["collisions"] = removed
+            return free
+        def task(job):
+            job.progress("Modell wird erstellt ...")
+            with timer.phase("model"):
+                robot = getRobot()
+                dh_params, chain = getChain()
+            index = None
+            if joint_limits:
+                job.progress("Arbeitsraum wird geprüft ...")
+                with timer.phase("workspace"):
+                    index = getReachabilityIndex(dh_params)
+                    # Reject targets outside of the workspace without running the solver
+                    if not index.isReachable(target[:3]): return None
+                    # Flag targets near a singularity before solving (sampled position closest to the target)
+                    info["singular_target"] = bool(isNearSingular(chain, index.nearestSeed(target_transformation)))
+            job.progress("Ziel nahe einer Singularität, Berechnung läuft ..." if info.get("singular_target") else "Berechnung läuft ...")
+            with timer.phase("solver"):
+                solutions = self.solver_stats.profile(lambda: solve(job, robot, index))
+            if getCollision is not None and solutions and solutions[0].success:
+                job.progress("Kollisionsprüfung ...")
+                with timer.phase("collision"):
+                    solutions = removeCollisions(job, robot, chain, solutions)
+            if solutions and solutions[0].success:
+                info["condition"] = float(manipulabilityMap(chain, solutions[0].q).condition[0])
+            return solutions
+        info = {"solver": solver, "search": search, "joint_limits": joint_limits, "target": target}
+        self.calculation_worker.submit(task, on_done=lambda solutions: self.showCalculationResult(solutions, timer, info), on_error=self.calculationError)
+
+    # Calculates the pose of a joint space target (forward kinematics)
+    def calculatePose(self):
+        try:
+            dh_params = parseDHTable(self.getDHRows())
+            q = [parseInputString(self.target_position[i][0].get()) for i in range(len(dh_params))]
+        except Exception as e:
+            showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter oder die Zielposition liegen nicht im richtigen Format vor.\n\n" + str(e))
+            return
+        if not dh_params:
+            showerror(message="Keine Gelenke aktiviert.")
+            return
+        chain = DHChain.fromDHParams(dh_params)
+        if self.limits.get()=="Aktiv" and (np.any(np.array(q) < chain.qlim[0]) or np.any(np.array(q) > chain.qlim[1])):
+            showerror(message="Die Zielposition liegt außerhalb der Gelenkgrenzen.")
+            return
+        pose = chain.fkineXYZABC(q)[0]
+        self.solutions = []
+        self.solution_select.grid_remove()
+        self.result_q = q
+        self.result = [str(round(float(value), 4)) for value in pose] + ["-"] * (self.joints - 6)
+        self.createResultString(self.format_target.get())
+        if isNearSingular(chain, q):
+            showinfo(message="Die Zielposition ist eine singuläre Stellung oder liegt nahe daran.")
+
+    # Shows the result of a calculation (main thread)
+    def showCalculationResult(self, solutions, timer=None, info=None):
+        with (timer or SolveTimer()).phase("ui"):
+            if info and info.get("collisions") and not solutions:
+                showerror(message="Alle gefundenen Lösungen (" + str(info["collisions"]) + ") führen zu einer Kollision.")
+            else:
+                self.updateCalculationResult(solutions, info)
+        if timer is not None:
+            # Store the timing and solver output (shown in the stats panel)
+            self.solver_stats.record(timer, solutions, **(info or {}))
+            self.updateStatsPanel()
+        if info and info.get("condition", 0) > CONDITION_LIMIT:
+            showinfo(message="Die Lösung liegt nahe einer singulären Stellung (Konditionszahl " + str(round(info["condition"])) + ").")
+
+    # Updates the result from a calculation
+    def updateCalculationResult(self, solutions, info=None):
+        # Target outside of the sampled workspace
+        if solutions is None:
+            showerror(message="Die Zielposition liegt außerhalb des Arbeitsraums des Roboters.")
+            return
+        # Handle "no solution found"
+        if not solutions or not solutions[0].success: 
+            message = "Mit dem gewählten Solver konnte keine Lösung gefunden werden, um die Zielposition mit der gegebenen Kinematik zu erreichen."
+            if info and info.get("singular_target"): message += " Die Zielposition liegt nahe einer singulären Stellung."
+            showerror(message=message)
+            return 
+        # Solution found
+        else:
+            self.solutions = [result for result in solutions if result.success]
+            # Remember solution as start position for multi-start
+            self.result_positions.append(list(self.solutions[0].q))
+            del self.result_positions[:-20]
+            # Show selector if there are multiple solution branches
+            if len(self.solutions) > 1:
+                self.solution_select.configure(values=["Lösung " + str(i+1) + " von " + str(len(self.solutions)) for i in range(len(self.solutions))])
+                self.solution_select.current(0)
+                self.solution_select.grid()
+            else:
+                self.solution_select.grid_remove()
+            self.setResult(self.solutions[0].q)
+
+    # Shows the selected solution branch
+    def selectSolution(self, event=False):
+        index = self.solution_select.current()
+        if 0 <= index < len(self.solutions):
+            self.setResult(self.solutions[index].q)
+
+    # Sets the result joint values
+    def setResult(self, q):
+        self.result_q = [float(value) for value in q]
+        for i in range(self.joints):
+            if self.entry_dh_params[i][6].get() == "Deaktiviert":
+                self.result[i] = "-"
+            else:
+                self.result[i] = str(round(q[i], 4))
+        # Output result
+        self.createResultString(self.format_target.get())
+
+    # Solves a Cartesian path from file (rows X, Y, Z, A, B, C) and plots the joint trajectory
+    def calculatePath(self):
+        file_path = fd.askopenfilename(filetypes=[("Pfad", "*.csv *.npy")])
+        if not file_path: return
         q_start = self.getStartPosition(True)
         if not q_start: return
-        
-        # Get target position input
-        target_transformation = np.empty((4, 4))
-        if(self.format_target.get()=="Koordinaten"):
-            X = parseInputString(self.target_position[0][0].get())
-            Y = parseInputString(self.target_position[1][0].get())
-            Z = parseInputString(self.target_position[2][0].get())
-            A = parseInputString(self.target_position[3][0].get())
-            B = parseInputString(self.target_position[4][0].get())
-            C = parseInputString(self.target_position[5][0].get())
-            rotation = Rotation.from_euler('XYZ', [A, B, C])
-            target_transformation = np.vstack((np.hstack((rotation.as_matrix(), [[X], [Y], [Z]])), [0, 0, 0, 1]))
+        getRobot = self.getRobotBuilder()
+        if not getRobot: return
+        solver = self.solver.get()
+        joint_limits = self.limits.get()=="Aktiv"
+
+        # Every path point starts at the previous solution
+        def task(job):
+            robot = getRobot()
+            results = []
+            count = 0
+            for result in solvePath(robot, readTargets(file_path), solver, q_start, joint_limits):
+                if job.isCancelled(): return None
+                results.append(result)
+                count += len(result)
+                job.progress(str(count) + " Pfadpunkte berechnet ...")
+            return robot, results
+        self.calculation_worker.submit(task, on_done=self.showPath, on_error=self.calculationError)
+
+    # Shows the result of a path calculation and plots the trajectory (main thread)
+    def showPath(self, data):
+        if data is None: return
+        robot, results = data
+        if not results:
+            showerror(message="Die Pfaddatei enthält keine Zielpositionen.")
+            return
+        q = np.vstack([result.q for result in results])
+        failed = sum(int(np.count_nonzero(~result.success)) for result in results)
+        jumps = sum(int(np.count_nonzero(result.jumps)) for result in results)
+        if failed:
+            showerror(message=f"Für {failed} von {len(q)} Pfadpunkten konnte keine Lösung gefunden werden.")
+        elif jumps:
+            showinfo(message=f"Der Pfad enthält {jumps} Gelenksprünge (Wechsel der Gelenkkonfiguration).")
+        self.setResult(q[-1])
+        self.plotInMainThread((robot, q))
+
+    # Plots a horizontal slice of the sampled workspace at the target height
+    def plotWorkspace(self):
+        try:
+            dh_params = parseDHTable(self.getDHRows())
+            target = [parseInputString(self.target_position[i][0].get()) for i in range(3)]
+        except Exception as e:
+            showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter oder die Zielposition liegen nicht im richtigen Format vor.\n\n" + str(e))
+            return
+        if not dh_params:
+            showerror(message="Keine Gelenke aktiviert.")
+            return
+        self.plot_worker.submit(lambda job: (getReachabilityIndex(dh_params), target), on_done=self.showWorkspace, on_error=self.plotError)
+
+    # Shows the workspace slice (main thread)
+    def showWorkspace(self, data):
+        index, target = data
+        import matplotlib.pyplot as plt
+        grid, extent = index.slice(target[2])
+        plt.figure("Arbeitsraum")
+        plt.clf()
+        plt.imshow(grid.T, origin="lower", extent=extent, cmap="Greys", vmin=0, vmax=2)
+        plt.plot(target[0], target[1], "rx" if not index.isReachable(target) else "gx")
+        plt.title("Arbeitsraum bei Z = " + str(round(target[2], 4)))
+        plt.xlabel("X")
+        plt.ylabel("Y")
+        plt.show(block=False)
+
+    # Opens the jog panel, the end effector is moved from the result (or the start position) with sliders or keys
+    def showJogPanel(self):
+        if self.jog_window is not None and self.jog_window.winfo_exists():
+            self.jog_window.lift()
+            return
+        try:
+            dh_params = parseDHTable(self.getDHRows())
+            q = self.result_q if self.result_q is not None and len(self.result_q) == len(dh_params) else self.getStartPosition(True)
+        except Exception as e:
+            showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter oder die Startposition liegen nicht im richtigen Format vor.\n\n" + str(e))
+            return
+        if not dh_params:
+            showerror(message="Keine Gelenke aktiviert.")
+            return
+        if not q: return
+        # The DH chain is built once per model
+        chain = self.jog_chains.get(self.getModelKey(), lambda: DHChain.fromDHParams(dh_params))
+        self.jog = JogController(chain, q, self.limits.get()=="Aktiv")
+        window = tk.Toplevel(self.master)
+        window.title("Handverfahren")
+        window.resizable(width=False, height=False)
+        window.protocol("WM_DELETE_WINDOW", self.closeJogPanel)
+        self.jog_window = window
+        # Velocity sliders (back to 0 when released)
+        for i, label in enumerate(self.coordinate_lables):
+            ttk.Label(window, text=label[0]).grid(row=i, column=0, padx=10, pady=2, sticky="e")
+            slider = ttk.Scale(window, from_=-1, to=1, orient="horizontal", length=240, command=lambda value, i=i: self.jog.setAxis(i, float(value)))
+            slider.bind("<ButtonRelease-1>", lambda event, slider=slider: slider.set(0))
+            slider.grid(row=i, column=1, columnspan=2, padx=10, pady=2, sticky="w")
+        ttk.Label(window, text="Koordinatensystem: ").grid(row=6, column=0, columnspan=2, padx=10, pady=5, sticky="e")
+        jog_frame = ttk.Combobox(window, width=10, values=["Basis", "Werkzeug"], state="readonly")
+        jog_frame.set("Basis")
+        jog_frame.bind("<<ComboboxSelected>>", lambda event: setattr(self.jog, "tool_frame", jog_frame.get() == "Werkzeug"))
+        jog_frame.grid(row=6, column=2, padx=10, pady=5, sticky="w")
+        self.label_jog = ttk.Label(window, justify="left", font=("Courier", 10))
+        self.label_jog.grid(row=7, column=0, columnspan=3, padx=10, pady=5, sticky="w")
+        ttk.Label(window, text="Tasten: ←/→ X, ↑/↓ Y, Bild ↑/↓ Z, Q/A, W/S, E/D Rotation").grid(row=8, column=0, columnspan=3, padx=10, pady=5)
+        # Key events only change the commanded velocity, the control loop applies them
+        window.bind("<KeyPress>", lambda event: self.jog.setKey(event.keysym, True))
+        window.bind("<KeyRelease>", lambda event: self.jog.setKey(event.keysym, False))
+        window.focus_set()
+        self.solutions = []
+        self.solution_select.grid_remove()
+        self.showJogPosition()
+        self.jog_time = time.perf_counter()
+        self.jog_after = self.master.after(int(1000 / JOG_RATE), self.jogStep)
+
+    def closeJogPanel(self):
+        if self.jog_after is not None:
+            self.master.after_cancel(self.jog_after)
+            self.jog_after = None
+        if self.jog_window is not None:
+            self.jog_window.destroy()
+        self.jog_window = None
+        self.jog = None
+
+    # Control loop of the jog mode (fixed rate, all input events since the last step are applied at once)
+    def jogStep(self):
+        now = time.perf_counter()
+        # Limited time step, a blocked main thread does not cause a jump
+        dt = min(now - self.jog_time, 2.0 / JOG_RATE)
+        self.jog_time = now
+        if self.jog.step(dt):
+            self.showJogPosition()
+        self.jog_after = self.master.after(int(1000 / JOG_RATE), self.jogStep)
+
+    # Shows the jog position in the result, the jog panel and the plot
+    def showJogPosition(self):
+        q = self.jog.q
+        pose = self.jog.pose()
+        if self.format_target.get() == "Koordinaten":
+            self.setResult(q)
         else:
-            # Right now only coordinate input is supported
-            showerror(message="Funktion nicht verfügbar. Bisher können nur Koordinaten als Ziel genutzt werden.") 
+            self.result_q = [float(value) for value in q]
+            self.result = [str(round(float(value), 4)) for value in pose] + ["-"] * (self.joints - 6)
+            self.createResultString(self.format_target.get())
+        values = [label + " " + format(value, "8.4f") + unit for label, value, unit in zip(self.coordinate_lables, pose, self.coordinate_units)]
+        self.label_jog.config(text="  ".join(values[:3]) + "\n" + "  ".join(values[3:]))
+        self.robot_plot.update(self.jog.chain, q)
+
+    # Opens the tolerance analysis panel (tolerances of a, d and alpha, number of samples)
+    def showTolerancePanel(self):
+        if self.tolerance_window is not None and self.tolerance_window.winfo_exists():
+            self.tolerance_window.lift()
             return
-
-        # Create rtb robot model
-        robot = self.createRobotFromDH()
-        if not robot: return
-
-        # Calculate Inverse Kinematics
-        # Levemberg-Marquadt selected
-        if self.solver.get() == "IK_LM":
-            result = robot.ikine_LM(target_transformation, q0=q_start, joint_limits=(self.limits.get()=="Aktiv"))
-        # Quadratic programming approach solver selected (not available right now)
-        elif self.solver.get() == "IK_QP":
-            #result = robot.ikine_QP(target_transformation, q0=q_start, joint_limits=(self.limits.get()=="Aktiv"))
-            print("Solver not available roght now")
-        #  Gauss-Newton selected
-        elif self.solver.get() == "IK_GN":
-            result = robot.ikine_GN(target_transformation, q0=q_start, joint_limits=(self.limits.get()=="Aktiv"))
-        # Newton-Raphson selected
-        elif self.solver.get() == "IK_NR":
-            result = robot.ikine_NR(target_transformation, q0=q_start, joint_limits=(self.limits.get()=="Aktiv"))
-        # Wrong selection error
+        window = tk.Toplevel(self.master)
+        window.title("Toleranzanalyse")
+        window.resizable(width=False, height=False)
+        window.protocol("WM_DELETE_WINDOW", self.closeTolerancePanel)
+        self.tolerance_window = window
+        self.tolerance_inputs = []
+        for i, (label, value) in enumerate([("Toleranz ± a in m", TOLERANCE_A), ("Toleranz ± d in m", TOLERANCE_D), ("Toleranz ± α in rad", TOLERANCE_ALPHA), ("Max. Stichproben", MAX_SAMPLES)]):
+            ttk.Label(window, text=label).grid(row=i, column=0, padx=10, pady=2, sticky="e")
+            entry = ttk.Entry(window, width=12)
+            entry.insert(0, str(value))
+            entry.grid(row=i, column=1, padx=10, pady=2, sticky="w")
+            self.tolerance_inputs.append(entry)
+        ttk.Button(window, width=16, text="Start", command=self.calculateTolerances).grid(row=4, column=0, columnspan=2, padx=10, pady=10)
+        self.label_tolerance = ttk.Label(window, justify="left", font=("Courier", 10))
+        self.label_tolerance.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+
+    def closeTolerancePanel(self):
+        self.tolerance_worker.cancel()
+        self.tolerance_window.destroy()
+        self.tolerance_window = None
+
+    # Runs the tolerance analysis at all solutions of the last calculation (or the result position)
+    def calculateTolerances(self):
+        try:
+            dh_params = parseDHTable(self.getDHRows())
+            tolerances = [parseInputString(entry.get()) for entry in self.tolerance_inputs[:3]]
+            max_samples = int(parseInputString(self.tolerance_inputs[3].get()))
+        except Exception as e:
+            showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter oder die Toleranzen liegen nicht im richtigen Format vor.\n\n" + str(e))
+            return
+        if not dh_params:
+            showerror(message="Keine Gelenke aktiviert.")
+            return
+        if self.solutions:
+            Q = [list(result.q) for result in self.solutions]
+        elif self.result_q is not None:
+            Q = [self.result_q]
         else:
-            showerror(message="Der gewählte Solver steht nicht zur Verfügung.") 
+            showerror(message="Kein Ergebnis vorhanden. Bitte zuerst eine Lösung berechnen.")
+            return
+        if any(len(q) != len(dh_params) for q in Q):
+            showerror(message="Das Ergebnis passt nicht zur aktuellen Kinematik. Bitte neu berechnen.")
+            return
+        chain = DHChain.fromDHParams(dh_params)
+
+        # Intermediate results are shown after every batch of samples
+        def task(job):
+            statistics = None
+            for results in analyseTolerances(chain, Q, tolerances, max_samples, cancelled=job.isCancelled):
+                statistics = [result.statistics() for result in results]
+                job.progress(statistics)
+            return statistics
+        self.label_tolerance.config(text="Berechnung läuft ...")
+        self.tolerance_worker.submit(task, on_done=self.showToleranceResult, on_error=self.calculationError)
+
+    # Shows the error distribution per solution in mm and mrad (main thread)
+    def showToleranceResult(self, statistics):
+        if statistics is None or self.tolerance_window is None: return
+        lines = ["{:<10}{:>8}{:>10}{:>10}{:>10}{:>10}".format("", "N", "Mittel", "p95", "p99", "Max")]
+        for i, result in enumerate(statistics):
+            label = "Lösung " + str(i+1)
+            lines.append(label + (" (konvergiert)" if result["converged"] else ""))
+            for name, unit in [("position", "mm"), ("orientation", "mrad")]:
+                values = [result[name][key] * 1e3 for key in ["mean", "p95", "p99", "max"]]
+                lines.append("{:<10}{:>8}{:>10.4f}{:>10.4f}{:>10.4f}{:>10.4f}".format(("Pos. " if name == "position" else "Ori. ") + unit, result["samples"], *values))
+        self.label_tolerance.config(text="\n".join(lines))
+
+    # Fits the DH table to measurements from file (rows q1 ... qn, X, Y, Z[, A, B, C]),
+    # the calibrated table replaces the input and can be saved
+    def calibrateModel(self):
+        try:
+            dh_params = parseDHTable(self.getDHRows())
+        except Exception as e:
+            showerror(message="Eingabefehler. Die Denavit-Hartenberg-Parameter liegen nicht im richtigen Format vor.\n\n" + str(e))
+            return
+        if not dh_params:
+            showerror(message="Keine Gelenke aktiviert.")
             return
-        # Print result (internal)
-        print(result)
+        file_path = fd.askopenfilename(filetypes=[("Messdaten", "*.csv")])
+        if not file_path: return
+        chain = DHChain.fromDHParams(dh_params)
+
+        def task(job):
+            job.progress("Messdaten werden gelesen ...")
+            Q, poses = readMeasurements(file_path, chain.n)
+            def progress(iteration, cost):
+                if job.isCancelled(): raise InterruptedError("Kalibrierung abgebrochen")
+                job.progress("Kalibrierung: Iteration " + str(iteration) + ", " + str(len(Q)) + " Messungen ...")
+            return dh_params, calibrate(chain, Q, poses, progress=progress)
+        self.calculation_worker.submit(task, on_done=self.showCalibrationResult, on_error=self.calculationError)
+
+    # Shows the residuals before and after the calibration and offers to save the calibrated table (main thread)
+    def showCalibrationResult(self, data):
+        dh_params, result = data
+        if not self.setDHRows(result.dhRows(dh_params)): return
+        self.resetPreset()
+        lines = []
+        for label, statistics in [("Vorher", result.before), ("Nachher", result.after)]:
+            text = label + ": Position RMS " + str(round(statistics["position"]["rms"]*1e3, 4)) + " mm, max. " + str(round(statistics["position"]["max"]*1e3, 4)) + " mm"
+            if "orientation" in statistics:
+                text += ", Orientierung RMS " + str(round(statistics["orientation"]["rms"]*1e3, 4)) + " mrad"
+            lines.append(text)
+        lines.append(str(result.iterations) + " Iterationen, " + str(result.rank) + " von " + str(len(result.deviations)) + " Parametern identifizierbar.")
+        showinfo(message="Kalibrierung abgeschlossen.\n" + "\n".join(lines) + "\nDie kalibrierte Tabelle wurde übernommen und kann jetzt gespeichert werden.")
+        self.saveModel()
+
+    # Returns a function that builds the collision model of a DH chain with the current settings (None if the check is off)
+    # The model is cached per DH table, base, tool and settings (can be called in a background thread)
+    def getCollisionBuilder(self):
+        if not self.collision_active: return None
+        key = self.getModelKey()
+        radius, floor, obstacles = self.collision_radius, self.collision_floor, list(self.obstacles)
+        settings = (radius, floor, tuple(repr(box) for box in obstacles))
+        def build(chain):
+            frames = tuple(None if T is None else T.tobytes() for T in (chain.base, chain.tool))
+            return self.collision_models.get((key, frames, settings), lambda: CollisionModel(chain, radius, obstacles, floor))
+        return build
+
+    # Opens the collision panel (check on/off, link radius, floor height and box obstacles from file)
+    def showCollisionPanel(self):
+        if self.collision_window is not None and self.collision_window.winfo_exists():
+            self.collision_window.lift()
+            return
+        window = tk.Toplevel(self.master)
+        window.title("Kollision")
+        window.resizable(width=False, height=False)
+        window.protocol("WM_DELETE_WINDOW", self.closeCollisionPanel)
+        self.collision_window = window
+        ttk.Label(window, text="Kollisionsprüfung").grid(row=0, column=0, padx=10, pady=2, sticky="e")
+        self.collision_state = ttk.Combobox(window, width=10, values=["Aktiv", "Inaktiv"], state="readonly")
+        self.collision_state.set("Aktiv" if self.collision_active else "Inaktiv")
+        self.collision_state.grid(row=0, column=1, padx=10, pady=2, sticky="w")
+        ttk.Label(window, text="Radius der Glieder in m").grid(row=1, column=0, padx=10, pady=2, sticky="e")
+        self.collision_radius_input = ttk.Entry(window, width=12)
+        self.collision_radius_input.insert(0, str(self.collision_radius))
+        self.collision_radius_input.grid(row=1, column=1, padx=10, pady=2, sticky="w")
+        ttk.Label(window, text="Boden Z in m (leer = kein Boden)").grid(row=2, column=0, padx=10, pady=2, sticky="e")
+        self.collision_floor_input = ttk.Entry(window, width=12)
+        if self.collision_floor is not None: self.collision_floor_input.insert(0, str(self.collision_floor))
+        self.collision_floor_input.grid(row=2, column=1, padx=10, pady=2, sticky="w")
+        ttk.Button(window, width=16, text="Hindernisse laden", command=self.loadObstacles).grid(row=3, column=0, padx=10, pady=5)
+        ttk.Button(window, width=16, text="Hindernisse löschen", command=lambda: self.setObstacles([])).grid(row=3, column=1, padx=10, pady=5)
+        self.label_obstacles = ttk.Label(window, justify="left", font=("Courier", 10))
+        self.label_obstacles.grid(row=4, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+        ttk.Button(window, width=16, text="Übernehmen", command=self.applyCollisionSettings).grid(row=5, column=0, columnspan=2, padx=10, pady=10)
+        self.setObstacles(self.obstacles)
+
+    def closeCollisionPanel(self):
+        self.collision_window.destroy()
+        self.collision_window = None
+
+    # Reads box obstacles (rows Name, X_min, Y_min, Z_min, X_max, Y_max, Z_max)
+    def loadObstacles(self):
+        file_path = fd.askopenfilename(filetypes=[("Hindernisse", "*.csv")])
+        if not file_path: return
+        try:
+            self.setObstacles(readObstacles(file_path))
+        except Exception as e:
+            showerror(message="Fehler beim Laden der Hindernisse: " + str(e))
 
-        # Handle "no solution found"
-        if not result.success: 
-            showerror(message="Mit dem gewählten Solver konnte keine Lösung gefunden werden, um die Zielposition mit der gegebenen Kinematik zu erreichen.")
-            return 
-        # Solution found
+    # Sets the obstacles and lists them in the collision panel
+    def setObstacles(self, obstacles):
+        self.obstacles = list(obstacles)
+        if self.collision_window is None: return
+        lines = [(box.name or "Box") + ": " + " ".join(format(value, ".3f") for value in box.lower) + " / " + " ".join(format(value, ".3f") for value in box.upper) for box in self.obstacles]
+        self.label_obstacles.config(text="\n".join(lines) if lines else "Keine Hindernisse")
+
+    # Applies the settings of the collision panel
+    def applyCollisionSettings(self):
+        try:
+            radius = parseInputString(self.collision_radius_input.get())
+            floor = self.collision_floor_input.get().strip()
+            floor = parseInputString(floor) if floor else None
+        except Exception as e:
+            showerror(message="Eingabefehler. Radius oder Bodenhöhe liegen nicht im richtigen Format vor.\n\n" + str(e))
+            return
+        if radius < 0:
+            showerror(message="Der Radius darf nicht negativ sein.")
+            return
+        self.collision_active = self.collision_state.get() == "Aktiv"
+        self.collision_radius = radius
+        self.collision_floor = floor
+        self.closeCollisionPanel()
+
+    # Opens the stats panel (timing of the last calculations, export and profiling)
+    def showStatsPanel(self):
+        if self.stats_window is not None and self.stats_window.winfo_exists():
+            self.updateStatsPanel()
+            return
+        window = tk.Toplevel(self.master)
+        window.title("Statistik")
+        window.resizable(width=False, height=False)
+        window.protocol("WM_DELETE_WINDOW", self.closeStatsPanel)
+        self.stats_window = window
+        self.label_stats = ttk.Label(window, justify="left", font=("Courier", 10))
+        self.label_stats.grid(row=0, column=0, columnspan=3, padx=20, pady=10, sticky="w")
+        ttk.Button(window, width=16, text="Exportieren", command=self.exportStats).grid(row=1, column=0, padx=10, pady=10)
+        ttk.Button(window, width=16, text="Profilieren", command=self.profileCalculations).grid(row=1, column=1, padx=10, pady=10)
+        ttk.Button(window, width=16, text="Zurücksetzen", command=self.resetStats).grid(row=1, column=2, padx=10, pady=10)
+        self.updateStatsPanel()
+
+    def closeStatsPanel(self):
+        self.stats_window.destroy()
+        self.stats_window = None
+
+    # Shows mean and median time of each phase and the last calculation
+    def updateStatsPanel(self):
+        if self.stats_window is None: return
+        summary = self.solver_stats.summary()
+        lines = ["Berechnungen: " + str(summary["count"])]
+        if summary["count"]:
+            lines.append("{:<20}{:>12}{:>12}{:>12}".format("Phase [ms]", "Mittel", "Median", "Max"))
+            for name in PHASES + ["total"]:
+                label = PHASE_LABELS.get(name, "Gesamt")
+                lines.append("{:<20}{:>12.3f}{:>12.3f}{:>12.3f}".format(label, summary[name]["mean"], summary[name]["median"], summary[name]["max"]))
+            lines.append("Erfolgsquote: " + str(round(summary["success_rate"]*100, 1)) + " %")
+            if summary["iterations"] is not None:
+                lines.append("Iterationen (Mittel): " + str(round(summary["iterations"], 1)))
+            last = self.solver_stats.records[-1]
+            lines.append("Letzte: " + str(last["solver"]) + ", " + str(last["search"]) + ", " + str(last["iterations"]) + " Iterationen, " + str(last["searches"]) + " Suchen, Residuum " + str(last["residual"]))
+            if last.get("singular_target"): lines.append("Letztes Ziel nahe einer singulären Stellung")
+            if last.get("collisions"): lines.append("Kollidierende Lösungen verworfen: " + str(last["collisions"]))
+        store = self.solution_store.stats()
+        lines.append("Lösungsspeicher: " + str(store["hits"]) + " Treffer, " + str(store["seeds"]) + " Startwerte, " + str(store["misses"]) + " Fehlversuche")
+        if self.solver_stats.isProfiling():
+            lines.append("Profil läuft ...")
+        elif self.solver_stats.profile_path:
+            lines.append("Profil: " + self.solver_stats.profile_path)
+        self.label_stats.config(text="\n".join(lines))
+
+    # Exports the stored calculations as JSON lines
+    def exportStats(self):
+        file_path = fd.asksaveasfilename(defaultextension=".jsonl", filetypes=[("JSON Lines", "*.jsonl")])
+        if not file_path: return
+        count = self.solver_stats.exportJSONLines(file_path)
+        showinfo(message=str(count) + " Berechnungen exportiert.")
+
+    # Profiles the next calculations
+    def profileCalculations(self):
+        self.solver_stats.profileNext(self.profile_count)
+        showinfo(message="Die nächsten " + str(self.profile_count) + " Berechnungen werden profiliert. Das Profil wird im Ordner " + CACHE_DIR + " gespeichert.")
+        self.updateStatsPanel()
+
+    def resetStats(self):
+        self.solver_stats.clear()
+        self.updateStatsPanel()
+
+    # Shows calculation errors
+    def calculationError(self, e):
+        showerror(message="Bei der Berechnung ist ein Fehler aufgetreten: " + str(e))
+
+    # Cancels running calculations and plots
+    def cancelCalculation(self):
+        self.calculation_worker.cancel()
+        self.plot_worker.cancel()
+        self.tolerance_worker.cancel()
+
+    # Shows or hides the busy indicator
+    def setBusy(self, busy):
+        if busy or self.calculation_worker.isBusy() or self.plot_worker.isBusy() or self.tolerance_worker.isBusy():
+            self.progress_bar.grid()
+            self.progress_bar.start(15)
+            self.button_cancel.configure(state="normal")
         else:
-            for i in range(6):
-                if self.entry_dh_params[i][6].get() == "Deaktiviert":
-                    self.result[i] = "-"
-                else:
-                    self.result[i] = str(round(result.q[i], 4))
-            # Output result
-            self.createResultString(self.format_target.get())
+            self.progress_bar.stop()
+            self.progress_bar.grid_remove()
+            self.button_cancel.configure(state="disabled")
+            self.label_status.config(text="")
+
+    # Shows a progress message
+    def setProgress(self, message):
+        self.label_status.config(text=message)
 
     # Start UI
     def run(self):
+        # Import the robotics toolbox in the background while the window is shown
+        threading.Thread(target=loadToolbox, daemon=True).start()
         self.master.mainloop()
\ No newline at end of file
@@ -0,0 +1,193 @@
+###############################################
+# Solution store for inverse kinematics
+# Reuses solutions of repeated targets and seeds the solver for nearby targets
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import collections
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+
+# Default number of solutions per robot model in memory and on disk
+MEMORY_SIZE = 4096
+DISK_SIZE = 100000
+# Default tolerances for nearby targets (m, rad)
+POSITION_TOLERANCE = 0.05
+ORIENTATION_TOLERANCE = 0.2
+
+# Position and rotation entries of a flattened pose (upper 3x4 part of the transformation)
+_POSITION = [3, 7, 11]
+_ROTATION = [0, 1, 2, 4, 5, 6, 8, 9, 10]
+
+# Creates the key of a solve (target pose, start position, solver and joint limits)
+# INPUTS: Target <4x4 array>, Start position <list>, Solver <string>, Joint limits <bool>
+# OUTPUTS: Key <string>
+def solveKey(target, q_start, solver, joint_limits):
+    values = np.round(np.concatenate((np.asarray(target, dtype=float)[:3, :4].ravel(), np.asarray(q_start, dtype=float))), 9) + 0.0
+    text = ",".join("%.9f" % value for value in values) + "|" + solver + "|" + str(bool(joint_limits))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+# Solutions of one robot model in memory (least recently used first)
+class _ModelSolutions:
+    def __init__(self):
+        self.entries = collections.OrderedDict()
+        # Stacked poses for the nearest neighbour search (rebuilt after changes)
+        self.poses = None
+        self.q = None
+
+    def stack(self):
+        if self.poses is None:
+            values = list(self.entries.values())
+            self.poses = np.array([pose for pose, _, _ in values]).reshape(-1, 12)
+            self.q = [q for _, q, _ in values]
+        return self.poses, self.q
+
+# Persistent store of IK solutions per robot model (memory LRU, sqlite on disk)
+class SolutionStore:
+    def __init__(self, file_path=None, memory_size=MEMORY_SIZE, disk_size=DISK_SIZE, position_tolerance=POSITION_TOLERANCE, orientation_tolerance=ORIENTATION_TOLERANCE):
+        # sqlite file (None: memory only)
+        self.file_path = file_path
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self.position_tolerance = position_tolerance
+        self.orientation_tolerance = orientation_tolerance
+        # Exact hits, seeds from nearby targets and targets without stored solution
+        self.hits = 0
+        self.seeds = 0
+        self.misses = 0
+        self._models = {}
+        self._lock = threading.Lock()
+        self._connection = None
+
+    # Opens the database (first access)
+    def _database(self):
+        if self._connection is None and self.file_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+                self._connection = sqlite3.connect(self.file_path, check_same_thread=False)
+                self._connection.execute("CREATE TABLE IF NOT EXISTS solutions (model TEXT, key TEXT, pose BLOB, q BLOB, residual REAL, created REAL, PRIMARY KEY (model, key))")
+            except sqlite3.Error as e:
+                # Continue without disk store
+                print(e)
+                self.file_path = None
+                self._connection = None
+        return self._connection
+
+    # Returns the solutions of a robot model (loads the most recent solutions from disk)
+    def _model(self, model):
+        solutions = self._models.get(model)
+        if solutions is not None: return solutions
+        solutions = _ModelSolutions()
+        database = self._database()
+        if database is not None:
+            try:
+                # Keep the most recent solutions of the model on disk
+                with database:
+                    database.execute("DELETE FROM solutions WHERE model=? AND key NOT IN (SELECT key FROM solutions WHERE model=? ORDER BY created DESC LIMIT ?)", (model, model, self.disk_size))
+                rows = database.execute("SELECT key, pose, q, residual FROM solutions WHERE model=? ORDER BY created DESC LIMIT ?", (model, self.memory_size)).fetchall()
+            except sqlite3.Error as e:
+                print(e)
+                rows = []
+            for key, pose, q, residual in reversed(rows):
+                solutions.entries[key] = (np.frombuffer(pose, dtype=float), np.frombuffer(q, dtype=float), residual)
+        self._models[model] = solutions
+        return solutions
+
+    # Returns the stored solution of an identical solve (misses are counted by nearest)
+    # INPUTS: Model key <string>, Target <4x4 array>, Start position <list>, Solver <string>, Joint limits <bool>
+    # OUTPUTS: Solution <IKSolution> or None
+    def lookup(self, model, target, q_start, solver, joint_limits):
+        key = solveKey(target, q_start, solver, joint_limits)
+        with self._lock:
+            solutions = self._model(model)
+            entry = solutions.entries.get(key)
+            if entry is None: return None
+            solutions.entries.move_to_end(key)
+            self.hits += 1
+        from roboticstoolbox.robot.IK import IKSolution
+        return IKSolution(q=entry[1].copy(), success=True, iterations=0, searches=0, residual=entry[2], reason="Cache")
+
+    # Returns the stored solution of the closest target within the tolerances
+    # INPUTS: Model key <string>, Target <4x4 array>
+    # OUTPUTS: Start position <n array> or None
+    def nearest(self, model, target):
+        target = np.asarray(target, dtype=float)
+        with self._lock:
+            solutions = self._model(model)
+            if not solutions.entries:
+                self.misses += 1
+                return None
+            poses, q = solutions.stack()
+        # Position distance and approximated rotation angle (Frobenius norm of the rotation difference)
+        pose = target[:3, :4].ravel()
+        position = np.linalg.norm(poses[:, _POSITION] - pose[_POSITION], axis=1)
+        orientation = np.linalg.norm(poses[:, _ROTATION] - pose[_ROTATION], axis=1) / np.sqrt(2)
+        inside = (position <= self.position_tolerance) & (orientation <= self.orientation_tolerance)
+        with self._lock:
+            if not inside.any():
+                self.misses += 1
+                return None
+            self.seeds += 1
+        distance = np.where(inside, position / self.position_tolerance + orientation / self.orientation_tolerance, np.inf)
+        return q[int(np.argmin(distance))].copy()
+
+    # Stores a solution
+    # INPUTS: Model key <string>, Target <4x4 array>, Start position <list>, Solver <string>, Joint limits <bool>, Solution <n array>, Residual <float>
+    def add(self, model, target, q_start, solver, joint_limits, q, residual=0.0):
+        key = solveKey(target, q_start, solver, joint_limits)
+        pose = np.array(np.asarray(target, dtype=float)[:3, :4].ravel())
+        q = np.array(q, dtype=float)
+        with self._lock:
+            solutions = self._model(model)
+            solutions.entries[key] = (pose, q, float(residual))
+            solutions.entries.move_to_end(key)
+            while len(solutions.entries) > self.memory_size:
+                solutions.entries.popitem(last=False)
+            solutions.poses = None
+            database = self._database()
+            if database is None: return
+            try:
+                with database:
+                    database.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?)", (model, key, pose.tobytes(), q.tobytes(), float(residual), time.time()))
+            except sqlite3.Error as e:
+                print(e)
+
+    # Hit and miss counts and rates
+    # OUTPUTS: Stats <dict>
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.seeds + self.misses
+            return {
+                "hits": self.hits,
+                "seeds": self.seeds,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "seed_rate": self.seeds / total if total else 0.0,
+                "solutions": sum(len(solutions.entries) for solutions in self._models.values()),
+            }
+
+    # Removes all solutions of a model (or all models) from memory and disk
+    def clear(self, model=None):
+        with self._lock:
+            if model is None:
+                self._models.clear()
+            else:
+                self._models.pop(model, None)
+            database = self._database()
+            if database is None: return
+            with database:
+                if model is None:
+                    database.execute("DELETE FROM solutions")
+                else:
+                    database.execute("DELETE FROM solutions WHERE model=?", (model,))
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,172 @@
+###############################################
+# Solver instrumentation
+# Timing of calculation phases, ring buffer of solves and optional profiling
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+import numpy as np
+
+# Calculation phases in display order
+PHASES = ["parsing", "model", "transform", "workspace", "solver", "collision", "ui"]
+PHASE_LABELS = {"parsing": "Eingaben", "model": "Modell", "transform": "Zieltransformation", "workspace": "Arbeitsraum", "solver": "Solver", "collision": "Kollision", "ui": "Anzeige"}
+# Default number of solves kept in the ring buffer
+BUFFER_SIZE = 1000
+
+# Wall time of the phases of one calculation
+class SolveTimer:
+    def __init__(self):
+        self.phases = {}
+
+    # Measures a phase (times of repeated phases are added)
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+# Ring buffer of solve records with summary, JSON lines export and profiling of the next solves
+class SolverStats:
+    def __init__(self, size=BUFFER_SIZE, profile_dir=None):
+        self.records = collections.deque(maxlen=size)
+        # Folder for profiles (None: current folder)
+        self.profile_dir = profile_dir
+        self.profile_path = None
+        self._profile_remaining = 0
+        self._profiler = None
+        self._lock = threading.Lock()
+
+    # Adds a solve
+    # INPUTS: Timer <SolveTimer>, Solutions <list of IKSolution>, Additional fields (solver, search, ...) <dict>
+    # OUTPUTS: Record <dict>
+    def record(self, timer, solutions=None, **fields):
+        best = solutions[0] if solutions else None
+        record = {
+            "time": time.time(),
+            "phases": {name: round(value*1000, 4) for name, value in timer.phases.items()},
+            "total": round(sum(timer.phases.values())*1000, 4),
+            "success": bool(best is not None and best.success),
+            "iterations": int(best.iterations) if best is not None else None,
+            "searches": int(best.searches) if best is not None else None,
+            "residual": float(best.residual) if best is not None else None,
+            "solutions": len(solutions) if solutions else 0,
+        }
+        record.update(fields)
+        with self._lock:
+            self.records.append(record)
+        return record
+
+    # Mean and median time of each phase, success rate and mean iterations
+    # OUTPUTS: Summary <dict>
+    def summary(self):
+        with self._lock:
+            records = list(self.records)
+        summary = {"count": len(records)}
+        if not records: return summary
+        for name in PHASES + ["total"]:
+            values = [record["phases"].get(name, 0.0) if name != "total" else record["total"] for record in records]
+            summary[name] = {"mean": float(np.mean(values)), "median": float(np.median(values)), "max": float(np.max(values))}
+        summary["success_rate"] = sum(record["success"] for record in records) / len(records)
+        iterations = [record["iterations"] for record in records if record["iterations"] is not None]
+        summary["iterations"] = float(np.mean(iterations)) if iterations else None
+        return summary
+
+    # Writes all records as JSON lines
+    # INPUTS: File path <string>
+    # OUTPUTS: Number of records <int>
+    def exportJSONLines(self, file_path):
+        with self._lock:
+            records = list(self.records)
+        with open(file_path, "w", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return len(records)
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+
+    # Profiles the next solves (pyinstrument if installed, else cProfile)
+    # INPUTS: Number of solves <int>
+    def profileNext(self, count):
+        with self._lock:
+            self._profile_remaining = count
+            self._profiler = None
+            self.profile_path = None
+
+    def isProfiling(self):
+        return self._profile_remaining > 0
+
+    # Runs a solve, profiled if requested
+    # INPUTS: Function <function>
+    # OUTPUTS: Result of the function
+    def profile(self, function):
+        with self._lock:
+            profiler = None
+            if self._profile_remaining > 0:
+                if self._profiler is None: self._profiler = _createProfiler()
+                profiler = self._profiler
+        if profiler is None: return function()
+        try:
+            return profiler.run(function)
+        finally:
+            with self._lock:
+                self._profile_remaining -= 1
+                if self._profile_remaining <= 0 and self._profiler is profiler:
+                    self._profiler = None
+                    # Shown in the stats panel
+                    self.profile_path = profiler.save(self.profile_dir)
+
+# cProfile based profiler (stats are accumulated over several solves)
+class _CProfiler:
+    def __init__(self):
+        import cProfile
+        self.profile = cProfile.Profile()
+
+    def run(self, function):
+        return self.profile.runcall(function)
+
+    # Saves the stats (open with pstats or snakeviz)
+    def save(self, folder):
+        file_path = _profilePath(folder, ".prof")
+        self.profile.dump_stats(file_path)
+        return file_path
+
+# pyinstrument based profiler (one HTML report over several solves)
+class _Pyinstrument:
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def run(self, function):
+        self.profiler.start()
+        try:
+            return function()
+        finally:
+            self.profiler.stop()
+
+    def save(self, folder):
+        file_path = _profilePath(folder, ".html")
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(self.profiler.output_html())
+        return file_path
+
+def _createProfiler():
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        return _CProfiler()
+    # pyinstrument only samples the thread that started it (solves run in a worker thread)
+    return _Pyinstrument(Profiler(async_mode="disabled"))
+
+def _profilePath(folder, extension):
+    folder = folder or os.getcwd()
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, time.strftime("profile_%Y%m%d_%H%M%S") + extension)
@@ -0,0 +1,151 @@
+###############################################
+# Tolerance analysis
+# Monte Carlo samples of the DH parameters a, d and alpha within their tolerances, pose errors at given joint positions
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import csv
+import numpy as np
+from src.vectorIK import poseErrors
+
+# Default tolerances (±, uniformly distributed) of a, d (m) and alpha (rad)
+TOLERANCE_A = 1e-4
+TOLERANCE_D = 1e-4
+TOLERANCE_ALPHA = 1e-4
+# Largest number of samples per target and samples per batch (the results are reported after every batch)
+MAX_SAMPLES = 50000
+BATCH_SIZE = 2000
+# Stop criterion: confidence intervals of mean and 95 % quantile narrower than ±PRECISION (relative)
+PRECISION = 0.02
+CONFIDENCE = 1.96
+QUANTILE = 0.95
+# Smallest number of samples before the stop criterion is checked
+MIN_SAMPLES = 2000
+
+# Error distribution at one joint position
+class ToleranceResult:
+    def __init__(self, q, nominal):
+        self.q = q
+        # Pose of the nominal DH table <4x4 array>
+        self.nominal = nominal
+        self._position = []
+        self._orientation = []
+        self._sorted = None
+        self.converged = False
+
+    # Adds the errors of a batch of samples
+    def add(self, position, orientation):
+        self._position.append(position)
+        self._orientation.append(orientation)
+        self._sorted = None
+
+    @property
+    def count(self): return sum(len(x) for x in self._position)
+
+    # Sorted position (m) and orientation (rad) errors of all samples
+    def errors(self):
+        if self._sorted is None:
+            self._sorted = (np.sort(np.concatenate(self._position)), np.sort(np.concatenate(self._orientation)))
+        return self._sorted
+
+    # Error distribution
+    # OUTPUTS: Statistics of position and orientation error (mean, std, p50, p95, p99, max) and number of samples <dict>
+    def statistics(self):
+        result = {"samples": self.count, "converged": self.converged}
+        for name, errors in zip(("position", "orientation"), self.errors()):
+            result[name] = {
+                "mean": float(np.mean(errors)),
+                "std": float(np.std(errors)),
+                "p50": float(np.quantile(errors, 0.5)),
+                "p95": float(np.quantile(errors, 0.95)),
+                "p99": float(np.quantile(errors, 0.99)),
+                "max": float(errors[-1]),
+            }
+        return result
+
+    # True if the confidence intervals of the mean and of the quantile are narrower than ±precision (relative)
+    def isConverged(self, precision=PRECISION, z=CONFIDENCE, quantile=QUANTILE):
+        count = self.count
+        if count < MIN_SAMPLES: return False
+        # Ranks of the distribution-free confidence interval of the quantile
+        spread = z * np.sqrt(count * quantile * (1 - quantile))
+        low, high = int(np.floor(count * quantile - spread)), int(np.ceil(count * quantile + spread))
+        if low < 0 or high >= count: return False
+        for errors in self.errors():
+            limit = precision * np.mean(errors) + 1e-15
+            if z * np.std(errors) / np.sqrt(count) > limit: return False
+            if (errors[high] - errors[low]) / 2 > precision * errors[int(count * quantile)] + 1e-15: return False
+        return True
+
+# Random deviations of a, d and alpha (uniform within ±tolerance)
+# INPUTS: Random generator, Number of samples <int>, Number of joints <int>, Tolerances of a, d, alpha <floats or n arrays>
+# OUTPUTS: Deviations of d, a, alpha <Sxn arrays>
+def toleranceSamples(rng, count, n, tolerances):
+    tolerance_a, tolerance_d, tolerance_alpha = (np.broadcast_to(np.abs(np.asarray(x, dtype=float)), (n,)) for x in tolerances)
+    da = rng.uniform(-tolerance_a, tolerance_a, (count, n))
+    dd = rng.uniform(-tolerance_d, tolerance_d, (count, n))
+    dalpha = rng.uniform(-tolerance_alpha, tolerance_alpha, (count, n))
+    return dd, da, dalpha
+
+# Monte Carlo tolerance analysis: every batch evaluates the FK of all unfinished joint positions for all samples
+# in one pass (DHChain.fkineDeviations), the results are yielded after each batch and targets stop once converged
+# INPUTS: DH chain <DHChain>, Joint positions <Kxn array>, Tolerances of a, d, alpha <floats or n arrays>,
+#         Largest number of samples <int>, Samples per batch <int>, Relative precision <float>, Random seed, Cancel check <function>
+# OUTPUTS: Generator of results per joint position <list of ToleranceResult>
+def analyseTolerances(chain, Q, tolerances=(TOLERANCE_A, TOLERANCE_D, TOLERANCE_ALPHA), max_samples=MAX_SAMPLES, batch_size=BATCH_SIZE,
+                      precision=PRECISION, seed=None, cancelled=None):
+    Q = np.asarray(Q, dtype=float).reshape(-1, chain.n)
+    rng = np.random.default_rng(seed)
+    nominal = chain.fkine(Q).copy()
+    results = [ToleranceResult(q, T) for q, T in zip(Q, nominal)]
+    active = np.arange(len(Q))
+    samples = 0
+    while len(active) and samples < max_samples:
+        if cancelled is not None and cancelled(): return
+        count = min(batch_size, max_samples - samples)
+        # Same samples for all joint positions (one robot population)
+        dd, da, dalpha = (np.tile(x, (len(active), 1)) for x in toleranceSamples(rng, count, chain.n, tolerances))
+        T = chain.fkineDeviations(np.repeat(Q[active], count, axis=0), dd=dd, da=da, dalpha=dalpha)
+        e = poseErrors(T, np.repeat(nominal[active], count, axis=0))
+        position = np.linalg.norm(e[:, :3], axis=1).reshape(len(active), count)
+        orientation = np.linalg.norm(e[:, 3:], axis=1).reshape(len(active), count)
+        samples += count
+        finished = np.zeros(len(active), dtype=bool)
+        for j, i in enumerate(active):
+            results[i].add(position[j], orientation[j])
+            finished[j] = results[i].converged = results[i].isConverged(precision)
+        active = active[~finished]
+        yield results
+
+# Reads joint positions from a csv file, either results of the batch IK (columns q1 ... qn, unsolved rows are skipped)
+# or plain rows of joint values
+# INPUTS: File path <string>, Number of joints <int>
+# OUTPUTS: Row indices <K int array>, Joint positions <Kxn array>
+def readJointPositions(file_path, n):
+    with open(file_path, mode='r', newline='') as file:
+        rows = [line for line in csv.reader(file) if line]
+    header = rows[0]
+    if "q1" in header:
+        columns = [header.index("q" + str(i+1)) for i in range(n)]
+        success = header.index("Erfolg") if "Erfolg" in header else None
+        index = header.index("Index") if "Index" in header else None
+        rows = [row for row in rows[1:] if success is None or int(row[success])]
+        indices = [int(row[index]) if index is not None else i for i, row in enumerate(rows)]
+        return np.array(indices, dtype=int), np.array([[float(row[c]) for c in columns] for row in rows]).reshape(-1, n)
+    try:
+        [float(value) for value in header[:n]]
+    except ValueError:
+        rows = rows[1:]
+    return np.arange(len(rows)), np.array([[float(value) for value in row[:n]] for row in rows]).reshape(-1, n)
+
+# Writes the error distribution per joint position
+# INPUTS: File path <string>, Row indices <K int array>, Results <list of ToleranceResult>
+def writeToleranceResults(file_path, indices, results):
+    keys = ["mean", "std", "p50", "p95", "p99", "max"]
+    with open(file_path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Index", "Stichproben", "Konvergiert"] + ["Position_" + key for key in keys] + ["Orientierung_" + key for key in keys])
+        for index, result in zip(indices, results):
+            statistics = result.statistics()
+            writer.writerow([int(index), statistics["samples"], int(statistics["converged"])] + [repr(statistics["position"][key]) for key in keys] + [repr(statistics["orientation"][key]) for key in keys])
@@ -0,0 +1,75 @@
+###############################################
+# Joint space trajectories
+# Quintic joint trajectories with adaptive step count and vectorized FK
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import math
+import numpy as np
+
+# Default largest joint change between two samples (rad or m)
+RESOLUTION = 0.02
+# Default joint velocity limit (rad/s or m/s) and sample time (s)
+VELOCITY = 1.0
+SAMPLE_TIME = 0.02
+# Step count bounds
+MIN_STEPS = 2
+MAX_STEPS = 5000
+# Peak velocity of a quintic polynomial relative to the mean velocity
+_PEAK_VELOCITY = 1.875
+
+# Sampled joint trajectory with velocities, accelerations and end effector poses
+class Trajectory:
+    def __init__(self, t, q, qd, qdd, poses=None):
+        # Time <N array>, joint positions, velocities, accelerations <Nxn arrays>
+        self.t = t
+        self.q = q
+        self.qd = qd
+        self.qdd = qdd
+        # End effector poses <Nx4x4 array> (None if no chain was given)
+        self.poses = poses
+
+    def __len__(self): return len(self.q)
+
+    @property
+    def duration(self): return float(self.t[-1])
+
+# Duration of a move that keeps every joint below its velocity limit
+# INPUTS: Joint distance <n array>, Velocity limits <float or n array>
+# OUTPUTS: Duration <float>
+def moveDuration(distance, velocity_limits=VELOCITY):
+    return float(np.max(_PEAK_VELOCITY * np.abs(distance) / np.asarray(velocity_limits, dtype=float), initial=0.0))
+
+# Number of samples for a move: no joint moves more than the resolution between two samples
+# and the sample time is not exceeded when moving at the velocity limits
+# INPUTS: Start and end position <n arrays>, Resolution <float>, Velocity limits <float or n array>, Sample time <float> (None: only resolution)
+# OUTPUTS: Number of samples <int>
+def trajectorySteps(q_start, q_end, resolution=RESOLUTION, velocity_limits=VELOCITY, sample_time=SAMPLE_TIME):
+    distance = np.abs(np.asarray(q_end, dtype=float) - np.asarray(q_start, dtype=float))
+    steps = math.ceil(float(np.max(distance, initial=0.0)) / resolution) + 1
+    if sample_time:
+        steps = max(steps, math.ceil(moveDuration(distance, velocity_limits) / sample_time) + 1)
+    return int(min(max(steps, MIN_STEPS), MAX_STEPS))
+
+# Quintic joint trajectory (zero velocity and acceleration at start and end) like rtb.jtraj,
+# the step count adapts to the joint distance and the FK of all samples is computed in one pass
+# INPUTS: Start and end position <n arrays>, DH chain for the poses <DHChain> (optional), Resolution <float>,
+#         Velocity limits <float or n array>, Sample time <float>, Fixed number of samples <int> (optional)
+# OUTPUTS: Trajectory <Trajectory>
+def jointTrajectory(q_start, q_end, chain=None, resolution=RESOLUTION, velocity_limits=VELOCITY, sample_time=SAMPLE_TIME, steps=None):
+    q_start = np.asarray(q_start, dtype=float)
+    q_end = np.asarray(q_end, dtype=float)
+    if steps is None: steps = trajectorySteps(q_start, q_end, resolution, velocity_limits, sample_time)
+    distance = q_end - q_start
+    # Duration from the velocity limits (1 s for a move without distance)
+    duration = moveDuration(distance, velocity_limits) or 1.0
+    tau = np.linspace(0.0, 1.0, steps)[:, None]
+    s = tau**3 * (10 - 15*tau + 6*tau**2)
+    sd = 30 * tau**2 * (1 - tau)**2
+    sdd = 60 * tau * (1 - tau) * (1 - 2*tau)
+    q = q_start + s * distance
+    qd = sd * distance / duration
+    qdd = sdd * distance / duration**2
+    poses = chain.fkine(q).copy() if chain is not None else None
+    return Trajectory(tau[:, 0] * duration, q, qd, qdd, poses)
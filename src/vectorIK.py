@@ -0,0 +1,114 @@
+###############################################
+# Vectorized Levenberg-Marquardt IK
+# Solves many targets in lock-step with stacked NumPy arrays (FK, Jacobians and damped steps)
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import numpy as np
+
+# Name of the solver in the UI
+VECTOR_SOLVER = "IK_LM_Vektor"
+
+# Default solver settings (same as ikine_LM)
+TOLERANCE = 1e-6
+ITERATIONS = 30
+SEARCHES = 100
+# Damping factor of Chan's method (damping = k * E)
+DAMPING = 1.0
+
+# Angle-axis pose errors [dx, dy, dz, rx, ry, rz] of many poses (same as rtb.angle_axis)
+# INPUTS: Poses <Kx4x4 array>, Targets <Kx4x4 array>
+# OUTPUTS: Errors <Kx6 array>
+def poseErrors(T, targets):
+    e = np.empty((len(T), 6))
+    e[:, :3] = targets[:, :3, 3] - T[:, :3, 3]
+    R = targets[:, :3, :3] @ T[:, :3, :3].transpose(0, 2, 1)
+    li = np.stack([R[:, 2, 1] - R[:, 1, 2], R[:, 0, 2] - R[:, 2, 0], R[:, 1, 0] - R[:, 0, 1]], axis=1)
+    ln = np.sqrt(np.einsum("ij,ij->i", li, li))
+    trace = R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2]
+    small = ln < 1e-6
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Small rotations: angle / |li| -> 1/2 (keeps errors below 1e-6 rad, e.g. for calibration)
+        e[:, 3:] = np.where(small, 0.5, np.arctan2(ln, trace - 1) / ln)[:, None] * li
+    flipped = small & (trace <= 0)
+    if np.any(flipped):
+        # Rotation by pi
+        diagonal = np.diagonal(R[flipped], axis1=1, axis2=2)
+        e[flipped, 3:] = np.pi / 2 * (diagonal + 1)
+    return e
+
+# Chooses equivalent revolute joint angles within the limits (like the toolbox solvers)
+def _normalise(q, lower, upper, revolute):
+    outside = revolute & ((q < lower) | (q > upper))
+    if not np.any(outside): return q
+    angle = (q + np.pi) % (2 * np.pi) - np.pi
+    angle = np.where(angle < lower, angle + 2 * np.pi * np.ceil((lower - angle) / (2 * np.pi)), angle)
+    angle = np.where(angle > upper, angle - 2 * np.pi * np.ceil((angle - upper) / (2 * np.pi)), angle)
+    return np.where(outside, angle, q)
+
+# Levenberg-Marquardt (Chan's damping) for many targets at once, every iteration evaluates
+# the FK and Jacobians of all unsolved targets in one pass; solved targets are removed from the batch,
+# targets that need too many iterations or violate the joint limits restart from a random position
+# INPUTS: DH chain <DHChain>, Targets <Kx4x4 array>, Start position <n array or Kxn array>, Limits active <bool>,
+#         Iterations per search <int>, Number of searches <int>, Tolerance <float>, Damping factor <float>, Random seed
+# OUTPUTS: Joint positions <Kxn array>, Success <K bool array>, Residuals <K array>, Iterations <K int array>, Searches <K int array>
+def solveLockstep(chain, targets, q0=None, joint_limits=True, ilimit=ITERATIONS, slimit=SEARCHES, tol=TOLERANCE, k=DAMPING, seed=None):
+    targets = np.asarray(targets, dtype=float).reshape(-1, 4, 4)
+    count, n = len(targets), chain.n
+    lower, upper = chain.qlim[0], chain.qlim[1]
+    rng = np.random.default_rng(seed)
+    q = np.zeros((count, n)) if q0 is None else np.array(np.broadcast_to(np.asarray(q0, dtype=float), (count, n)))
+    success = np.zeros(count, dtype=bool)
+    residual = np.full(count, np.inf)
+    iterations = np.zeros(count, dtype=int)
+    searches = np.ones(count, dtype=int)
+    # Iterations of the current search
+    steps = np.zeros(count, dtype=int)
+    identity = np.eye(n)
+    active = np.arange(count)
+    while len(active):
+        T, J = chain.fkineJacob0(q[active])
+        e = poseErrors(T, targets[active])
+        E = 0.5 * np.einsum("ij,ij->i", e, e)
+        residual[active] = E
+        converged = E < tol
+        done = np.zeros(len(active), dtype=bool)
+        restart = ~converged & (steps[active] >= ilimit)
+        if np.any(converged):
+            rows = active[converged]
+            q[rows] = _normalise(q[rows], lower, upper, chain.revolute)
+            valid = np.all((q[rows] >= lower) & (q[rows] <= upper), axis=1) if joint_limits else np.ones(len(rows), dtype=bool)
+            success[rows[valid]] = True
+            done[np.flatnonzero(converged)[valid]] = True
+            restart[np.flatnonzero(converged)[~valid]] = True
+        if np.any(restart):
+            # New search from a random position, failed after the last search
+            last = restart & (searches[active] >= slimit)
+            done |= last
+            restart &= ~last
+            rows = active[restart]
+            q[rows] = rng.uniform(lower, upper, (len(rows), n))
+            searches[rows] += 1
+            steps[rows] = 0
+        # Damped least squares step of the other targets (restarted targets are evaluated first)
+        step = ~(converged | restart | done)
+        if np.any(step):
+            rows = active[step]
+            Js, es = J[step], e[step]
+            Jt = Js.transpose(0, 2, 1)
+            A = Jt @ Js + (k * E[step])[:, None, None] * identity
+            q[rows] += np.linalg.solve(A, (Jt @ es[:, :, None]))[:, :, 0]
+            steps[rows] += 1
+            iterations[rows] += 1
+        active = active[~done]
+    return q, success, residual, iterations, searches
+
+# Lock-step solver for one target (same interface as the toolbox solvers)
+# INPUTS: DH chain <DHChain>, Target <4x4 array>, Start position <list>, Limits active <bool>, Solver settings
+# OUTPUTS: Result <IKSolution>
+def ikineVector(chain, target, q0=None, joint_limits=True, ilimit=ITERATIONS, slimit=SEARCHES, tol=TOLERANCE, k=DAMPING, seed=None, **options):
+    from roboticstoolbox.robot.IK import IKSolution
+    q, success, residual, iterations, searches = solveLockstep(chain, target, q0, joint_limits, ilimit, slimit, tol, k, seed)
+    reason = "Success" if success[0] else "iteration and search limit reached"
+    return IKSolution(q=q[0], success=bool(success[0]), iterations=int(iterations[0]), searches=int(searches[0]), residual=float(residual[0]), reason=reason)
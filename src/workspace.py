@@ -0,0 +1,141 @@
+###############################################
+# Workspace reachability index
+# Rejects unreachable targets and finds start positions for the solver
+# Version: 0.1
+# Date: 17.10.2026
+###############################################
+
+import os
+import threading
+from math import floor
+import numpy as np
+from src.kinematics import DHChain
+from src.modelCache import dhParamsKey
+from src.presets import CACHE_DIR
+
+# Default number of sampled joint positions, voxels along the largest axis
+# and voxels added around sampled voxels (covers sparsely sampled regions at the workspace border)
+SAMPLES = 200000
+RESOLUTION = 48
+DILATION = 2
+
+# Voxel grid of sampled end effector positions and a nearest neighbour search over sampled poses
+class ReachabilityIndex:
+    def __init__(self, q, origin, voxel_size, grid, chain):
+        # Sampled joint positions <Mxn array>
+        self.q = q
+        self.origin = origin
+        self.voxel_size = float(voxel_size)
+        # Occupied voxels, dilated to cover gaps between samples
+        self.grid = grid
+        self.chain = chain
+        self._tree = None
+        self._lock = threading.Lock()
+
+    # Samples the workspace of a DH chain
+    # INPUTS: Chain <DHChain>, Number of samples <int>, Voxels along the largest axis <int>, Random seed <int>
+    # OUTPUTS: Index <ReachabilityIndex>
+    @classmethod
+    def build(cls, chain, samples=SAMPLES, resolution=RESOLUTION, seed=0, dilation=DILATION):
+        q = np.random.default_rng(seed).uniform(chain.qlim[0], chain.qlim[1], (samples, chain.n))
+        positions = chain.fkine(q)[:, :3, 3]
+        lower, upper = positions.min(axis=0), positions.max(axis=0)
+        voxel_size = max(float(np.max(upper - lower)) / resolution, 1e-6)
+        # Empty voxel border around the workspace
+        origin = lower - dilation*voxel_size
+        shape = np.floor((upper - origin) / voxel_size).astype(int) + 1 + dilation
+        grid = np.zeros(shape, dtype=bool)
+        index = np.floor((positions - origin) / voxel_size).astype(int)
+        grid[index[:, 0], index[:, 1], index[:, 2]] = True
+        for _ in range(dilation): grid = cls._dilate(grid)
+        return cls(q.astype(np.float32), origin, voxel_size, grid, chain)
+
+    # Marks all neighbours of occupied voxels (dilation by one voxel)
+    @staticmethod
+    def _dilate(grid):
+        padded = np.pad(grid, 1)
+        dilated = np.zeros_like(grid)
+        sx, sy, sz = grid.shape
+        for dx in range(3):
+            for dy in range(3):
+                for dz in range(3):
+                    dilated |= padded[dx:dx+sx, dy:dy+sy, dz:dz+sz]
+        return dilated
+
+    # Returns False if a position is certainly outside of the sampled workspace
+    # INPUTS: Position [X, Y, Z] <list>
+    # OUTPUTS: Reachable <bool>
+    def isReachable(self, position):
+        size = self.voxel_size
+        i = floor((position[0] - self.origin[0]) / size)
+        j = floor((position[1] - self.origin[1]) / size)
+        k = floor((position[2] - self.origin[2]) / size)
+        shape = self.grid.shape
+        if i < 0 or j < 0 or k < 0 or i >= shape[0] or j >= shape[1] or k >= shape[2]: return False
+        return bool(self.grid[i, j, k])
+
+    # Pose features for the nearest neighbour search (position and scaled x/z axes)
+    def _features(self, T):
+        weight = 0.25 * self.voxel_size * max(self.grid.shape)
+        return np.hstack((T[:, :3, 3], weight * T[:, :3, 0], weight * T[:, :3, 2]))
+
+    # Returns the sampled joint position with the pose closest to a target
+    # INPUTS: Target <4x4 array>
+    # OUTPUTS: Start position <n array>
+    def nearestSeed(self, target):
+        with self._lock:
+            if self._tree is None:
+                from scipy.spatial import cKDTree
+                self._tree = cKDTree(self._features(self.chain.fkine(self.q).copy()))
+        _, i = self._tree.query(self._features(np.asarray(target, dtype=float).reshape(1, 4, 4))[0])
+        return self.q[i].astype(float)
+
+    # Horizontal slice of the workspace at height z
+    # OUTPUTS: Occupied voxels <2D array>, extent [x_min, x_max, y_min, y_max]
+    def slice(self, z):
+        k = int(np.clip(floor((z - self.origin[2]) / self.voxel_size), 0, self.grid.shape[2]-1))
+        extent = [self.origin[0], self.origin[0] + self.grid.shape[0]*self.voxel_size, self.origin[1], self.origin[1] + self.grid.shape[1]*self.voxel_size]
+        return self.grid[:, :, k], extent
+
+    # Saves the index to a .npz file
+    def save(self, file_path):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as file:
+            np.savez_compressed(file, q=self.q, origin=self.origin, voxel_size=self.voxel_size, grid=self.grid)
+
+    # Loads an index from a .npz file
+    @classmethod
+    def load(cls, file_path, chain):
+        with np.load(file_path) as data:
+            return cls(data["q"], data["origin"], float(data["voxel_size"]), data["grid"], chain)
+
+# Indexes in memory by DH table key
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+# Returns the reachability index of a robot (from memory, disk or newly built)
+# INPUTS: DH params <list of tuples>, Cache folder <string> (None: memory only)
+# OUTPUTS: Index <ReachabilityIndex>
+def getReachabilityIndex(dh_params, cache_dir=CACHE_DIR):
+    key = dhParamsKey(dh_params)
+    with _indexes_lock:
+        if key in _indexes: return _indexes[key]
+    chain = DHChain.fromDHParams(dh_params)
+    file_path = os.path.join(cache_dir, "workspace_" + key + ".npz") if cache_dir else None
+    index = None
+    if file_path and os.path.isfile(file_path):
+        try:
+            index = ReachabilityIndex.load(file_path, chain)
+        except Exception:
+            # Broken cache file, build again
+            index = None
+    if index is None:
+        index = ReachabilityIndex.build(chain)
+        if file_path:
+            try:
+                index.save(file_path)
+            except OSError:
+                pass
+    with _indexes_lock:
+        _indexes[key] = index
+    return index